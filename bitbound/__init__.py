@@ -15,14 +15,30 @@ Example:
 __version__ = "1.0.0"
 __author__ = "BitBound Team"
 
-from .hardware import Hardware
-from .device import Device
-from .event import Event, EventLoop
-from .expression import Expression
-from .units import Unit, parse_value
-from .config import Config
-from .power import PowerManager
-from .ota import OTAManager
+# Public names are imported on first access so that lightweight entry
+# points (e.g. the CLI) don't pull in the full hardware graph.
+_LAZY_EXPORTS = {
+    "Hardware": "hardware",
+    "Device": "device",
+    "Event": "event",
+    "EventLoop": "event",
+    "Expression": "expression",
+    "Unit": "units",
+    "parse_value": "units",
+    "Config": "config",
+    "PowerManager": "power",
+    "OTAManager": "ota",
+}
+
+
+def __getattr__(name):
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = __import__(f"{__name__}.{submodule}", None, None, [name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "Hardware",
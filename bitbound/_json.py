@@ -0,0 +1,50 @@
+"""
+JSON backend for BitBound.
+
+Uses orjson or ujson when installed and falls back to the standard
+library json module. The exact output differs between backends:
+orjson writes non-ASCII characters unescaped and serializes NaN and
+Infinity as null, ujson escapes "/" as "\\/", and the standard library
+emits NaN and Infinity literals. Do not compare serialized output
+across backends.
+"""
+
+from typing import Any, Optional
+
+try:
+    import orjson as _backend
+
+    _OPTIONS = _backend.OPT_NON_STR_KEYS
+
+    def dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return _backend.dumps(obj, option=_OPTIONS)
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        """Serialize to a JSON string (indent=None for compact output)."""
+        options = _OPTIONS | _backend.OPT_INDENT_2 if indent else _OPTIONS
+        return _backend.dumps(obj, option=options).decode()
+
+except ImportError:
+    try:
+        import ujson as _backend
+
+        def dumps(obj: Any, indent: Optional[int] = None) -> str:
+            """Serialize to a JSON string (indent=None for compact output)."""
+            return _backend.dumps(obj, indent=indent) if indent else _backend.dumps(obj)
+
+    except ImportError:
+        import json as _backend
+
+        def dumps(obj: Any, indent: Optional[int] = None) -> str:
+            """Serialize to a JSON string (indent=None for compact output)."""
+            if indent:
+                return _backend.dumps(obj, indent=indent)
+            return _backend.dumps(obj, separators=(",", ":"))
+
+    def dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return dumps(obj).encode()
+
+
+loads = _backend.loads
@@ -8,8 +8,14 @@ CPython's asyncio.
 
 import time
 import threading
+from functools import lru_cache, partial
 from typing import Any, Callable, Dict, List, Optional
 
+from .expression import parse_expression
+
+# Expressions are immutable once parsed, so identical strings share one instance
+_parse_cached = lru_cache(maxsize=128)(parse_expression)
+
 
 # Try to import asyncio (works on both MicroPython uasyncio and CPython)
 try:
@@ -23,6 +29,79 @@ except ImportError:
         HAS_ASYNCIO = False
 
 
+_MISSING = object()
+
+# Consecutive synchronous reads allowed before yielding to the scheduler
+DEFAULT_YIELD_EVERY = 16
+
+
+async def _fair_yield(owner: Any) -> None:
+    """Yield to the event loop once every ``owner._yield_every`` calls."""
+    owner._sync_reads += 1
+    if owner._sync_reads >= owner._yield_every:
+        owner._sync_reads = 0
+        await asyncio.sleep(0)
+
+
+async def _as_coro(value: Any) -> Any:
+    return value
+
+
+def _ready(value: Any) -> Any:
+    """Return an awaitable that resolves to ``value`` without a scheduler trip."""
+    try:
+        future = asyncio.get_running_loop().create_future()
+    except (AttributeError, RuntimeError):
+        # uasyncio has no futures; fall back to a plain coroutine
+        return _as_coro(value)
+    future.set_result(value)
+    return future
+
+
+def _watch_changes(device: Any, names: Any) -> Any:
+    """
+    Subscribe an asyncio.Event to a device's change notifications.
+
+    Uses the device's ``on_change``/``remove_handler`` hooks; handlers
+    may fire from the polling EventLoop's thread, so the event is set
+    through the running loop.
+
+    Returns:
+        (event, handlers), or (None, ()) if the device can't notify
+    """
+    on_change = getattr(device, "on_change", None)
+    if on_change is None or not hasattr(device, "remove_handler"):
+        return None, ()
+    try:
+        notify = asyncio.get_running_loop().call_soon_threadsafe
+    except (AttributeError, RuntimeError):
+        # uasyncio can't be woken from another thread; keep polling
+        return None, ()
+
+    event = asyncio.Event()
+
+    def _changed(_event: Any = None) -> None:
+        try:
+            notify(event.set)
+        except RuntimeError:
+            # Loop already closed
+            pass
+
+    handlers = tuple(on_change(name, _changed) for name in names)
+    return event, handlers
+
+
+def _unwatch_changes(device: Any, handlers: Any) -> None:
+    for handler in handlers:
+        device.remove_handler(handler)
+
+
+async def _async_call(owner: Any, method: Callable, *args, **kwargs) -> Any:
+    """Call a synchronous device method from async code."""
+    await _fair_yield(owner)
+    return method(*args, **kwargs)
+
+
 class AsyncEventLoop:
     """
     Async event loop for BitBound.
@@ -44,12 +123,21 @@ class AsyncEventLoop:
         loop.run(monitor_temp(sensor))
     """
 
-    def __init__(self):
+    def __init__(self, yield_every: int = DEFAULT_YIELD_EVERY):
+        """
+        Initialize the async event loop.
+
+        Args:
+            yield_every: Number of consecutive synchronous reads before
+                yielding to other tasks
+        """
         if not HAS_ASYNCIO:
             raise RuntimeError("asyncio/uasyncio not available")
 
         self._tasks: List[Any] = []
         self._running = False
+        self._yield_every = max(1, yield_every)
+        self._sync_reads = 0
 
     async def read_async(self, device: Any, property_name: str) -> Any:
         """
@@ -62,13 +150,12 @@ class AsyncEventLoop:
         Returns:
             Property value
         """
-        # Yield to event loop, then read
-        await asyncio.sleep(0)
+        await _fair_yield(self)
         return getattr(device, property_name, None)
 
     async def read_all_async(self, device: Any) -> Dict[str, Any]:
         """Read all properties from a device asynchronously."""
-        await asyncio.sleep(0)
+        await _fair_yield(self)
         if hasattr(device, "read_all"):
             return device.read_all()
         return {}
@@ -82,22 +169,43 @@ class AsyncEventLoop:
         """
         Wait until a threshold condition is met.
 
+        Wakes as soon as the device reports a change of one of the
+        properties the expression uses (see wait_for_change), and
+        re-checks every ``poll_interval`` regardless.
+
         Args:
             device: Device to monitor
             expression_str: Condition string (e.g., "temperature > 25°C")
             poll_interval: Poll interval in seconds
 
         Returns:
-            Device values when condition became true
+            Values of the properties used in the expression when the
+            condition became true
         """
-        from .expression import parse_expression
-        expr = parse_expression(expression_str)
+        expr = _parse_cached(expression_str)
+        needed = expr.get_properties()
 
-        while True:
-            values = await self.read_all_async(device)
-            if expr.evaluate(values):
-                return values
-            await asyncio.sleep(poll_interval)
+        event, handlers = _watch_changes(device, needed)
+        try:
+            while True:
+                values = await self._read_needed(device, needed)
+                if expr.evaluate(values):
+                    return values
+                await self._wait_adaptive(device, poll_interval, event)
+        finally:
+            _unwatch_changes(device, handlers)
+
+    async def _read_needed(self, device: Any, needed: List[str]) -> Dict[str, Any]:
+        """Read only the given properties, falling back to read_all."""
+        values = {}
+        for name in needed:
+            value = getattr(device, name, _MISSING)
+            if value is _MISSING:
+                return await self.read_all_async(device)
+            values[name] = value
+        if not values:
+            return await self.read_all_async(device)
+        return values
 
     async def wait_for_change(
         self,
@@ -109,6 +217,10 @@ class AsyncEventLoop:
         """
         Wait until a property value changes.
 
+        Devices with an ``on_change`` hook wake the waiter directly when
+        the value changes; ``poll_interval`` then only bounds how long a
+        missed notification can go unnoticed.
+
         Args:
             device: Device to monitor
             property_name: Property to watch
@@ -119,19 +231,68 @@ class AsyncEventLoop:
             New property value
         """
         initial = getattr(device, property_name, None)
-        start = time.time()
+        deadline_ns = None
+        if timeout is not None:
+            deadline_ns = time.monotonic_ns() + int(timeout * 1_000_000_000)
 
-        while True:
-            current = getattr(device, property_name, None)
-            if current != initial:
-                return current
+        event, handlers = _watch_changes(device, (property_name,))
+        try:
+            while True:
+                current = getattr(device, property_name, None)
+                if current != initial:
+                    return current
+
+                wait = poll_interval
+                if deadline_ns is not None:
+                    remaining_ns = deadline_ns - time.monotonic_ns()
+                    if remaining_ns <= 0:
+                        raise TimeoutError(
+                            f"Property '{property_name}' did not change within {timeout}s"
+                        )
+                    wait = min(poll_interval, remaining_ns / 1_000_000_000)
+
+                await self._wait_adaptive(device, wait, event)
+        finally:
+            _unwatch_changes(device, handlers)
+
+    async def _wait_adaptive(
+        self,
+        device: Any,
+        poll_interval: float,
+        event: Any = None
+    ) -> None:
+        """
+        Wait until the device is likely to have fresh data.
 
-            if timeout and (time.time() - start) > timeout:
-                raise TimeoutError(
-                    f"Property '{property_name}' did not change within {timeout}s"
-                )
+        If a change ``event`` is given, or the device driver exposes an
+        ``_update_event`` (asyncio.Event), wait on it for at most
+        ``poll_interval``. Otherwise sleep until the device's next sample
+        is due, capped at ``poll_interval``.
 
-            await asyncio.sleep(poll_interval)
+        Args:
+            device: Device being monitored
+            poll_interval: Maximum time to wait in seconds
+            event: Change notification event from _watch_changes
+        """
+        if event is None:
+            event = getattr(device, "_update_event", None)
+        if event is not None:
+            try:
+                await asyncio.wait_for(event.wait(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                return
+            event.clear()
+            return
+
+        delay = poll_interval
+        next_due = getattr(device, "_next_sample_time", None)
+        if next_due is None and hasattr(device, "_last_read_time"):
+            next_due = device._last_read_time + getattr(device, "_cache_duration", 0)
+        if next_due is not None:
+            remaining = next_due - time.time()
+            if remaining > 0:
+                delay = min(poll_interval, remaining)
+        await asyncio.sleep(delay)
 
     async def periodic(
         self,
@@ -148,13 +309,22 @@ class AsyncEventLoop:
             count: Number of times to execute (0 = forever)
         """
         iterations = 0
+        next_t = time.monotonic() + interval
         while count == 0 or iterations < count:
             if asyncio.iscoroutinefunction(callback):
                 await callback()
             else:
                 callback()
             iterations += 1
-            await asyncio.sleep(interval)
+
+            # Sleep to an absolute deadline so callback runtime doesn't drift
+            delay = next_t - time.monotonic()
+            if delay < 0:
+                # Overran the slot; restart the schedule from now
+                next_t = time.monotonic() + interval
+                delay = interval
+            await asyncio.sleep(delay)
+            next_t += interval
 
     def create_task(self, coro) -> Any:
         """Create an asyncio task."""
@@ -162,28 +332,44 @@ class AsyncEventLoop:
         self._tasks.append(task)
         return task
 
-    def run(self, *coros) -> None:
+    def run(self, *coros, wait_first: bool = False) -> None:
         """
         Run coroutines in the asyncio event loop.
 
         Args:
             *coros: Coroutines to run
+            wait_first: Return as soon as one coroutine finishes and
+                cancel the rest
         """
         self._running = True
 
         async def _main():
             tasks = [asyncio.ensure_future(c) for c in coros]
             self._tasks.extend(tasks)
-            await asyncio.gather(*tasks)
+            if wait_first:
+                done, pending = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in pending:
+                    task.cancel()
+                results = [task.exception() for task in done if not task.cancelled()]
+            else:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Cancellation via stop() is expected; surface real errors
+            for result in results:
+                if isinstance(result, Exception) and not isinstance(
+                    result, asyncio.CancelledError
+                ):
+                    raise result
 
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.ensure_future(_main())
-            else:
-                loop.run_until_complete(_main())
+            asyncio.get_running_loop()
         except RuntimeError:
             asyncio.run(_main())
+            return
+        # Already inside a loop: schedule alongside the caller
+        asyncio.ensure_future(_main())
 
     def stop(self) -> None:
         """Stop all running tasks."""
@@ -206,56 +392,158 @@ class AsyncDevice:
         data = await async_sensor.read_all()
     """
 
-    def __init__(self, device: Any):
+    __slots__ = ("_device", "_wrappers", "_yield_every", "_sync_reads", "_props", "_result")
+
+    def __init__(self, device: Any, yield_every: int = DEFAULT_YIELD_EVERY):
         self._device = device
+        self._wrappers: Dict[str, Callable] = {}
+        self._yield_every = max(1, yield_every)
+        self._sync_reads = 0
+        # Property names and the dict reused by read_all(reuse=True)
+        self._props = tuple(getattr(device, "properties", None) or ())
+        self._result: Dict[str, Any] = dict.fromkeys(self._props)
+
+    async def read_all(self, reuse: bool = False) -> Dict[str, Any]:
+        """
+        Read all properties asynchronously.
 
-    async def read_all(self) -> Dict[str, Any]:
-        """Read all properties asynchronously."""
-        await asyncio.sleep(0)
-        if hasattr(self._device, "read_all"):
-            return self._device.read_all()
+        Args:
+            reuse: Fill and return the same dict on every call instead of
+                allocating one; it is overwritten by the next read, so
+                copy it before keeping it (e.g. before DataLogger.log)
+        """
+        await _fair_yield(self)
+        device = self._device
+        if reuse and self._props:
+            result = self._result
+            for prop in self._props:
+                try:
+                    result[prop] = getattr(device, prop)
+                except Exception:
+                    result[prop] = None
+            return result
+        if hasattr(device, "read_all"):
+            return device.read_all()
         return {}
 
     def __getattr__(self, name: str):
         """Proxy attribute access to create async getters."""
+        if name in AsyncDevice.__slots__:
+            # Slot not yet initialized (e.g. during copy); avoid recursion
+            raise AttributeError(name)
+
+        wrapper = self._wrappers.get(name)
+        if wrapper is not None:
+            return wrapper
+
         attr = getattr(self._device, name, None)
         if attr is None:
             raise AttributeError(f"{name} not found on {self._device}")
 
         if callable(attr):
-            async def async_method(*args, **kwargs):
-                await asyncio.sleep(0)
-                return attr(*args, **kwargs)
-            return async_method
+            wrapper = partial(_async_call, self, attr)
+            self._wrappers[name] = wrapper
+            return wrapper
 
-        # For properties, return a coroutine
-        async def async_prop():
-            await asyncio.sleep(0)
-            return attr
-
-        return async_prop()
+        # Property value is already read; hand back a completed awaitable
+        return _ready(attr)
 
     def __repr__(self) -> str:
         return f"<AsyncDevice wrapping {self._device}>"
 
 
-async def gather_readings(*devices, properties: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+def _read_device(device: Any, properties: Optional[List[str]]) -> Dict[str, Any]:
+    if properties:
+        return {p: getattr(device, p, None) for p in properties}
+    elif hasattr(device, "read_all"):
+        return device.read_all()
+    return {}
+
+
+async def gather_readings(*devices, properties: Optional[List[str]] = None) -> List[Any]:
     """
     Read from multiple devices concurrently.
 
+    Devices on different buses are read in parallel on the default
+    executor, so blocking transfers overlap; devices sharing a bus are
+    read one after another, as the bus can't interleave transactions.
+    With a single bus (or no executor, e.g. uasyncio) everything is
+    read inline.
+
+    The devices may also be passed as one list, optionally followed by
+    a property name for all of them or one name per device; each result
+    is then that property's value:
+
+        temps = await gather_readings([s1, s2], "temperature")
+        temp, lux = await gather_readings([bme, bh1750], ["temperature", "lux"])
+
     Args:
         *devices: Devices to read from
         properties: Specific properties to read (None = all)
 
     Returns:
-        List of reading dictionaries
+        List of reading dictionaries (or values), in device order
     """
-    async def _read_one(device):
-        await asyncio.sleep(0)
-        if properties:
-            return {p: getattr(device, p, None) for p in properties}
-        elif hasattr(device, "read_all"):
-            return device.read_all()
-        return {}
+    if devices and isinstance(devices[0], (list, tuple)):
+        names = devices[1] if len(devices) > 1 else None
+        devices = tuple(devices[0])
+        if isinstance(names, str):
+            names = (names,) * len(devices)
+    else:
+        names = None
+
+    if names is not None:
+        if len(names) != len(devices):
+            raise ValueError(f"Expected {len(devices)} property names, got {len(names)}")
+        readers = [partial(getattr, d, n, None) for d, n in zip(devices, names)]
+    else:
+        readers = [partial(_read_device, d, properties) for d in devices]
+
+    results: List[Any] = [None] * len(readers)
+
+    def _read(indices):
+        for i in indices:
+            results[i] = readers[i]()
+
+    # One group per bus; devices without a bus get their own
+    groups: Dict[int, List[int]] = {}
+    for i, device in enumerate(devices):
+        bus = getattr(device, "_bus", None)
+        groups.setdefault(id(device if bus is None else bus), []).append(i)
+
+    loop = None
+    if len(groups) > 1:
+        try:
+            loop = asyncio.get_running_loop()
+        except (AttributeError, RuntimeError):
+            pass
+
+    if loop is None or not hasattr(loop, "run_in_executor"):
+        _read(range(len(readers)))
+    else:
+        await asyncio.gather(*[
+            loop.run_in_executor(None, _read, indices) for indices in groups.values()
+        ])
+    return results
+
+
+async def gather_readings_soa(*devices, properties: List[str]) -> Dict[str, List[Any]]:
+    """
+    Read the same properties from multiple devices, column by column.
+
+    Args:
+        *devices: Devices to read from
+        properties: Properties to read from every device
+
+    Returns:
+        Dictionary mapping each property to a list of values, one per
+        device in the order given
+    """
+    columns: Dict[str, List[Any]] = {p: [None] * len(devices) for p in properties}
+
+    async def _read_one(index, device):
+        for p in properties:
+            columns[p][index] = getattr(device, p, None)
 
-    return await asyncio.gather(*[_read_one(d) for d in devices])
+    await asyncio.gather(*[_read_one(i, d) for i, d in enumerate(devices)])
+    return columns
@@ -2,11 +2,16 @@
 Base bus interface and types.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+# Interned keys let lookups with literal names match by identity;
+# MicroPython has no sys.intern
+_intern = getattr(sys, "intern", lambda s: s)
+
 
 class BusType(Enum):
     """Supported bus types."""
@@ -109,7 +114,7 @@ class BusFactory:
     @classmethod
     def register(cls, bus_type: str, bus_class: type) -> None:
         """Register a bus class."""
-        cls._bus_classes[bus_type.upper()] = bus_class
+        cls._bus_classes[_intern(bus_type.upper())] = bus_class
     
     @classmethod
     def create(cls, bus_type: str, **kwargs) -> Bus:
@@ -123,11 +128,14 @@ class BusFactory:
         Returns:
             Bus instance
         """
-        bus_type = bus_type.upper()
-        if bus_type not in cls._bus_classes:
-            raise ValueError(f"Unknown bus type: {bus_type}")
+        bus_class = cls._bus_classes.get(bus_type)
+        if bus_class is None:
+            bus_type = bus_type.upper()
+            bus_class = cls._bus_classes.get(bus_type)
+            if bus_class is None:
+                raise ValueError(f"Unknown bus type: {bus_type}")
         
-        return cls._bus_classes[bus_type](**kwargs)
+        return bus_class(**kwargs)
     
     @classmethod
     def available_types(cls) -> List[str]:
@@ -2,7 +2,7 @@
 GPIO Bus implementation.
 """
 
-from typing import List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable
 from enum import Enum
 from .base import Bus, BusConfig, BusType, BusFactory
 
@@ -52,6 +52,9 @@ class GPIOPin:
         self._simulation_mode = True
         self._sim_value = 0
         self._callbacks: List[Callable] = []
+        # True once a hardware IRQ delivers changes; otherwise
+        # GPIOBus.poll() has to watch this pin
+        self._irq = False
         
         self._init_pin()
     
@@ -140,6 +143,7 @@ class GPIOPin:
                     PinEdge.BOTH: Pin.IRQ_RISING | Pin.IRQ_FALLING,
                 }
                 self._pin.irq(trigger=edge_map[edge], handler=lambda p: callback())
+                self._irq = True
             except Exception:
                 pass
     
@@ -179,6 +183,11 @@ class GPIOBus(Bus):
         
         self._pins: dict = {}
         self._pwm_channels: dict = {}
+        # Bit index of each pin in the poll() level bitmap
+        self._bits: Dict[Any, int] = {}
+        self._levels = 0
+        # Pins sampled at least once; a first sample only sets a baseline
+        self._sampled = 0
     
     def init(self) -> bool:
         """Initialize GPIO."""
@@ -202,6 +211,9 @@ class GPIOBus(Bus):
         
         self._pins.clear()
         self._pwm_channels.clear()
+        self._bits.clear()
+        self._levels = 0
+        self._sampled = 0
         self._initialized = False
     
     def scan(self) -> List[int]:
@@ -219,9 +231,55 @@ class GPIOBus(Bus):
         Returns:
             GPIOPin instance
         """
-        if pin_number not in self._pins:
-            self._pins[pin_number] = GPIOPin(pin_number, mode)
-        return self._pins[pin_number]
+        pin = self._pins.get(pin_number)
+        if pin is None:
+            pin = self._pins[pin_number] = GPIOPin(pin_number, mode)
+            self._bits[pin_number] = len(self._bits)
+        return pin
+
+    def poll(self) -> List[Any]:
+        """
+        Fire change callbacks for pins that have no IRQ.
+
+        Simulated pins report changes as they're written and IRQ-capable
+        pins from their handler; hardware pins whose IRQ couldn't be
+        armed are sampled here instead. Their levels are packed into one
+        int and XORed with the previous sample, so only the pins that
+        actually changed are visited.
+
+        Returns:
+            Pin numbers that changed since the last poll
+        """
+        bits = self._bits
+        watched = [
+            (bits[number], pin) for number, pin in self._pins.items()
+            if pin._callbacks and not pin._irq and not pin._simulation_mode
+        ]
+        if not watched:
+            return []
+
+        levels = 0
+        mask = 0
+        for bit, pin in watched:
+            mask |= 1 << bit
+            if pin.value:
+                levels |= 1 << bit
+
+        changed = (levels ^ self._levels) & mask & self._sampled
+        self._levels = levels | (self._levels & ~mask)
+        self._sampled |= mask
+        if not changed:
+            return []
+
+        by_bit = dict(watched)
+        fired = []
+        while changed:
+            lowest = changed & -changed
+            pin = by_bit[lowest.bit_length() - 1]
+            pin._trigger_callbacks()
+            fired.append(pin._pin_number)
+            changed ^= lowest
+        return fired
     
     def output(self, pin_number: int) -> GPIOPin:
         """Create an output pin."""
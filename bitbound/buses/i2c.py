@@ -6,6 +6,19 @@ from typing import List, Optional
 from .base import Bus, BusConfig, BusType, BusFactory
 
 
+def _sim_registers(registers: dict) -> dict:
+    """
+    Convert simulated register contents to the form _sim_read serves.
+
+    Byte sequences become bytes once, here, so reads are a slice; a
+    plain int stays an int (it repeats for every byte read).
+    """
+    return {
+        reg: value if isinstance(value, int) else bytes(value)
+        for reg, value in registers.items()
+    }
+
+
 class I2CBus(Bus):
     """
     I2C (Inter-Integrated Circuit) bus implementation.
@@ -65,6 +78,8 @@ class I2CBus(Bus):
         self._freq = freq
         self._bus_id = bus_id
         self._i2c = None
+        # Reused by read_byte on ports with readfrom_mem_into
+        self._byte_buf = bytearray(1)
         
         # Simulated devices for testing
         self._simulated_devices: dict = {}
@@ -116,10 +131,10 @@ class I2CBus(Bus):
         # Simulate a BME280 at address 0x76
         self._simulated_devices[0x76] = {
             "type": "BME280",
-            "registers": {
+            "registers": _sim_registers({
                 0xD0: 0x60,  # Chip ID for BME280
                 0xF7: [0x50, 0x00, 0x00, 0x80, 0x00, 0x00, 0x80, 0x00],  # Raw data
-            }
+            })
         }
         
         # Simulate an SSD1306 OLED at address 0x3C
@@ -132,7 +147,7 @@ class I2CBus(Bus):
         """Add a simulated device for testing."""
         self._simulated_devices[address] = {
             "type": device_type,
-            "registers": registers or {}
+            "registers": _sim_registers(registers or {})
         }
     
     def deinit(self) -> None:
@@ -191,18 +206,19 @@ class I2CBus(Bus):
     
     def _sim_read(self, address: int, num_bytes: int, register: Optional[int]) -> bytes:
         """Simulated read operation."""
-        if address not in self._simulated_devices:
+        device = self._simulated_devices.get(address)
+        if device is None:
             raise OSError(f"No device at address 0x{address:02X}")
         
-        device = self._simulated_devices[address]
-        if register is not None and register in device["registers"]:
-            data = device["registers"][register]
-            if isinstance(data, list):
-                return bytes(data[:num_bytes])
-            return bytes([data] * num_bytes)
+        if register is not None:
+            data = device["registers"].get(register)
+            if data is not None:
+                if isinstance(data, int):
+                    return bytes((data,)) * num_bytes
+                return data[:num_bytes]
         
         # Return dummy data
-        return bytes([0] * num_bytes)
+        return bytes(num_bytes)
     
     def write_to(
         self,
@@ -232,13 +248,13 @@ class I2CBus(Bus):
     
     def _sim_write(self, address: int, data: bytes, register: Optional[int]) -> None:
         """Simulated write operation."""
-        if address not in self._simulated_devices:
+        device = self._simulated_devices.get(address)
+        if device is None:
             raise OSError(f"No device at address 0x{address:02X}")
         
         # Store written data in simulation
-        device = self._simulated_devices[address]
         if register is not None:
-            device["registers"][register] = list(data)
+            device["registers"][register] = bytes(data)
     
     def read_register(self, address: int, register: int, num_bytes: int = 1) -> bytes:
         """
@@ -267,6 +283,23 @@ class I2CBus(Bus):
     
     def read_byte(self, address: int, register: int) -> int:
         """Read a single byte from a register."""
+        if not self._initialized:
+            self.init()
+        
+        if self._simulation_mode:
+            device = self._simulated_devices.get(address)
+            if device is None:
+                raise OSError(f"No device at address 0x{address:02X}")
+            data = device["registers"].get(register)
+            if data is None:
+                return 0
+            return data if isinstance(data, int) else data[0]
+        
+        read_into = getattr(self._i2c, "readfrom_mem_into", None)
+        if read_into is not None:
+            # One combined transfer into a reused buffer, no bytes object
+            read_into(address, register, self._byte_buf)
+            return self._byte_buf[0]
         return self.read_register(address, register, 1)[0]
     
     def write_byte(self, address: int, register: int, value: int) -> None:
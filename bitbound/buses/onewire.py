@@ -2,9 +2,21 @@
 OneWire Bus implementation.
 """
 
+import time
 from typing import List, Optional
 from .base import Bus, BusConfig, BusType, BusFactory
 
+try:
+    _sleep_ms = time.sleep_ms
+except AttributeError:
+    # CPython
+    def _sleep_ms(ms: int) -> None:
+        time.sleep(ms / 1000)
+
+
+# DS18B20 12-bit temperature conversion time
+DS18B20_CONVERSION_MS = 750
+
 
 class OneWireBus(Bus):
     """
@@ -36,6 +48,8 @@ class OneWireBus(Bus):
         
         self._pin = pin
         self._ow = None
+        # ds18x20.DS18X20 driver, created on first temperature read
+        self._ds = None
         
         # Simulated devices
         self._simulated_devices = {}
@@ -72,6 +86,7 @@ class OneWireBus(Bus):
     def deinit(self) -> None:
         """Deinitialize OneWire."""
         self._ow = None
+        self._ds = None
         self._initialized = False
     
     def scan(self) -> List[bytes]:
@@ -121,30 +136,57 @@ class OneWireBus(Bus):
             return None
         
         try:
-            import ds18x20
-            ds = ds18x20.DS18X20(self._ow)
+            ds = self._ds18x20()
             ds.convert_temp()
-            
-            import time
-            time.sleep_ms(750)  # Conversion time
-            
+            _sleep_ms(DS18B20_CONVERSION_MS)
             return ds.read_temp(rom)
         except Exception as e:
             print(f"DS18B20 read error: {e}")
             return None
     
+    def _ds18x20(self):
+        """Return the DS18X20 driver for this bus, creating it once."""
+        if self._ds is None:
+            import ds18x20
+            self._ds = ds18x20.DS18X20(self._ow)
+        return self._ds
+    
     def read_all_ds18b20(self) -> dict:
         """
         Read temperature from all DS18B20 sensors.
         
+        All sensors convert at once (convert_temp addresses the whole
+        bus), so the read waits for one conversion instead of one per
+        sensor.
+        
         Returns:
             Dict mapping ROM codes to temperatures
         """
+        if not self._initialized:
+            self.init()
+        
+        if self._simulation_mode:
+            result = {}
+            for rom, device in self._simulated_devices.items():
+                temp = device.get("temperature")
+                if temp is not None:
+                    result[rom] = temp
+            return result
+        
         result = {}
-        for rom in self.scan():
-            temp = self.read_ds18b20(rom)
-            if temp is not None:
-                result[rom] = temp
+        try:
+            roms = self.scan()
+            if not roms:
+                return result
+            ds = self._ds18x20()
+            ds.convert_temp()
+            _sleep_ms(DS18B20_CONVERSION_MS)
+            for rom in roms:
+                temp = ds.read_temp(rom)
+                if temp is not None:
+                    result[rom] = temp
+        except Exception as e:
+            print(f"DS18B20 read error: {e}")
         return result
     
     def set_simulated_temp(self, rom: bytes, temperature: float) -> None:
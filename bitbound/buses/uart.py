@@ -140,7 +140,9 @@ class UARTBus(Bus):
                 return data
             else:
                 data = bytes(self._sim_rx_buffer[:num_bytes])
-                self._sim_rx_buffer = self._sim_rx_buffer[num_bytes:]
+                # In-place delete from the front just advances the
+                # bytearray's start; no copy of the unread tail
+                del self._sim_rx_buffer[:num_bytes]
                 return data
         
         if num_bytes == -1:
@@ -6,13 +6,54 @@ deployment, and monitoring.
 """
 
 import argparse
-import json
 import sys
 import time
 from typing import List, Optional
 
 
+# Common I2C addresses and the devices usually found there
+_I2C_KNOWN = {
+    0x20: "PCF8574 (I/O Expander)",
+    0x23: "BH1750 (Light Sensor)",
+    0x27: "LCD I2C",
+    0x3C: "SSD1306 (OLED 128x64)",
+    0x3D: "SSD1306 (OLED 128x32)",
+    0x3F: "LCD I2C (alt)",
+    0x48: "ADS1115 (ADC)",
+    0x50: "AT24C (EEPROM)",
+    0x5C: "BH1750 (alt)",
+    0x68: "MPU6050 / DS3231 (RTC)",
+    0x69: "MPU6050 (alt)",
+    0x76: "BME280 / BMP280",
+    0x77: "BME280 / BMP280 (alt)",
+}
+
+
+# Monitor output is batched into one write per flush period
+MONITOR_FLUSH_SECONDS = 0.5
+MONITOR_MAX_BATCH = 32
+
+# Device metadata keys that are not worth printing in monitor output
+_MONITOR_EXCLUDE = frozenset({"name", "address", "connected", "properties"})
+
+
+# Built on first use; see create_parser
+_parser: Optional[argparse.ArgumentParser] = None
+
+
 def create_parser() -> argparse.ArgumentParser:
+    """
+    Return the argument parser, building it on first call.
+
+    The parser holds no per-parse state, so one instance is shared.
+    """
+    global _parser
+    if _parser is None:
+        _parser = _build_parser()
+    return _parser
+
+
+def _build_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
     parser = argparse.ArgumentParser(
         prog="bitbound",
@@ -33,6 +74,7 @@ def create_parser() -> argparse.ArgumentParser:
     scan_parser.add_argument("--scl", type=int, default=22, help="I2C SCL pin")
     scan_parser.add_argument("--sda", type=int, default=21, help="I2C SDA pin")
     scan_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    scan_parser.set_defaults(func=cmd_scan)
 
     # --- init ---
     init_parser = subparsers.add_parser("init", help="Initialize a new BitBound project")
@@ -45,9 +87,11 @@ def create_parser() -> argparse.ArgumentParser:
         "--template", choices=["basic", "weather", "thermostat", "alarm"],
         default="basic", help="Project template"
     )
+    init_parser.set_defaults(func=cmd_init)
 
     # --- config ---
     config_parser = subparsers.add_parser("config", help="Manage configuration")
+    config_parser.set_defaults(func=cmd_config)
     config_sub = config_parser.add_subparsers(dest="config_action")
 
     config_show = config_sub.add_parser("show", help="Show current configuration")
@@ -68,18 +112,22 @@ def create_parser() -> argparse.ArgumentParser:
     monitor_parser.add_argument("--interval", type=float, default=1.0, help="Poll interval (seconds)")
     monitor_parser.add_argument("--count", type=int, default=0, help="Number of readings (0=unlimited)")
     monitor_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    monitor_parser.set_defaults(func=cmd_monitor)
 
     # --- deploy ---
     deploy_parser = subparsers.add_parser("deploy", help="Deploy project to device")
     deploy_parser.add_argument("--port", help="Serial port (e.g., COM3, /dev/ttyUSB0)")
     deploy_parser.add_argument("--baud", type=int, default=115200, help="Baud rate")
     deploy_parser.add_argument("--path", default=".", help="Project path")
+    deploy_parser.set_defaults(func=cmd_deploy)
 
     # --- boards ---
-    subparsers.add_parser("boards", help="List supported boards")
+    boards_parser = subparsers.add_parser("boards", help="List supported boards")
+    boards_parser.set_defaults(func=cmd_boards)
 
     # --- info ---
     info_parser = subparsers.add_parser("info", help="Show system/device information")
+    info_parser.set_defaults(func=cmd_info)
 
     return parser
 
@@ -99,7 +147,7 @@ def cmd_scan(args) -> None:
         print("I2C Bus:")
         if addresses:
             for addr in addresses:
-                name = _identify_i2c_device(addr)
+                name = _I2C_KNOWN.get(addr, "Unknown device")
                 print(f"  0x{addr:02X} - {name}")
         else:
             print("  No devices found")
@@ -112,7 +160,7 @@ def cmd_scan(args) -> None:
         }
 
     if getattr(args, "json", False):
-        print(json.dumps(results, indent=2))
+        print(_format_json(results))
 
 
 def cmd_init(args) -> None:
@@ -138,14 +186,7 @@ def cmd_init(args) -> None:
     config.save(f"{project_name}/config.json")
 
     # Create main.py based on template
-    templates = {
-        "basic": _template_basic(board),
-        "weather": _template_weather(board),
-        "thermostat": _template_thermostat(board),
-        "alarm": _template_alarm(board),
-    }
-
-    main_code = templates.get(template, templates["basic"])
+    main_code = _TEMPLATES.get(template, _TEMPLATE_BASIC)
     with open(f"{project_name}/main.py", "w") as f:
         f.write(main_code)
 
@@ -162,19 +203,20 @@ def cmd_init(args) -> None:
 
 def cmd_config(args) -> None:
     """Execute config command."""
+    from bitbound._json import loads as _loads
     from bitbound.config import Config
 
     config_file = args.file if hasattr(args, "file") else "config.json"
 
     if args.config_action == "show":
         config = Config.from_file(config_file)
-        print(json.dumps(config.to_dict(), indent=2))
+        print(_format_json(config.to_dict()))
 
     elif args.config_action == "set":
         config = Config.from_file(config_file)
         try:
-            value = json.loads(args.value)
-        except (json.JSONDecodeError, ValueError):
+            value = _loads(args.value)
+        except ValueError:
             value = args.value
         config.set(args.key, value)
         config.save(config_file)
@@ -199,6 +241,7 @@ def cmd_monitor(args) -> None:
 
     hw = Hardware()
     device_type = args.device or "BME280"
+    buffer: List[str] = []
 
     print(f"📊 Monitoring {device_type} (interval: {args.interval}s)")
     print(f"   Press Ctrl+C to stop\n")
@@ -211,25 +254,65 @@ def cmd_monitor(args) -> None:
         else:
             sensor = hw.attach(bus_type, type=device_type)
 
+        from bitbound._json import dumps as encode
+        localtime = time.localtime
+        as_json = getattr(args, "json", False)
+        batch_size = _monitor_batch_size(args.interval)
+
         count = 0
+        next_t = time.monotonic()
         while args.count == 0 or count < args.count:
             values = sensor.read_all()
-            if getattr(args, "json", False):
-                print(json.dumps({"timestamp": time.time(), **values}))
+            if as_json:
+                buffer.append(encode({"timestamp": time.time(), **values}))
             else:
-                parts = [f"{k}: {v}" for k, v in values.items()
-                         if not k.startswith("_") and v is not None
-                         and k not in ("name", "address", "connected", "properties")]
-                print(f"[{time.strftime('%H:%M:%S')}] {' | '.join(parts)}")
+                parts = (f"{k}: {v}" for k, v in values.items()
+                         if v is not None and not k.startswith("_")
+                         and k not in _MONITOR_EXCLUDE)
+                lt = localtime()
+                buffer.append(f"[{lt[3]:02d}:{lt[4]:02d}:{lt[5]:02d}] {' | '.join(parts)}")
+
+            if len(buffer) >= batch_size:
+                _flush_lines(buffer)
 
             count += 1
             if args.count == 0 or count < args.count:
-                time.sleep(args.interval)
+                next_t += args.interval
+                delay = next_t - time.monotonic()
+                if delay < 0:
+                    # Fell behind; resync instead of bursting to catch up
+                    next_t = time.monotonic()
+                    delay = 0.0
+                time.sleep(delay)
+
+        _flush_lines(buffer)
 
     except KeyboardInterrupt:
+        _flush_lines(buffer)
         print("\n\n📊 Monitoring stopped.")
 
 
+def _format_json(obj) -> str:
+    """Pretty-print JSON for a terminal, compact when output is piped."""
+    from bitbound._json import dumps
+    return dumps(obj, indent=2 if sys.stdout.isatty() else None)
+
+
+def _monitor_batch_size(interval: float) -> int:
+    """Number of monitor lines to buffer so output still appears every ~0.5s."""
+    if interval <= 0:
+        return MONITOR_MAX_BATCH
+    return max(1, min(MONITOR_MAX_BATCH, int(MONITOR_FLUSH_SECONDS / interval)))
+
+
+def _flush_lines(buffer: List[str]) -> None:
+    """Write buffered lines to stdout in a single call."""
+    if buffer:
+        sys.stdout.write("\n".join(buffer) + "\n")
+        sys.stdout.flush()
+        buffer.clear()
+
+
 def cmd_deploy(args) -> None:
     """Execute deploy command."""
     port = args.port
@@ -307,38 +390,19 @@ def cmd_info(args) -> None:
         print(f"    {status} {name}")
 
 
-def _identify_i2c_device(address: int) -> str:
-    """Identify a device by its I2C address."""
-    known = {
-        0x20: "PCF8574 (I/O Expander)",
-        0x23: "BH1750 (Light Sensor)",
-        0x27: "LCD I2C",
-        0x3C: "SSD1306 (OLED 128x64)",
-        0x3D: "SSD1306 (OLED 128x32)",
-        0x3F: "LCD I2C (alt)",
-        0x48: "ADS1115 (ADC)",
-        0x50: "AT24C (EEPROM)",
-        0x5C: "BH1750 (alt)",
-        0x68: "MPU6050 / DS3231 (RTC)",
-        0x69: "MPU6050 (alt)",
-        0x76: "BME280 / BMP280",
-        0x77: "BME280 / BMP280 (alt)",
-    }
-    return known.get(address, "Unknown device")
-
-
 def _detect_serial_ports() -> List[str]:
     """Detect available serial ports."""
+    from importlib import import_module
+
     try:
-        import serial.tools.list_ports
-        ports = list(serial.tools.list_ports.comports())
+        list_ports = import_module("serial.tools.list_ports")
+        ports = list(list_ports.comports())
         return [p.device for p in ports if "USB" in p.description or "UART" in p.description]
     except ImportError:
         return []
 
 
-def _template_basic(board: str) -> str:
-    return '''"""BitBound Basic Template"""
+_TEMPLATE_BASIC = '''"""BitBound Basic Template"""
 from bitbound import Hardware
 
 hw = Hardware()
@@ -358,8 +422,7 @@ led.blink(times=3)
 '''
 
 
-def _template_weather(board: str) -> str:
-    return '''"""BitBound Weather Station Template"""
+_TEMPLATE_WEATHER = '''"""BitBound Weather Station Template"""
 from bitbound import Hardware
 from bitbound.logging import DataLogger, LogFormat
 
@@ -385,8 +448,7 @@ hw.run()
 '''
 
 
-def _template_thermostat(board: str) -> str:
-    return '''"""BitBound Smart Thermostat Template"""
+_TEMPLATE_THERMOSTAT = '''"""BitBound Smart Thermostat Template"""
 from bitbound import Hardware
 
 hw = Hardware()
@@ -407,8 +469,7 @@ hw.run()
 '''
 
 
-def _template_alarm(board: str) -> str:
-    return '''"""BitBound Motion Alarm Template"""
+_TEMPLATE_ALARM = '''"""BitBound Motion Alarm Template"""
 from bitbound import Hardware
 
 hw = Hardware()
@@ -430,6 +491,14 @@ hw.run()
 '''
 
 
+_TEMPLATES = {
+    "basic": _TEMPLATE_BASIC,
+    "weather": _TEMPLATE_WEATHER,
+    "thermostat": _TEMPLATE_THERMOSTAT,
+    "alarm": _TEMPLATE_ALARM,
+}
+
+
 def main() -> None:
     """Main entry point for the CLI."""
     parser = create_parser()
@@ -439,17 +508,7 @@ def main() -> None:
         parser.print_help()
         sys.exit(0)
 
-    commands = {
-        "scan": cmd_scan,
-        "init": cmd_init,
-        "config": cmd_config,
-        "monitor": cmd_monitor,
-        "deploy": cmd_deploy,
-        "boards": cmd_boards,
-        "info": cmd_info,
-    }
-
-    handler = commands.get(args.command)
+    handler = getattr(args, "func", None)
     if handler:
         handler(args)
     else:
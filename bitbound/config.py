@@ -5,9 +5,11 @@ Loads and manages device/project configurations from JSON files.
 Supports environment-specific profiles and default overrides.
 """
 
-import json
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ._json import dumps as _dumps, loads as _loads
 
 
 # Default device profiles
@@ -62,6 +64,24 @@ DEVICE_PROFILES: Dict[str, Dict[str, Any]] = {
     },
 }
 
+def _copy_profile(profile: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a profile and its nested pin maps, so the defaults stay untouched."""
+    return {k: dict(v) if isinstance(v, Mapping) else v for k, v in profile.items()}
+
+
+def _lookup_profile(board: str) -> Optional[Dict[str, Any]]:
+    """Find a board profile, trying the exact name before lowercasing."""
+    profile = DEVICE_PROFILES.get(board)
+    if profile is None:
+        profile = DEVICE_PROFILES.get(board.lower())
+    return profile
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key into its parts (cached)."""
+    return tuple(key.split("."))
+
 
 class Config:
     """
@@ -83,6 +103,8 @@ class Config:
         pins = config.get("i2c", default={"scl": 22, "sda": 21})
     """
 
+    __slots__ = ("_data",)
+
     def __init__(
         self,
         data: Optional[Dict[str, Any]] = None,
@@ -99,9 +121,10 @@ class Config:
 
         # Load board profile if specified
         if board:
-            profile = DEVICE_PROFILES.get(board.lower())
+            profile = _lookup_profile(board)
             if profile:
-                self._data.update(profile)
+                # This config owns its own dicts, not the shared defaults
+                self._data.update(_copy_profile(profile))
             else:
                 raise ValueError(
                     f"Unknown board: {board}. "
@@ -125,13 +148,15 @@ class Config:
             Config instance
         """
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            # Raw bytes: the JSON backend decodes UTF-8 itself, so the
+            # file isn't decoded into a str first
+            with open(path, "rb") as f:
+                data = _loads(f.read())
             return cls(data=data, board=board)
         except FileNotFoundError:
             print(f"Config file not found: {path}")
             return cls(board=board)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"Config parse error: {e}")
             return cls(board=board)
 
@@ -146,8 +171,8 @@ class Config:
             True if saved
         """
         try:
-            with open(path, "w") as f:
-                json.dump(self._data, f, indent=2)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(_dumps(self._data, indent=2))
             return True
         except Exception as e:
             print(f"Config save error: {e}")
@@ -164,15 +189,16 @@ class Config:
         Returns:
             Config value
         """
-        parts = key.split(".")
-        value = self._data
+        if "." not in key:
+            return self._data.get(key, default)
 
-        for part in parts:
-            if isinstance(value, dict) and part in value:
+        value = self._data
+        try:
+            for part in _split_key(key):
                 value = value[part]
-            else:
-                return default
-
+        except (KeyError, TypeError, IndexError):
+            # Missing key, or a path through a non-dict value
+            return default
         return value
 
     def set(self, key: str, value: Any) -> None:
@@ -183,7 +209,7 @@ class Config:
             key: Config key (e.g., "wifi.ssid")
             value: Value to set
         """
-        parts = key.split(".")
+        parts = _split_key(key)
         target = self._data
 
         for part in parts[:-1]:
@@ -199,7 +225,7 @@ class Config:
 
     def delete(self, key: str) -> bool:
         """Delete a config key."""
-        parts = key.split(".")
+        parts = _split_key(key)
         target = self._data
 
         for part in parts[:-1]:
@@ -224,11 +250,19 @@ class Config:
     @staticmethod
     def _deep_merge(base: Dict, override: Dict) -> Dict:
         """Deep merge two dictionaries."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                Config._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        stack = [(base, override)]
+        while stack:
+            target, source = stack.pop()
+            shared = [key for key in source if key in target]
+            if len(shared) < len(source):
+                # New keys need no type checks; insert them in one update
+                target.update({k: v for k, v in source.items() if k not in target})
+            for key in shared:
+                current, value = target[key], source[key]
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         return base
 
     @staticmethod
@@ -238,8 +272,9 @@ class Config:
 
     @staticmethod
     def get_board_profile(board: str) -> Optional[Dict[str, Any]]:
-        """Get a board profile by name."""
-        return DEVICE_PROFILES.get(board.lower())
+        """Get a copy of a board profile by name."""
+        profile = _lookup_profile(board)
+        return _copy_profile(profile) if profile is not None else None
 
     def __getitem__(self, key: str) -> Any:
         value = self.get(key)
@@ -4,6 +4,7 @@ Event system for reactive hardware programming.
 Provides event loops, callbacks, and threshold-based triggers.
 """
 
+import heapq
 import time
 import threading
 from dataclasses import dataclass, field
@@ -114,6 +115,10 @@ class EventLoop:
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
         self._device_values: Dict[int, Dict[str, Any]] = {}
+        # Interval handlers as a heap of (monotonic deadline, seq,
+        # handler, device); seq keeps equal deadlines in FIFO order
+        self._schedule: List[tuple] = []
+        self._seq = 0
     
     def register_device(self, device: Any) -> None:
         """Register a device for polling."""
@@ -139,6 +144,10 @@ class EventLoop:
         with self._lock:
             if handler in self.handlers:
                 self.handlers.remove(handler)
+            if handler.event_type == EventType.INTERVAL:
+                # In place, so a tick already running sees the removal
+                self._schedule[:] = [e for e in self._schedule if e[2] is not handler]
+                heapq.heapify(self._schedule)
     
     def on_threshold(
         self,
@@ -217,7 +226,12 @@ class EventLoop:
             
         Returns:
             The registered EventHandler
+        
+        Raises:
+            ValueError: If interval_ms is not positive
         """
+        if interval_ms <= 0:
+            raise ValueError(f"interval_ms must be positive, got {interval_ms}")
         handler = EventHandler(
             callback=callback,
             event_type=EventType.INTERVAL,
@@ -225,7 +239,13 @@ class EventLoop:
         )
         
         self.register_device(device)
-        self.add_handler(handler)
+        with self._lock:
+            self.handlers.append(handler)
+            heapq.heappush(
+                self._schedule,
+                (time.monotonic() + handler.interval, self._seq, handler, device)
+            )
+            self._seq += 1
         return handler
     
     def start(self) -> None:
@@ -251,13 +271,53 @@ class EventLoop:
     
     def _run_loop(self) -> None:
         """Internal event loop."""
+        next_poll = time.monotonic()
         while self._running:
             try:
-                self._poll_devices()
-                time.sleep(self.poll_interval)
+                if time.monotonic() >= next_poll:
+                    self._poll_devices()
+                    next_poll = time.monotonic() + self.poll_interval
+
+                # Sleep until the next poll or interval deadline
+                wake = next_poll
+                next_due = self._run_intervals()
+                if next_due is not None and next_due < wake:
+                    wake = next_due
+                delay = wake - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
             except Exception as e:
                 print(f"Event loop error: {e}")
     
+    def _run_intervals(self) -> Optional[float]:
+        """
+        Fire the interval handlers that are due.
+        
+        Only the heap top is examined, so a tick costs O(log n) per
+        handler fired rather than a scan of every interval handler.
+        
+        Returns:
+            Monotonic time of the next deadline, or None if none scheduled
+        """
+        while True:
+            with self._lock:
+                schedule = self._schedule
+                if not schedule:
+                    return None
+                due, seq, handler, device = schedule[0]
+                now = time.monotonic()
+                if due > now:
+                    return due
+                # Stay on the handler's grid; after an overrun, skip the
+                # missed slots instead of firing them back to back
+                next_due = due + handler.interval
+                if next_due <= now:
+                    next_due = now + handler.interval
+                heapq.heapreplace(schedule, (next_due, seq, handler, device))
+            
+            if handler.enabled:
+                handler.trigger(Event(event_type=EventType.INTERVAL, source=device))
+    
     def _poll_devices(self) -> None:
         """Poll all registered devices and check for events."""
         with self._lock:
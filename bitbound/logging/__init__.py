@@ -6,7 +6,7 @@ for sensor data collection and analysis.
 """
 
 from .datalogger import DataLogger, LogEntry, LogFormat
-from .storage import Storage, FileStorage
+from .storage import Storage, FileStorage, SQLiteStorage
 from .ringbuffer import RingBuffer
 
 __all__ = [
@@ -15,5 +15,6 @@ __all__ = [
     "LogFormat",
     "Storage",
     "FileStorage",
+    "SQLiteStorage",
     "RingBuffer",
 ]
@@ -0,0 +1,21 @@
+"""
+Timestamp source for BitBound logging.
+
+Wall-clock seconds derived from the monotonic clock plus an epoch offset
+captured once at import, so log timestamps never step backwards when the
+system clock is adjusted (NTP sync, RTC set).
+"""
+
+import time
+
+try:
+    _monotonic_ns = time.monotonic_ns
+    _EPOCH_NS = time.time_ns() - _monotonic_ns()
+
+    def now() -> float:
+        """Current time in seconds since the epoch, never decreasing."""
+        return (_monotonic_ns() + _EPOCH_NS) * 1e-9
+
+except AttributeError:
+    # MicroPython ports without monotonic_ns
+    now = time.time
@@ -0,0 +1,54 @@
+"""
+Error reporting for BitBound logging.
+
+Errors go to the ``bitbound.logging`` logger with lazy %-formatting.
+A filter drops repeats of the same message beyond a per-second budget,
+so a failing sensor or disk can't flood the output from a hot path.
+Without handlers configured, Python's last-resort handler prints
+warnings and errors to stderr.
+"""
+
+import time
+
+try:
+    import logging
+except ImportError:
+    logging = None
+
+# Repeats of one message allowed per second before it is suppressed
+MAX_REPEATS_PER_SECOND = 10
+
+
+if logging is not None:
+
+    class _RateLimitFilter(logging.Filter):
+        """Pass at most ``limit`` records per message template per second."""
+
+        def __init__(self, limit: int = MAX_REPEATS_PER_SECOND):
+            super().__init__()
+            self._limit = limit
+            self._windows = {}
+
+        def filter(self, record) -> bool:
+            now = time.monotonic()
+            window = self._windows.get(record.msg)
+            if window is None or now - window[0] >= 1.0:
+                self._windows[record.msg] = [now, 1]
+                return True
+            window[1] += 1
+            return window[1] <= self._limit
+
+    logger = logging.getLogger("bitbound.logging")
+    logger.addFilter(_RateLimitFilter())
+
+else:
+
+    class _PrintLogger:
+        """Minimal stand-in for ports without the logging module."""
+
+        def error(self, msg, *args):
+            print(msg % args if args else msg)
+
+        warning = error
+
+    logger = _PrintLogger()
@@ -4,12 +4,23 @@ Data Logger for BitBound.
 Logs sensor data to files in CSV, JSON, or binary format.
 """
 
+import atexit
 import time
-import json
+import queue
+import struct
 import threading
-from dataclasses import dataclass, field
+import weakref
+from array import array
+from bisect import bisect_left
 from typing import Any, Callable, Dict, List, Optional
 from enum import Enum
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+
+from .._json import dumpb
+from ._clock import now
+from ._report import logger
+from .storage import _close_handle, _open_append, _sync_handle, _write_all
 
 
 class LogFormat(Enum):
@@ -20,18 +31,56 @@ class LogFormat(Enum):
     BINARY = "binary"
 
 
-@dataclass
+# Shared read-only default for entries without values or tags
+_EMPTY = MappingProxyType({})
+
+
 class LogEntry:
-    """A single log entry."""
-    timestamp: float = field(default_factory=time.time)
-    device_name: str = ""
-    values: Dict[str, Any] = field(default_factory=dict)
-    tags: Dict[str, str] = field(default_factory=dict)
+    """
+    A single log entry.
+
+    Entries created without values or tags share one read-only empty
+    mapping; assign a new dict rather than mutating it. A plain slotted
+    class rather than a dataclass: slotted on every Python version, and
+    one is built per logged row.
+    """
+
+    __slots__ = ("timestamp", "device_name", "values", "tags")
+
+    def __init__(
+        self,
+        timestamp: Optional[float] = None,
+        device_name: str = "",
+        values: Optional[Dict[str, Any]] = None,
+        tags: Optional[Dict[str, str]] = None,
+    ):
+        self.timestamp = now() if timestamp is None else timestamp
+        self.device_name = device_name
+        self.values = _EMPTY if values is None else values
+        self.tags = _EMPTY if tags is None else tags
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.timestamp == other.timestamp
+            and self.device_name == other.device_name
+            and self.values == other.values
+            and self.tags == other.tags
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"LogEntry(timestamp={self.timestamp!r}, device_name={self.device_name!r}, "
+            f"values={self.values!r}, tags={self.tags!r})"
+        )
 
     def to_csv(self, separator: str = ",") -> str:
         """Convert to CSV line."""
         parts = [str(self.timestamp), self.device_name]
-        parts.extend(str(v) for v in self.values.values())
+        parts.extend(map(str, self.values.values()))
         return separator.join(parts)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -39,13 +88,141 @@ class LogEntry:
         return {
             "timestamp": self.timestamp,
             "device": self.device_name,
-            "values": self.values,
-            "tags": self.tags,
+            "values": self.values or {},
+            "tags": self.tags or {},
         }
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        return self.to_json_bytes().decode()
+
+    def to_json_bytes(self) -> bytes:
+        """Convert to UTF-8 encoded JSON."""
+        # Built inline rather than via to_dict() to skip a method call per entry
+        return dumpb({
+            "timestamp": self.timestamp,
+            "device": self.device_name,
+            "values": self.values or {},
+            "tags": self.tags or {},
+        })
+
+
+def _csv_formatter(keys: List[str]) -> Callable[[LogEntry], str]:
+    """
+    Build a row formatter specialized for one CSV schema.
+
+    The returned function raises KeyError or ValueError when an entry's
+    values don't match ``keys``, so callers can fall back to to_csv().
+    """
+    width = len(keys)
+    template = "%s,%s" + ",%s" * width + "\n"
+    if width == 0:
+        def _row(e):
+            if e.values:
+                raise ValueError("schema mismatch")
+            return template % (e.timestamp, e.device_name)
+        return _row
+    if width == 1:
+        key = keys[0]
+
+        def _row(e):
+            values = e.values
+            if len(values) != 1:
+                raise ValueError("schema mismatch")
+            return template % (e.timestamp, e.device_name, values[key])
+        return _row
+
+    getter = itemgetter(*keys)
+
+    def _row(e):
+        values = e.values
+        if len(values) != width:
+            raise ValueError("schema mismatch")
+        return template % ((e.timestamp, e.device_name) + getter(values))
+    return _row
+
+
+def _device_reader(
+    device: Any, properties: Optional[List[str]]
+) -> Optional[Callable[[], Dict[str, Any]]]:
+    """
+    Build a function reading one device's logged values.
+
+    Property lookups are resolved once into an attrgetter, so each tick
+    reads all properties in a single call. Returns None if the device
+    has nothing to log.
+    """
+    if not properties:
+        return getattr(device, "read_all", None)
+
+    keys = tuple(properties)
+    getter = attrgetter(*keys)
+
+    def _read():
+        try:
+            values = getter(device)
+        except AttributeError:
+            return {p: getattr(device, p, None) for p in keys}
+        if len(keys) == 1:
+            return {keys[0]: values}
+        return dict(zip(keys, values))
+
+    return _read
+
+
+# Binary log layout: magic, version and key count, then each key as a
+# length-prefixed UTF-8 string, followed by little-endian float64 rows of
+# (timestamp, *values). Missing or non-numeric values are stored as NaN.
+BINARY_MAGIC = b"BBLG"
+BINARY_VERSION = 1
+_NAN = float("nan")
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+# Marks the end of a logger's write queue
+_STOP = object()
+
+# Loggers with a live writer thread, flushed at interpreter exit
+_active_loggers: "weakref.WeakSet[DataLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_active_loggers() -> None:
+    for active in list(_active_loggers):
+        active.close()
+
+
+def _writer_loop(ref: "weakref.ref[DataLogger]", items: "queue.SimpleQueue[Any]") -> None:
+    """Drain a logger's queue, performing all file I/O on this thread."""
+    while True:
+        owner = ref()
+        if owner is None:
+            return
+        timeout = owner._flush_timeout()
+        # Don't keep the logger alive while blocked on the queue
+        del owner
+        try:
+            item = items.get(timeout=timeout)
+        except queue.Empty:
+            # Nothing new arrived before buffered data got too old
+            owner = ref()
+            if owner is None:
+                return
+            try:
+                owner._write_out()
+            except Exception as e:
+                logger.error("Log write error: %s", e)
+            del owner
+            continue
+        owner = ref()
+        if owner is None or not owner._handle_queued(item):
+            return
+        del owner
 
 
 class DataLogger:
@@ -69,48 +246,111 @@ class DataLogger:
         self,
         name: str = "data",
         format: LogFormat = LogFormat.CSV,
-        path: str = ".",
+        path: Optional[str] = ".",
         max_entries: int = 0,
         max_file_size: int = 0,
         rotate: bool = False,
         max_files: int = 5,
-        flush_interval: int = 10,
+        flush_interval: int = 0,
+        buffer_size: int = 64 * 1024,
+        buffer_count: int = 4,
+        flush_bytes: int = 256 * 1024,
+        flush_seconds: float = 1.0,
+        sync_seconds: float = 0,
     ):
         """
         Initialize data logger.
 
         Args:
             name: Log file base name
-            format: Output format
-            path: Directory for log files
+            format: Output format (LogFormat or its value, e.g. "csv")
+            path: Directory for log files (None = keep entries in memory only)
             max_entries: Max entries per file (0 = unlimited)
             max_file_size: Max file size in bytes (0 = unlimited)
             rotate: Enable log rotation
             max_files: Max number of rotated files
-            flush_interval: Flush to disk every N entries
+            flush_interval: Also flush to disk every N entries (0 = off)
+            buffer_size: Size of each write buffer in bytes
+            buffer_count: Number of write buffers filled before they are
+                written out together
+            flush_bytes: Flush once this many bytes are buffered
+                (0 = only when the write buffers are full)
+            flush_seconds: Flush buffered data once it is this old
+                (0 = no time limit)
+            sync_seconds: fsync the log file at most this often after
+                writes, and always on flush() and close(), so many
+                writes share one sync (0 = leave syncing to the OS)
         """
         self._name = name
-        self._format = format
+        self._format = LogFormat(format)
         self._path = path
         self._max_entries = max_entries
         self._max_file_size = max_file_size
         self._rotate = rotate
         self._max_files = max_files
         self._flush_interval = flush_interval
+        self._flush_bytes = flush_bytes
+        self._flush_seconds = flush_seconds
+        self._sync_seconds = sync_seconds
+        # When the file was last fsync'd, and whether writes followed
+        self._synced_at: Optional[float] = None
+        self._unsynced = False
 
         self._entries: List[LogEntry] = []
+        # Running maximum of entry timestamps, parallel to _entries. It is
+        # sorted even if the clock steps back, so get_entries can bisect it.
+        self._timestamps = array("d")
         self._entry_count = 0
         self._file = None
         self._file_index = 0
+        # Current file path; reset whenever _file_index changes
+        self._filename: Optional[str] = None
         self._devices: List[Dict[str, Any]] = []
+        # (name, reader) pairs specialized per device by add_device
+        self._readers: List[Any] = []
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
         self._callbacks: List[Callable[[LogEntry], None]] = []
         self._header_written = False
 
+        # File I/O happens on a single writer thread fed by this queue
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_done: Optional[weakref.finalize] = None
+        self._file_entries = 0
+
+        # Serialized entries collect in reusable buffers until written out
+        self._buffer_size = buffer_size
+        self._buffer_count = max(1, buffer_count)
+        self._free_buffers: List[bytearray] = []
+        self._filled: List[Any] = []
+        self._active: Optional[bytearray] = None
+        self._pos = 0
+        # Bytes buffered since the last write-out, and when the oldest arrived
+        self._pending_bytes = 0
+        self._pending_since: Optional[float] = None
+
+        # Fixed row schema for LogFormat.BINARY, taken from the first entry
+        self._bin_keys: Optional[List[str]] = None
+        self._bin_fmt = ""
+        self._bin_size = 0
+
+        # Row formatter specialized for the CSV header's columns
+        self._csv_row: Optional[Callable[[LogEntry], str]] = None
+
+        # Per-entry serializer for the format, chosen once here
+        self._write_row: Callable[[LogEntry], None] = {
+            LogFormat.CSV: self._write_csv,
+            LogFormat.JSON: self._write_json,
+            LogFormat.JSONL: self._write_jsonl,
+            LogFormat.BINARY: self._write_binary,
+        }[self._format]
+
     def _get_filename(self) -> str:
         """Get the current log filename."""
+        if self._filename is not None:
+            return self._filename
         ext_map = {
             LogFormat.CSV: ".csv",
             LogFormat.JSON: ".json",
@@ -119,36 +359,32 @@ class DataLogger:
         }
         ext = ext_map.get(self._format, ".log")
         if self._rotate and self._file_index > 0:
-            return f"{self._path}/{self._name}_{self._file_index}{ext}"
-        return f"{self._path}/{self._name}{ext}"
+            self._filename = f"{self._path}/{self._name}_{self._file_index}{ext}"
+        else:
+            self._filename = f"{self._path}/{self._name}{ext}"
+        return self._filename
 
     def _open_file(self) -> None:
         """Open or create the log file."""
-        if self._file:
-            self._file.close()
+        self._close_file()
 
         filename = self._get_filename()
-        mode = "a"
         try:
-            self._file = open(filename, mode)
-            if self._format == LogFormat.CSV and not self._header_written:
-                # CSV header will be written on first log
-                pass
+            self._file = _open_append(filename)
         except Exception as e:
-            print(f"Cannot open log file {filename}: {e}")
+            logger.error("Cannot open log file %s: %s", filename, e)
             self._file = None
 
     def _rotate_file(self) -> None:
         """Rotate log files."""
-        if self._file:
-            self._file.close()
-            self._file = None
+        self._close_file()
 
         self._file_index += 1
         if self._file_index >= self._max_files:
             self._file_index = 0
+        self._filename = None
 
-        self._entry_count = 0
+        self._file_entries = 0
         self._header_written = False
         self._open_file()
 
@@ -166,11 +402,15 @@ class DataLogger:
             properties: List of properties to log (None = all)
             name: Override device name
         """
-        self._devices.append({
+        info = {
             "device": device,
             "properties": properties,
             "name": name or getattr(device, "name", str(device)),
-        })
+        }
+        self._devices.append(info)
+        reader = _device_reader(device, properties)
+        if reader is not None:
+            self._readers.append((info["name"], reader))
 
     def log(
         self,
@@ -190,33 +430,87 @@ class DataLogger:
             The created LogEntry
         """
         entry = LogEntry(
-            timestamp=time.time(),
+            timestamp=now(),
             device_name=device_name,
             values=values,
-            tags=tags or {},
+            tags=tags or _EMPTY,
         )
 
         with self._lock:
             self._entries.append(entry)
+            timestamps = self._timestamps
+            timestamps.append(
+                max(entry.timestamp, timestamps[-1]) if timestamps else entry.timestamp
+            )
             self._entry_count += 1
 
-            # Write to file
-            self._write_entry(entry)
-
-            # Check rotation
-            if self._rotate and self._max_entries > 0:
-                if self._entry_count >= self._max_entries:
-                    self._rotate_file()
+        # Hand off to the writer thread; callers never wait on disk I/O
+        if self._path is not None:
+            self._ensure_writer()
+            self._queue.put(entry)
 
         # Fire callbacks
         for cb in self._callbacks:
             try:
                 cb(entry)
             except Exception as e:
-                print(f"Logger callback error: {e}")
+                logger.error("Logger callback error: %s", e)
 
         return entry
 
+    def _ensure_writer(self) -> None:
+        """Start the writer thread if it isn't running."""
+        if self._writer is not None:
+            return
+        with self._lock:
+            if self._writer is None:
+                # The thread only holds a weak reference, so an unclosed
+                # logger can still be collected; that wakes and ends it
+                self._writer = threading.Thread(
+                    target=_writer_loop, args=(weakref.ref(self), self._queue),
+                    daemon=True,
+                )
+                self._writer_done = weakref.finalize(self, self._queue.put, _STOP)
+                self._writer_done.atexit = False
+                self._writer.start()
+                _active_loggers.add(self)
+
+    def _handle_queued(self, item: Any) -> bool:
+        """Process one item from the write queue; False once stopped."""
+        try:
+            if item is _STOP:
+                self._close_file()
+                return False
+            if isinstance(item, threading.Event):
+                # Flush request; signal the waiting caller when done
+                self._flush_file()
+            else:
+                self._write_entry(item)
+        except Exception as e:
+            logger.error("Log write error: %s", e)
+        finally:
+            if isinstance(item, threading.Event):
+                item.set()
+        return True
+
+    def _flush_timeout(self) -> Optional[float]:
+        """Seconds until buffered data is due to be written (None = never)."""
+        if self._pending_since is None or not self._flush_seconds:
+            return None
+        due = self._pending_since + self._flush_seconds - time.monotonic()
+        return max(0.0, due)
+
+    def _stop_writer(self) -> None:
+        """Drain pending entries and stop the writer thread."""
+        writer = self._writer
+        if writer is None:
+            return
+        self._writer_done.detach()
+        self._queue.put(_STOP)
+        writer.join()
+        self._writer = None
+        _active_loggers.discard(self)
+
     def _write_entry(self, entry: LogEntry) -> None:
         """Write an entry to the log file."""
         if self._file is None:
@@ -225,45 +519,161 @@ class DataLogger:
             return
 
         try:
-            if self._format == LogFormat.CSV:
-                if not self._header_written:
-                    header = "timestamp,device," + ",".join(entry.values.keys())
-                    self._file.write(header + "\n")
-                    self._header_written = True
-                self._file.write(entry.to_csv() + "\n")
+            self._write_row(entry)
+
+            # Flush on size, age, or (optionally) entry count
+            self._file_entries += 1
+            if self._pending_since is not None and (
+                (self._flush_bytes and self._pending_bytes >= self._flush_bytes)
+                or (self._flush_seconds
+                    and time.monotonic() - self._pending_since >= self._flush_seconds)
+                or (self._flush_interval
+                    and self._file_entries % self._flush_interval == 0)
+            ):
+                self._write_out()
 
-            elif self._format == LogFormat.JSON:
-                # For JSON format, we accumulate in memory
-                pass
+            # Check rotation
+            if self._rotate and self._max_entries > 0:
+                if self._file_entries >= self._max_entries:
+                    self._rotate_file()
 
-            elif self._format == LogFormat.JSONL:
-                self._file.write(entry.to_json() + "\n")
+        except Exception as e:
+            logger.error("Log write error: %s", e)
+
+    def _write_csv(self, entry: LogEntry) -> None:
+        if not self._header_written:
+            keys = list(entry.values.keys())
+            header = "timestamp,device," + ",".join(keys)
+            self._buffer_write((header + "\n").encode())
+            self._header_written = True
+            self._csv_row = _csv_formatter(keys)
+        try:
+            line = self._csv_row(entry)
+        except (KeyError, ValueError):
+            line = entry.to_csv() + "\n"
+        self._buffer_write(line.encode())
+
+    def _write_json(self, entry: LogEntry) -> None:
+        # For JSON format, we accumulate in memory
+        pass
+
+    def _write_jsonl(self, entry: LogEntry) -> None:
+        self._buffer_write(entry.to_json_bytes() + b"\n")
+
+    def _write_binary(self, entry: LogEntry) -> None:
+        if self._bin_keys is None:
+            self._bin_keys = list(entry.values.keys())
+            self._bin_fmt = "<" + "d" * (len(self._bin_keys) + 1)
+            self._bin_size = struct.calcsize(self._bin_fmt)
+        if not self._header_written:
+            self._buffer_write(self._binary_header())
+            self._header_written = True
+        self._write_binary_row(entry)
+
+    def _binary_header(self) -> bytes:
+        """Build the schema block written at the start of a binary log."""
+        keys = self._bin_keys or []
+        parts = [BINARY_MAGIC, struct.pack("<BH", BINARY_VERSION, len(keys))]
+        for key in keys:
+            raw = str(key).encode()
+            parts.append(struct.pack("<H", len(raw)))
+            parts.append(raw)
+        return b"".join(parts)
+
+    def _write_binary_row(self, entry: LogEntry) -> None:
+        """Pack an entry straight into the active write buffer."""
+        row = [entry.timestamp]
+        row.extend(entry.values.get(k, _NAN) for k in self._bin_keys)
+
+        if self._bin_size > self._buffer_size:
+            self._buffer_write(struct.pack(self._bin_fmt, *map(_as_float, row)))
+            return
 
-            # Periodic flush
-            if self._entry_count % self._flush_interval == 0:
-                self._file.flush()
+        start = self._reserve(self._bin_size)
+        try:
+            struct.pack_into(self._bin_fmt, self._active, start, *row)
+        except struct.error:
+            # Non-numeric values (None, strings) are stored as NaN
+            struct.pack_into(self._bin_fmt, self._active, start, *map(_as_float, row))
+
+    def _buffer_write(self, data: bytes) -> None:
+        """Copy serialized data into the active write buffer."""
+        size = len(data)
+        if size > self._buffer_size:
+            # Too large to buffer; write it straight after what's pending
+            self._write_out()
+            _write_all(self._file, [data])
+            return
 
-        except Exception as e:
-            print(f"Log write error: {e}")
+        start = self._reserve(size)
+        self._active[start:start + size] = data
+
+    def _reserve(self, size: int) -> int:
+        """Claim ``size`` bytes of the active buffer and return their offset."""
+        if self._active is not None and self._pos + size > len(self._active):
+            self._retire_active()
+
+        if self._active is None:
+            if len(self._filled) >= self._buffer_count:
+                self._write_out()
+            self._active = (
+                self._free_buffers.pop() if self._free_buffers
+                else bytearray(self._buffer_size)
+            )
+            self._pos = 0
+
+        start = self._pos
+        self._pos += size
+        self._pending_bytes += size
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        return start
+
+    def _retire_active(self) -> None:
+        """Queue the active buffer for writing."""
+        if self._active is not None:
+            if self._pos:
+                self._filled.append((self._active, self._pos))
+            else:
+                self._free_buffers.append(self._active)
+        self._active = None
+        self._pos = 0
+
+    def _write_out(self) -> None:
+        """Write all filled buffers to the file in one vectored call."""
+        self._retire_active()
+        self._pending_bytes = 0
+        self._pending_since = None
+        if not self._filled:
+            return
+        try:
+            if self._file is not None:
+                _write_all(self._file, [memoryview(buf)[:n] for buf, n in self._filled])
+                if self._sync_seconds:
+                    self._unsynced = True
+                    self._sync(force=False)
+        finally:
+            self._free_buffers.extend(buf for buf, _ in self._filled)
+            self._filled.clear()
+
+    def _sync(self, force: bool) -> None:
+        """fsync the log file if sync_seconds have passed (or if forced)."""
+        now_s = time.monotonic()
+        if not force and self._synced_at is not None and now_s - self._synced_at < self._sync_seconds:
+            return
+        if self._file is not None and self._unsynced:
+            _sync_handle(self._file)
+        self._synced_at = now_s
+        self._unsynced = False
 
     def _log_devices(self) -> None:
         """Log all registered devices."""
-        for dev_info in self._devices:
-            device = dev_info["device"]
-            properties = dev_info["properties"]
-            name = dev_info["name"]
-
+        log = self.log
+        for name, read in self._readers:
             try:
-                if properties:
-                    values = {p: getattr(device, p, None) for p in properties}
-                elif hasattr(device, "read_all"):
-                    values = device.read_all()
-                else:
-                    continue
-
-                self.log(values, device_name=name)
+                log(read(), device_name=name)
             except Exception as e:
-                print(f"Device log error ({name}): {e}")
+                logger.error("Device log error (%s): %s", name, e)
 
     def start(self, interval_ms: int = 1000) -> None:
         """
@@ -294,20 +704,65 @@ class DataLogger:
             self._thread = None
         self.flush()
 
-    def flush(self) -> None:
-        """Flush all buffered data to disk."""
-        with self._lock:
-            if self._format == LogFormat.JSON and self._entries:
+    def flush(self, timeout: Optional[float] = 2.0) -> bool:
+        """
+        Flush all buffered data to disk.
+
+        Args:
+            timeout: Seconds to wait for the writer thread (None = no limit)
+
+        Returns:
+            True if the flush completed, False if the writer timed out
+        """
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            # Queue behind pending entries and wait for the writer to reach it
+            done = threading.Event()
+            self._queue.put(done)
+            if not done.wait(timeout):
+                logger.error("Log flush timed out after %ss", timeout)
+                return False
+        elif self._path is not None:
+            self._flush_file()
+        return True
+
+    def _flush_file(self) -> None:
+        """Write out buffered data (runs on the writer thread when active)."""
+        if self._format == LogFormat.JSON:
+            with self._lock:
+                entries = list(self._entries)
+            if entries:
                 if self._file is None:
                     self._open_file()
-                if self._file:
-                    data = [e.to_dict() for e in self._entries]
-                    self._file.seek(0)
-                    self._file.write(json.dumps(data, indent=2))
-                    self._file.flush()
-
-            elif self._file:
-                self._file.flush()
+                if self._file is not None:
+                    # Stream the array entry by entry through the write
+                    # buffers instead of building one large string
+                    write = self._buffer_write
+                    rest = iter(entries)
+                    write(b"[")
+                    write(next(rest).to_json_bytes())
+                    for entry in rest:
+                        write(b",")
+                        write(entry.to_json_bytes())
+                    write(b"]")
+                    self._write_out()
+
+        else:
+            self._write_out()
+
+        if self._unsynced:
+            self._sync(force=True)
+
+    def _close_file(self) -> None:
+        """Write out buffered data and close the log file if open."""
+        if self._file is not None:
+            try:
+                self._write_out()
+                if self._unsynced:
+                    self._sync(force=True)
+            finally:
+                _close_handle(self._file)
+                self._file = None
 
     def get_entries(
         self,
@@ -327,7 +782,11 @@ class DataLogger:
             List of LogEntry objects
         """
         with self._lock:
-            entries = list(self._entries)
+            if since:
+                start = bisect_left(self._timestamps, since)
+                entries = self._entries[start:]
+            else:
+                entries = list(self._entries)
 
         if since:
             entries = [e for e in entries if e.timestamp >= since]
@@ -342,6 +801,7 @@ class DataLogger:
         """Clear in-memory entries."""
         with self._lock:
             self._entries.clear()
+            self._timestamps = array("d")
             self._entry_count = 0
 
     def on_entry(self, callback: Callable[[LogEntry], None]) -> None:
@@ -358,11 +818,17 @@ class DataLogger:
         return self._running
 
     def close(self) -> None:
-        """Stop logging and close files."""
+        """
+        Stop logging and close files.
+
+        Call this (or use the logger as a context manager) to get buffered
+        data on disk; a logger collected without it drops what it buffered.
+        """
         self.stop()
-        if self._file:
-            self._file.close()
-            self._file = None
+        if self._writer is not None:
+            self._stop_writer()
+        else:
+            self._close_file()
 
     def __enter__(self):
         return self
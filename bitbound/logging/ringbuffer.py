@@ -2,15 +2,33 @@
 Ring Buffer for BitBound.
 
 Memory-efficient circular buffer for sensor data on
-memory-constrained microcontrollers.
+memory-constrained microcontrollers. Timestamps and numeric values
+are kept in flat arrays; BufferEntry objects are built on demand.
 """
 
-import time
-from typing import Any, Dict, List, Optional
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from ._clock import now
 
-@dataclass
+try:
+    from itertools import compress
+except ImportError:
+    # MicroPython's itertools has no compress
+    def compress(data, selectors):
+        return (d for d, s in zip(data, selectors) if s)
+
+
+_MISSING = object()
+
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class BufferEntry:
     """A single ring buffer entry."""
     timestamp: float
@@ -44,11 +62,36 @@ class RingBuffer:
 
         Args:
             capacity: Maximum number of entries
+
+        Storage is rounded up to the next power of two so slot indices
+        wrap with a mask instead of a modulo; only ``capacity`` entries
+        are ever visible.
         """
         self._capacity = capacity
-        self._buffer: List[Optional[BufferEntry]] = [None] * capacity
-        self._head = 0
+        self._slot_count = 1 << max(0, capacity - 1).bit_length()
+        self._mask = self._slot_count - 1
+        self._timestamps = array("d", [0.0]) * self._slot_count
+        self._values: List[Optional[Dict[str, Any]]] = [None] * self._slot_count
+        # Sequence number of the next append; its slot is _seq & _mask
+        self._seq = 0
         self._count = 0
+        # Sequence number of the last append whose timestamp went back in
+        # time; the window is sorted again once its start passes it
+        self._descent = 0
+
+        # Numeric values are mirrored into per-key float columns with a
+        # validity mask, so aggregates don't walk the stored dicts
+        self._columns: Dict[str, array] = {}
+        self._valid: Dict[str, bytearray] = {}
+        # Running sum and count of the valid values per key, so
+        # average() is O(1); resynced once per lap of the slots to
+        # shed floating-point drift from the add/subtract updates
+        self._sums: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        # min_value/max_value results, keyed by (min or max, key) and
+        # dropped on every change, so repeated queries between appends
+        # don't rescan the columns
+        self._extrema: Dict[Any, Optional[float]] = {}
 
     def append(self, values: Dict[str, Any], timestamp: Optional[float] = None) -> None:
         """
@@ -58,14 +101,78 @@ class RingBuffer:
             values: Key-value pairs to store
             timestamp: Optional timestamp (default: now)
         """
-        entry = BufferEntry(
-            timestamp=timestamp or time.time(),
-            values=values,
-        )
-        self._buffer[self._head] = entry
-        self._head = (self._head + 1) % self._capacity
+        seq = self._seq
+        ts = timestamp or now()
+        if self._count and ts < self._timestamps[(seq - 1) & self._mask]:
+            self._descent = seq
+
         if self._count < self._capacity:
             self._count += 1
+        else:
+            # Retire the entry leaving the window (may be this same slot)
+            self._evict((seq - self._capacity) & self._mask)
+
+        slot = seq & self._mask
+        self._timestamps[slot] = ts
+        self._values[slot] = values
+        self._store_numeric(slot, values)
+        self._seq = seq + 1
+        if not self._seq & self._mask:
+            self._resync()
+        if self._extrema:
+            self._extrema.clear()
+
+    def _evict(self, slot: int) -> None:
+        """Drop a slot from the visible window."""
+        self._values[slot] = None
+        self._invalidate(slot)
+
+    def _invalidate(self, slot: int) -> None:
+        """Remove a slot's numeric values from the columns and sums."""
+        sums = self._sums
+        counts = self._counts
+        for key, valid in self._valid.items():
+            if valid[slot]:
+                valid[slot] = 0
+                sums[key] -= self._columns[key][slot]
+                counts[key] -= 1
+
+    def _store_numeric(self, slot: int, values: Dict[str, Any]) -> None:
+        """Record numeric values for a slot in the column store."""
+        self._invalidate(slot)
+        for key, val in values.items():
+            if val is None or not isinstance(val, (int, float)):
+                continue
+            column = self._columns.get(key)
+            if column is None:
+                column = self._columns[key] = array("d", [0.0]) * self._slot_count
+                self._valid[key] = bytearray(self._slot_count)
+                self._sums[key] = 0.0
+                self._counts[key] = 0
+            column[slot] = val
+            self._valid[key][slot] = 1
+            self._sums[key] += column[slot]
+            self._counts[key] += 1
+
+    def _resync(self) -> None:
+        """Recompute the running sums exactly from the columns."""
+        for key in self._columns:
+            self._sums[key] = sum(self._numeric(key))
+
+    def _numeric(self, key: str):
+        """Iterate the valid numeric values stored for a key."""
+        column = self._columns.get(key)
+        if column is None:
+            return None
+        return compress(column, self._valid[key])
+
+    def _entry(self, slot: int) -> BufferEntry:
+        """Build a BufferEntry view of a slot."""
+        return BufferEntry(timestamp=self._timestamps[slot], values=self._values[slot])
+
+    def _slots(self) -> range:
+        """Sequence numbers in chronological order (mask to get slots)."""
+        return range(self._seq - self._count, self._seq)
 
     def latest(self, count: int = 1) -> List[BufferEntry]:
         """
@@ -77,18 +184,10 @@ class RingBuffer:
         Returns:
             List of most recent entries (newest first)
         """
-        if self._count == 0:
-            return []
-
         count = min(count, self._count)
-        result = []
-        idx = (self._head - 1) % self._capacity
-        for _ in range(count):
-            entry = self._buffer[idx]
-            if entry is not None:
-                result.append(entry)
-            idx = (idx - 1) % self._capacity
-        return result
+        mask = self._mask
+        last = self._seq - 1
+        return [self._entry((last - i) & mask) for i in range(count)]
 
     def oldest(self, count: int = 1) -> List[BufferEntry]:
         """
@@ -100,24 +199,8 @@ class RingBuffer:
         Returns:
             List of oldest entries (oldest first)
         """
-        if self._count == 0:
-            return []
-
-        count = min(count, self._count)
-        result = []
-
-        if self._count < self._capacity:
-            start = 0
-        else:
-            start = self._head
-
-        idx = start
-        for _ in range(count):
-            entry = self._buffer[idx]
-            if entry is not None:
-                result.append(entry)
-            idx = (idx + 1) % self._capacity
-        return result
+        mask = self._mask
+        return [self._entry(i & mask) for i in self._slots()[:max(0, count)]]
 
     def all(self) -> List[BufferEntry]:
         """
@@ -126,20 +209,8 @@ class RingBuffer:
         Returns:
             List of all entries
         """
-        if self._count == 0:
-            return []
-
-        if self._count < self._capacity:
-            return [e for e in self._buffer[:self._count] if e is not None]
-
-        result = []
-        idx = self._head
-        for _ in range(self._capacity):
-            entry = self._buffer[idx]
-            if entry is not None:
-                result.append(entry)
-            idx = (idx + 1) % self._capacity
-        return result
+        mask = self._mask
+        return [self._entry(i & mask) for i in self._slots()]
 
     def average(self, key: str) -> Optional[float]:
         """
@@ -151,37 +222,86 @@ class RingBuffer:
         Returns:
             Average value or None
         """
-        values = []
-        for entry in self.all():
-            val = entry.values.get(key)
-            if val is not None and isinstance(val, (int, float)):
-                values.append(val)
-
-        if not values:
+        count = self._counts.get(key)
+        if not count:
             return None
-        return sum(values) / len(values)
+        return self._sums[key] / count
+
+    def _extreme(self, func, key: str) -> Optional[float]:
+        """min or max over a key's valid values, cached until the next change."""
+        cache_key = (func, key)
+        try:
+            return self._extrema[cache_key]
+        except KeyError:
+            pass
+        values = self._numeric(key)
+        result = func(values, default=None) if values is not None else None
+        self._extrema[cache_key] = result
+        return result
 
     def min_value(self, key: str) -> Optional[float]:
         """Get the minimum value for a key."""
-        values = [e.values.get(key) for e in self.all()
-                  if key in e.values and isinstance(e.values[key], (int, float))]
-        return min(values) if values else None
+        return self._extreme(min, key)
 
     def max_value(self, key: str) -> Optional[float]:
         """Get the maximum value for a key."""
-        values = [e.values.get(key) for e in self.all()
-                  if key in e.values and isinstance(e.values[key], (int, float))]
-        return max(values) if values else None
+        return self._extreme(max, key)
+
+    def stats(self, keys: List[str]) -> Dict[str, Tuple[Optional[float], Optional[float], Optional[float]]]:
+        """
+        Get (average, min, max) for several keys at once.
+
+        Each key's column is scanned at most once for both extremes
+        (and not at all if they are cached since the last append).
+
+        Returns:
+            Dict mapping each key to (average, min, max); None where
+            the key has no numeric values
+        """
+        extrema = self._extrema
+        result = {}
+        for key in keys:
+            low = extrema.get((min, key), _MISSING)
+            high = extrema.get((max, key), _MISSING)
+            if low is _MISSING or high is _MISSING:
+                values = self._numeric(key)
+                values = list(values) if values is not None else ()
+                low = extrema[(min, key)] = min(values, default=None)
+                high = extrema[(max, key)] = max(values, default=None)
+            result[key] = (self.average(key), low, high)
+        return result
 
     def since(self, timestamp: float) -> List[BufferEntry]:
         """Get entries since a specific timestamp."""
-        return [e for e in self.all() if e.timestamp >= timestamp]
+        mask = self._mask
+        timestamps = self._timestamps
+        start = self._seq - self._count
+        if start < self._descent:
+            # A clock step back is still inside the window
+            return [self._entry(i & mask) for i in self._slots() if timestamps[i & mask] >= timestamp]
+
+        # The window is sorted; bisect whichever of its two contiguous
+        # slot runs (before and after the wrap) holds the cut point
+        first = start & mask
+        run = min(self._count, self._slot_count - first)
+        if run and timestamps[first + run - 1] >= timestamp:
+            cut = start + bisect_left(timestamps, timestamp, first, first + run) - first
+        else:
+            cut = start + run + bisect_left(timestamps, timestamp, 0, self._count - run)
+        return [self._entry(i & mask) for i in range(cut, self._seq)]
 
     def clear(self) -> None:
         """Clear all entries."""
-        self._buffer = [None] * self._capacity
-        self._head = 0
+        # Slots outside the window are never read, so the stored dicts are
+        # left in place and released as their slots are overwritten
+        self._seq = 0
         self._count = 0
+        self._descent = 0
+        self._columns.clear()
+        self._valid.clear()
+        self._sums.clear()
+        self._counts.clear()
+        self._extrema.clear()
 
     @property
     def count(self) -> int:
@@ -5,10 +5,164 @@ Provides filesystem-agnostic storage for configuration and data
 on both MicroPython and desktop.
 """
 
-import json
 import os
+import threading
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+from .._json import dumpb, loads
+from ._report import logger
+
+try:
+    from weakref import finalize as _finalize
+except ImportError:
+    # MicroPython: handles are closed by close() or the with block
+    _finalize = None
+
+try:
+    import sqlite3
+except ImportError:
+    # MicroPython; SQLiteStorage is unavailable
+    sqlite3 = None
+
+
+# Files are written through raw descriptors, bypassing Python's io layers
+_WRITE_FLAGS = (
+    getattr(os, "O_WRONLY", 0) | getattr(os, "O_CREAT", 0) | getattr(os, "O_BINARY", 0)
+)
+_HAS_WRITEV = hasattr(os, "writev")
+_HAS_FSYNC = hasattr(os, "fsync")
+_HAS_SENDFILE = hasattr(os, "sendfile")
+
+# Chunk size for copies that can't be done in the kernel
+_COPY_CHUNK = 64 * 1024
+
+# Files FileStorage.append_text keeps open between calls
+APPEND_HANDLES = 4
+
+
+def _open_append(filename: str) -> Any:
+    """Open a file for appending; returns a descriptor or binary file object."""
+    if hasattr(os, "open"):
+        return os.open(filename, _WRITE_FLAGS | getattr(os, "O_APPEND", 0), 0o644)
+    # MicroPython has no os.open
+    return open(filename, "ab")
+
+
+def _write_all(handle: Any, chunks: List[Any]) -> None:
+    """Write all chunks, using a single vectored write where supported."""
+    if not isinstance(handle, int):
+        for chunk in chunks:
+            handle.write(chunk)
+        return
+
+    if _HAS_WRITEV:
+        total = sum(len(c) for c in chunks)
+        written = os.writev(handle, chunks)
+        if written >= total:
+            return
+        # Short write: fall back to writing the remainder
+        chunks = [b"".join(chunks)[written:]]
+
+    for chunk in chunks:
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(handle, view):]
+
+
+def _sync_handle(handle: Any) -> None:
+    """Push data written through a handle from _open_append to the device."""
+    if isinstance(handle, int):
+        if _HAS_FSYNC:
+            os.fsync(handle)
+    else:
+        handle.flush()
+
+
+def _close_handle(handle: Any) -> None:
+    """Close a handle returned by _open_append."""
+    if isinstance(handle, int):
+        os.close(handle)
+    else:
+        handle.close()
+
+
+def _write_file(path: str, data: bytes, sync: bool = False) -> None:
+    """Replace a file's contents with one write, optionally fsync'd."""
+    if not hasattr(os, "open"):
+        with open(path, "wb") as f:
+            f.write(data)
+        return
+
+    fd = os.open(path, _WRITE_FLAGS | getattr(os, "O_TRUNC", 0), 0o644)
+    try:
+        _write_all(fd, [data])
+        if sync and _HAS_FSYNC:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=1024)
+def _join(base: str, key: str) -> str:
+    """Join a storage root and key (cached; keys repeat across calls)."""
+    return base + "/" + key
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """Copy a file, in the kernel via sendfile where supported."""
+    if _HAS_SENDFILE:
+        in_fd = os.open(src, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            out_fd = os.open(dst, _WRITE_FLAGS | getattr(os, "O_TRUNC", 0), 0o644)
+            try:
+                offset = 0
+                size = os.fstat(in_fd).st_size
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # Some filesystems don't support sendfile; copy below
+                pass
+            finally:
+                os.close(out_fd)
+        finally:
+            os.close(in_fd)
+
+    buf = bytearray(_COPY_CHUNK)
+    view = memoryview(buf)
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        while True:
+            n = fin.readinto(buf)
+            if not n:
+                break
+            fout.write(view[:n])
+
+
+def _move_file(src: str, dst: str) -> None:
+    """Move a file, renaming when possible and copying across devices."""
+    try:
+        os.rename(src, dst)
+        return
+    except OSError:
+        # Different filesystem (or an existing target on Windows)
+        pass
+    _copy_file(src, dst)
+    os.remove(src)
+
+
+def _close_handles(handles: Dict[str, Any]) -> None:
+    """Close and forget every handle in a path -> handle map."""
+    while handles:
+        _, handle = handles.popitem()
+        try:
+            _close_handle(handle)
+        except OSError:
+            pass
+
 
 class Storage:
     """
@@ -35,7 +189,7 @@ class Storage:
 
     def _full_path(self, key: str) -> str:
         """Get full path for a key."""
-        return f"{self._base_path}/{key}"
+        return _join(self._base_path, key)
 
     def save(self, key: str, data: Any) -> bool:
         """
@@ -50,11 +204,11 @@ class Storage:
         """
         try:
             path = self._full_path(key)
-            with open(path, "w") as f:
-                json.dump(data, f)
+            with open(path, "wb") as f:
+                f.write(dumpb(data))
             return True
         except Exception as e:
-            print(f"Storage save error: {e}")
+            logger.error("Storage save error: %s", e)
             return False
 
     def load(self, key: str, default: Any = None) -> Any:
@@ -70,12 +224,12 @@ class Storage:
         """
         try:
             path = self._full_path(key)
-            with open(path, "r") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                return loads(f.read())
         except (FileNotFoundError, OSError):
             return default
         except Exception as e:
-            print(f"Storage load error: {e}")
+            logger.error("Storage load error: %s", e)
             return default
 
     def delete(self, key: str) -> bool:
@@ -127,8 +281,42 @@ class FileStorage(Storage):
 
     Extends Storage with methods for reading/writing raw files,
     binary data, and directory management.
+
+    Files written with append_text stay open between calls (up to
+    APPEND_HANDLES of them). They are closed by close(), at the end of
+    a with block, or when the storage is garbage collected.
     """
 
+    def __init__(self, base_path: str = "."):
+        super().__init__(base_path)
+        # Full path -> handle from _open_append, oldest first
+        self._appenders: Dict[str, Any] = {}
+        if _finalize is not None:
+            _finalize(self, _close_handles, self._appenders)
+
+    def _release(self, full_path: str) -> None:
+        """Close the cached append handle for a path, if any."""
+        handle = self._appenders.pop(full_path, None)
+        if handle is not None:
+            try:
+                _close_handle(handle)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Close the files kept open by append_text."""
+        _close_handles(self._appenders)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def delete(self, key: str) -> bool:
+        self._release(self._full_path(key))
+        return super().delete(key)
+
     def write_text(self, path: str, content: str) -> bool:
         """Write text content to a file."""
         try:
@@ -137,7 +325,7 @@ class FileStorage(Storage):
                 f.write(content)
             return True
         except Exception as e:
-            print(f"FileStorage write error: {e}")
+            logger.error("FileStorage write error: %s", e)
             return False
 
     def read_text(self, path: str) -> Optional[str]:
@@ -149,15 +337,20 @@ class FileStorage(Storage):
         except (FileNotFoundError, OSError):
             return None
 
-    def write_bytes(self, path: str, data: bytes) -> bool:
-        """Write binary data to a file."""
+    def write_bytes(self, path: str, data: bytes, sync: bool = False) -> bool:
+        """
+        Write binary data to a file.
+
+        Args:
+            path: File path relative to the storage root
+            data: Bytes to write
+            sync: Force the data to stable storage before returning
+        """
         try:
-            full_path = self._full_path(path)
-            with open(full_path, "wb") as f:
-                f.write(data)
+            _write_file(self._full_path(path), data, sync=sync)
             return True
         except Exception as e:
-            print(f"FileStorage write_bytes error: {e}")
+            logger.error("FileStorage write_bytes error: %s", e)
             return False
 
     def read_bytes(self, path: str) -> Optional[bytes]:
@@ -170,14 +363,22 @@ class FileStorage(Storage):
             return None
 
     def append_text(self, path: str, content: str) -> bool:
-        """Append text to a file."""
+        """Append text to a file, reusing its handle across calls."""
+        full_path = self._full_path(path)
         try:
-            full_path = self._full_path(path)
-            with open(full_path, "a") as f:
-                f.write(content)
+            handle = self._appenders.get(full_path)
+            if handle is None:
+                if len(self._appenders) >= APPEND_HANDLES:
+                    self._release(next(iter(self._appenders)))
+                handle = self._appenders[full_path] = _open_append(full_path)
+            _write_all(handle, [content.encode("utf-8")])
+            if not isinstance(handle, int):
+                # Buffered file object (MicroPython); keep reads consistent
+                handle.flush()
             return True
         except Exception as e:
-            print(f"FileStorage append error: {e}")
+            self._release(full_path)
+            logger.error("FileStorage append error: %s", e)
             return False
 
     def file_size(self, path: str) -> int:
@@ -188,6 +389,26 @@ class FileStorage(Storage):
         except (FileNotFoundError, OSError):
             return 0
 
+    def copy(self, src: str, dst: str) -> bool:
+        """Copy a file within the storage root."""
+        try:
+            _copy_file(self._full_path(src), self._full_path(dst))
+            return True
+        except Exception as e:
+            logger.error("FileStorage copy error: %s", e)
+            return False
+
+    def move(self, src: str, dst: str) -> bool:
+        """Move a file within the storage root (e.g. a rotated log)."""
+        try:
+            self._release(self._full_path(src))
+            self._release(self._full_path(dst))
+            _move_file(self._full_path(src), self._full_path(dst))
+            return True
+        except Exception as e:
+            logger.error("FileStorage move error: %s", e)
+            return False
+
     def mkdir(self, path: str) -> bool:
         """Create a directory."""
         try:
@@ -198,3 +419,89 @@ class FileStorage(Storage):
 
     def __repr__(self) -> str:
         return f"<FileStorage path={self._base_path}>"
+
+
+class SQLiteStorage(Storage):
+    """
+    Key-value storage in a single SQLite database (CPython only).
+
+    All keys live in one file opened in WAL mode, so saving many keys
+    costs one transaction (see batch_save) rather than one file
+    rewrite per key. Values are stored as JSON, as with Storage.
+
+    Example:
+        storage = SQLiteStorage("data")
+        storage.batch_save({"ssid": "MyNetwork", "interval": 60})
+        print(storage.load("ssid"))
+    """
+
+    def __init__(self, base_path: str = ".", filename: str = "storage.db"):
+        if sqlite3 is None:
+            raise ImportError("SQLiteStorage requires the sqlite3 module")
+        super().__init__(base_path)
+        # One connection for the instance; sqlite3 calls are serialized
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(_join(base_path, filename), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v BLOB)")
+        self._db.commit()
+
+    def save(self, key: str, data: Any) -> bool:
+        return self.batch_save({key: data})
+
+    def batch_save(self, items: Dict[str, Any]) -> bool:
+        """
+        Save several keys in one transaction.
+
+        Args:
+            items: Mapping of storage keys to data (JSON-serialized)
+
+        Returns:
+            True if all were saved
+        """
+        try:
+            rows = [(key, dumpb(data)) for key, data in items.items()]
+            with self._lock, self._db:
+                self._db.executemany("INSERT OR REPLACE INTO kv (k, v) VALUES (?, ?)", rows)
+            return True
+        except Exception as e:
+            logger.error("Storage save error: %s", e)
+            return False
+
+    def load(self, key: str, default: Any = None) -> Any:
+        try:
+            with self._lock:
+                row = self._db.execute("SELECT v FROM kv WHERE k = ?", (key,)).fetchone()
+            return loads(row[0]) if row is not None else default
+        except Exception as e:
+            logger.error("Storage load error: %s", e)
+            return default
+
+    def delete(self, key: str) -> bool:
+        try:
+            with self._lock, self._db:
+                return self._db.execute("DELETE FROM kv WHERE k = ?", (key,)).rowcount > 0
+        except Exception as e:
+            logger.error("Storage delete error: %s", e)
+            return False
+
+    def exists(self, key: str) -> bool:
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM kv WHERE k = ? LIMIT 1", (key,)).fetchone() is not None
+
+    def list_keys(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT k FROM kv")]
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM kv")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __repr__(self) -> str:
+        return f"<SQLiteStorage path={self._base_path}>"
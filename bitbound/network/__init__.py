@@ -5,10 +5,25 @@ Provides WiFi, MQTT, HTTP, and WebSocket abstractions
 for MicroPython and desktop simulation.
 """
 
-from .wifi import WiFiManager
-from .mqtt import MQTTClient
-from .http import HTTPClient, HTTPServer
-from .websocket import WebSocketClient
+# Each client is imported on first access, so using one (e.g. WiFi)
+# doesn't load the others' sockets, threads and protocol code.
+_LAZY_EXPORTS = {
+    "WiFiManager": "wifi",
+    "MQTTClient": "mqtt",
+    "HTTPClient": "http",
+    "HTTPServer": "http",
+    "WebSocketClient": "websocket",
+}
+
+
+def __getattr__(name):
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = __import__(f"{__name__}.{submodule}", None, None, [name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "WiFiManager",
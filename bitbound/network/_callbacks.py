@@ -0,0 +1,57 @@
+"""
+Callback hand-off for BitBound network clients.
+
+Lets receive threads pass user callbacks to a worker so a slow
+callback doesn't stall reading the next message.
+"""
+
+import threading
+from typing import Callable, Optional
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # MicroPython: callbacks run inline on the receive thread
+    ThreadPoolExecutor = None
+
+
+class CallbackWorker:
+    """
+    Run callbacks off the I/O thread, in the order they were submitted.
+
+    A single worker keeps message order intact. The thread is started
+    on first use (again after shutdown(), e.g. on reconnect); without
+    thread pools callbacks run inline.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args) -> None:
+        """Schedule fn(*args) on the worker."""
+        if ThreadPoolExecutor is None:
+            fn(*args)
+            return
+
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix=self._name
+                    )
+                executor = self._executor
+        try:
+            executor.submit(fn, *args)
+        except RuntimeError:
+            # Shut down while submitting
+            fn(*args)
+
+    def shutdown(self) -> None:
+        """Stop the worker; callbacks already queued still run."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
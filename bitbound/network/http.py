@@ -5,40 +5,245 @@ Provides simple HTTP client for API calls and a minimal HTTP server
 for device dashboards.
 """
 
-import json
 import threading
-from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from .._json import dumpb, loads
+
+
+def _header_prefix(content_type: str) -> bytes:
+    return (
+        "HTTP/1.1 200 OK\r\n"
+        f"Content-Type: {content_type}\r\n"
+        "Connection: close\r\n"
+        "Content-Length: "
+    ).encode()
+
+
+# Response heads are fixed per content type; only the length varies
+_JSON_PREFIX = _header_prefix("application/json")
+_HTML_PREFIX = _header_prefix("text/html")
+_TEXT_PREFIX = _header_prefix("text/plain")
+
+def _parse_request_line(raw: bytes) -> Tuple[str, str]:
+    """Extract method and path by scanning the first line in place."""
+    end = raw.find(b"\r\n")
+    if end < 0:
+        end = len(raw)
+    sp1 = raw.find(b" ", 0, end)
+    if sp1 < 0:
+        return raw[:end].decode("latin-1"), "/"
+    sp2 = raw.find(b" ", sp1 + 1, end)
+    if sp2 < 0:
+        sp2 = end
+    query = raw.find(b"?", sp1 + 1, sp2)
+    path_end = sp2 if query < 0 else query
+    return raw[:sp1].decode("latin-1"), raw[sp1 + 1:path_end].decode("utf-8")
+
+
+def _compile_route(path: str) -> Tuple[str, ...]:
+    """Split a "/user/{id}" route into segments; "{name}" ones capture."""
+    return tuple(path.strip("/").split("/"))
+
+
+def _match_route(segments: Tuple[str, ...], parts: List[str]) -> Optional[Dict[str, str]]:
+    """Match split request path parts against route segments."""
+    if len(segments) != len(parts):
+        return None
+    params = {}
+    for seg, part in zip(segments, parts):
+        if seg[:1] == "{" and seg[-1:] == "}":
+            if not part:
+                return None
+            params[seg[1:-1]] = part
+        elif seg != part:
+            return None
+    return params
+
+
+class _Request(dict):
+    """Request passed to route handlers; "raw" is decoded on first use."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, method: str, path: str, data: bytes):
+        super().__init__(method=method, path=path)
+        self._data = data
+
+    def __missing__(self, key: str) -> Any:
+        if key != "raw":
+            raise KeyError(key)
+        value = self["raw"] = bytes(self._data).decode("utf-8", "replace")
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key == "raw" or dict.__contains__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+# Largest request head the server reads
+REQUEST_BUFFER_SIZE = 4096
+
+
+class _BufferPool:
+    """Thread-safe free list of fixed-size receive buffers."""
+
+    def __init__(self, size: int, limit: int = 8):
+        self._size = size
+        self._limit = limit
+        self._free: List[bytearray] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bytearray:
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return bytearray(self._size)
+
+    def release(self, buf: bytearray) -> None:
+        with self._lock:
+            if len(self._free) < self._limit:
+                self._free.append(buf)
+
+
+_recv_pool = _BufferPool(REQUEST_BUFFER_SIZE)
+
+# Probed once per process; see _http_backend / _has_sockets
+_client_backend: Optional[str] = None
+_server_sockets: Optional[bool] = None
+
+
+def _http_backend() -> str:
+    """Name of the HTTP client library to use (probed on first call)."""
+    global _client_backend
+    if _client_backend is None:
+        try:
+            import urequests
+            _client_backend = "urequests"
+        except ImportError:
+            try:
+                import requests
+                _client_backend = "requests"
+            except ImportError:
+                try:
+                    import urllib.request
+                    _client_backend = "urllib"
+                except ImportError:
+                    _client_backend = "simulation"
+    return _client_backend
+
+
+def _has_sockets() -> bool:
+    """Whether a socket module is available (probed on first call)."""
+    global _server_sockets
+    if _server_sockets is None:
+        try:
+            import usocket
+            _server_sockets = True
+        except ImportError:
+            try:
+                import socket
+                _server_sockets = True
+            except ImportError:
+                _server_sockets = False
+    return _server_sockets
+
+
+class _Connection:
+    """Per-client state for the selector loop."""
+
+    __slots__ = ("buf", "filled", "out")
+
+    def __init__(self, buf: bytearray):
+        self.buf = buf
+        self.filled = 0
+        # Unsent part of the response once the request is handled
+        self.out: Optional[memoryview] = None
+
+_NOT_FOUND_RESPONSE = (
+    b"HTTP/1.1 404 Not Found\r\nContent-Length: 9\r\n"
+    b"Connection: close\r\n\r\nNot Found"
+)
+_NO_CONTENT_RESPONSE = (
+    b"HTTP/1.1 204 No Content\r\nContent-Length: 0\r\n"
+    b"Connection: close\r\n\r\n"
+)
+_ERROR_RESPONSE = (
+    b"HTTP/1.1 500 Internal Server Error\r\nContent-Length: 0\r\n"
+    b"Connection: close\r\n\r\n"
+)
+
+
+_UNSET = object()
+
 
-@dataclass
 class HTTPResponse:
-    """HTTP response object."""
-    status_code: int = 200
-    headers: Dict[str, str] = None
-    body: bytes = b""
-    text: str = ""
-    json_data: Any = None
-
-    def __post_init__(self):
-        if self.headers is None:
-            self.headers = {}
-        if self.body and not self.text:
+    """
+    HTTP response object.
+
+    ``text`` and ``json_data`` are decoded from ``body`` on first access
+    and cached, so responses that are only checked for status or read as
+    bytes never pay for decoding.
+    """
+
+    __slots__ = ("status_code", "headers", "body", "_text", "_json")
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        body: bytes = b"",
+        text: str = "",
+        json_data: Any = None,
+    ):
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+        self.body = body
+        self._text = text or None
+        self._json = json_data if json_data is not None else _UNSET
+
+    @property
+    def text(self) -> str:
+        """Body decoded as UTF-8 ("" if it isn't valid UTF-8)."""
+        if self._text is None:
             try:
-                self.text = self.body.decode("utf-8")
+                self._text = self.body.decode("utf-8") if self.body else ""
             except Exception:
-                pass
-        if self.text and self.json_data is None:
+                self._text = ""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+
+    @property
+    def json_data(self) -> Any:
+        """Parsed JSON body, or None if the body isn't JSON."""
+        if self._json is _UNSET:
             try:
-                self.json_data = json.loads(self.text)
-            except (json.JSONDecodeError, ValueError):
-                pass
+                source = self.body or self.text
+                self._json = loads(source) if source else None
+            except ValueError:
+                self._json = None
+        return self._json
+
+    @json_data.setter
+    def json_data(self, value: Any) -> None:
+        self._json = value
 
     def json(self) -> Any:
         """Parse response body as JSON."""
         if self.json_data is not None:
             return self.json_data
-        return json.loads(self.text)
+        return loads(self.body or self.text)
+
+    def __repr__(self) -> str:
+        return f"HTTPResponse(status_code={self.status_code}, body={len(self.body)} bytes)"
 
 
 class HTTPClient:
@@ -61,28 +266,16 @@ class HTTPClient:
         self._default_headers = headers or {}
         self._simulation = True
         self._sim_responses: Dict[str, HTTPResponse] = {}
+        # Reused across requests so connections (and TLS sessions) persist
+        self._session = None
+        self._opener = None
 
         self._detect_backend()
 
     def _detect_backend(self) -> None:
         """Detect available HTTP backend."""
-        try:
-            import urequests
-            self._backend = "urequests"
-            self._simulation = False
-        except ImportError:
-            try:
-                import requests
-                self._backend = "requests"
-                self._simulation = False
-            except ImportError:
-                try:
-                    import urllib.request
-                    self._backend = "urllib"
-                    self._simulation = False
-                except ImportError:
-                    self._backend = "simulation"
-                    self._simulation = True
+        self._backend = _http_backend()
+        self._simulation = self._backend == "simulation"
 
     def request(
         self,
@@ -111,7 +304,7 @@ class HTTPClient:
         timeout = timeout or self._timeout
 
         if json_data is not None:
-            data = json.dumps(json_data).encode("utf-8")
+            data = dumpb(json_data)
             all_headers.setdefault("Content-Type", "application/json")
 
         if self._simulation:
@@ -131,32 +324,43 @@ class HTTPClient:
         """MicroPython urequests backend."""
         import urequests
         resp = urequests.request(method, url, headers=headers, data=data)
-        result = HTTPResponse(
-            status_code=resp.status_code,
-            body=resp.content,
-            text=resp.text,
-        )
+        result = HTTPResponse(status_code=resp.status_code, body=resp.content)
         resp.close()
         return result
 
+    def _requests_session(self):
+        """Get the keep-alive requests session, creating it on first use."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
     def _requests_request(self, method, url, headers, data, timeout) -> HTTPResponse:
         """Python requests backend."""
-        import requests
-        resp = requests.request(method, url, headers=headers, data=data, timeout=timeout)
+        resp = self._requests_session().request(
+            method, url, headers=headers, data=data, timeout=timeout
+        )
         return HTTPResponse(
             status_code=resp.status_code,
             headers=dict(resp.headers),
             body=resp.content,
-            text=resp.text,
         )
 
     def _urllib_request(self, method, url, headers, data, timeout) -> HTTPResponse:
         """Python urllib backend."""
+        import urllib.error
         import urllib.request
+        if self._opener is None:
+            self._opener = urllib.request.build_opener()
         req = urllib.request.Request(url, data=data, headers=headers, method=method)
         try:
-            resp = urllib.request.urlopen(req, timeout=timeout)
-            body = resp.read()
+            with self._opener.open(req, timeout=timeout) as resp:
+                body = resp.read()
             return HTTPResponse(
                 status_code=resp.status,
                 headers=dict(resp.headers),
@@ -192,6 +396,40 @@ class HTTPClient:
         """Send a DELETE request."""
         return self.request("DELETE", url, **kwargs)
 
+    async def get_many(self, urls: List[str], **kwargs) -> List[HTTPResponse]:
+        """
+        Send GET requests to several URLs concurrently.
+
+        Requests run on the event loop's default executor and share the
+        client's pooled keep-alive connections, so slow servers overlap
+        instead of being waited on one after another. In simulation, or
+        without an executor (e.g. uasyncio), they run in turn.
+
+        Returns:
+            Responses in the order of ``urls``
+        """
+        loop = None
+        if not self._simulation and len(urls) > 1:
+            try:
+                import asyncio
+                loop = asyncio.get_running_loop()
+            except (ImportError, AttributeError, RuntimeError):
+                pass
+
+        if loop is None or not hasattr(loop, "run_in_executor"):
+            return [self.get(url, **kwargs) for url in urls]
+        return list(await asyncio.gather(*[
+            loop.run_in_executor(None, lambda url=url: self.get(url, **kwargs))
+            for url in urls
+        ]))
+
+    def close(self) -> None:
+        """Close pooled connections held by the client."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self._opener = None
+
     def __repr__(self) -> str:
         return f"<HTTPClient backend={self._backend}>"
 
@@ -215,40 +453,36 @@ class HTTPServer:
     def __init__(self, host: str = "0.0.0.0", port: int = 80):
         self._host = host
         self._port = port
+        # method -> path -> handler, for routes without "{param}"
         self._routes: Dict[str, Dict[str, Callable]] = {}
+        # method -> [(segments, handler)], tried only when no exact path matches
+        self._patterns: Dict[str, List[Tuple[Tuple[str, ...], Callable]]] = {}
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._simulation = True
         self._socket = None
+        self._wakeup = None
+        # (level, option) for TCP_NODELAY on accepted clients, if supported
+        self._nodelay = None
 
         self._detect_backend()
 
     def _detect_backend(self) -> None:
         """Detect available socket backend."""
-        try:
-            import usocket
-            self._simulation = False
-        except ImportError:
-            try:
-                import socket
-                self._simulation = False
-            except ImportError:
-                self._simulation = True
+        self._simulation = not _has_sockets()
 
     def route(self, path: str, methods: List[str] = None):
         """
         Decorator to register a route handler.
 
         Args:
-            path: URL path
+            path: URL path; "{name}" segments are captured into
+                request["params"] (e.g. "/api/sensors/{id}")
             methods: Allowed HTTP methods (default: ["GET"])
         """
-        methods = methods or ["GET"]
 
         def decorator(func):
-            for method in methods:
-                key = f"{method.upper()}:{path}"
-                self._routes[key] = func
+            self.add_route(path, func, methods)
             return func
 
         return decorator
@@ -256,8 +490,16 @@ class HTTPServer:
     def add_route(self, path: str, handler: Callable, methods: List[str] = None) -> None:
         """Register a route handler programmatically."""
         methods = methods or ["GET"]
+        if "{" not in path:
+            for method in methods:
+                self._routes.setdefault(method.upper(), {})[path] = handler
+            return
+
+        segments = _compile_route(path)
         for method in methods:
-            self._routes[f"{method.upper()}:{path}"] = handler
+            patterns = self._patterns.setdefault(method.upper(), [])
+            patterns[:] = [p for p in patterns if p[0] != segments]
+            patterns.append((segments, handler))
 
     def start(self, background: bool = True) -> None:
         """
@@ -281,6 +523,12 @@ class HTTPServer:
     def stop(self) -> None:
         """Stop the HTTP server."""
         self._running = False
+        if self._wakeup:
+            # Wake the selector so the loop sees _running immediately
+            try:
+                self._wakeup.send(b"\0")
+            except Exception:
+                pass
         if self._socket:
             try:
                 self._socket.close()
@@ -291,6 +539,152 @@ class HTTPServer:
 
     def _serve(self) -> None:
         """Main server loop."""
+        try:
+            import selectors
+            import socket
+        except ImportError:
+            # MicroPython: blocking accept with a timeout
+            self._serve_polling()
+            return
+        self._serve_selector(selectors, socket)
+
+    def _serve_selector(self, selectors, socket_mod) -> None:
+        """
+        Event-driven server loop (epoll/kqueue where available).
+
+        Accepts every pending connection per wakeup, and reads requests
+        and drains responses for many clients concurrently without
+        blocking, so a slow client doesn't hold up the others. stop()
+        wakes the loop through a socket pair instead of the loop polling
+        on a timeout.
+        """
+        selector = selectors.DefaultSelector()
+        wake_r = None
+        try:
+            self._socket = socket_mod.socket()
+            self._socket.setsockopt(socket_mod.SOL_SOCKET, socket_mod.SO_REUSEADDR, 1)
+            if hasattr(socket_mod, "TCP_NODELAY"):
+                self._nodelay = (socket_mod.IPPROTO_TCP, socket_mod.TCP_NODELAY)
+            if hasattr(socket_mod, "TCP_DEFER_ACCEPT"):
+                # Linux: only report a connection once its request has arrived
+                try:
+                    self._socket.setsockopt(socket_mod.IPPROTO_TCP, socket_mod.TCP_DEFER_ACCEPT, 1)
+                except OSError:
+                    pass
+            self._socket.bind((self._host, self._port))
+            self._socket.listen(64)
+            self._socket.setblocking(False)
+            selector.register(self._socket, selectors.EVENT_READ)
+
+            wake_r, self._wakeup = socket_mod.socketpair()
+            wake_r.setblocking(False)
+            selector.register(wake_r, selectors.EVENT_READ)
+
+            while self._running:
+                # The timeout only backs up a wakeup sent before it existed
+                for key, _ in selector.select(timeout=5.0):
+                    sock = key.fileobj
+                    if sock is wake_r:
+                        try:
+                            wake_r.recv(64)
+                        except OSError:
+                            pass
+                    elif sock is self._socket:
+                        self._accept_pending(selector, selectors.EVENT_READ, selectors.EVENT_WRITE)
+                    elif key.data.out is None:
+                        self._read_client(selector, sock, key.data, selectors.EVENT_WRITE)
+                    else:
+                        self._write_client(selector, sock, key.data)
+
+        except Exception as e:
+            if self._running:
+                print(f"Server fatal error: {e}")
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.fileobj not in (self._socket, wake_r):
+                    key.fileobj.close()
+            selector.close()
+            for sock in (self._socket, wake_r, self._wakeup):
+                if sock:
+                    try:
+                        sock.close()
+                    except Exception:
+                        pass
+            self._wakeup = None
+
+    def _accept_pending(self, selector, event_read, event_write) -> None:
+        """
+        Accept every queued connection and serve what has already arrived.
+
+        The request usually lands with (or, under TCP_DEFER_ACCEPT,
+        before) the connection, so it is read right away instead of
+        waiting for another select round; clients that haven't sent yet
+        stay registered for data.
+        """
+        while True:
+            try:
+                client, _ = self._socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            client.setblocking(False)
+            if self._nodelay:
+                # Responses go out in one write; don't hold the tail for Nagle
+                try:
+                    client.setsockopt(*self._nodelay, 1)
+                except OSError:
+                    pass
+            conn = _Connection(_recv_pool.acquire())
+            selector.register(client, event_read, conn)
+            self._read_client(selector, client, conn, event_write)
+
+    def _read_client(self, selector, client, conn: _Connection, event_write) -> None:
+        """Buffer request bytes; respond once the headers are complete."""
+        buf = conn.buf
+        try:
+            n = client.recv_into(memoryview(buf)[conn.filled:])
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            n = 0
+
+        filled = conn.filled = conn.filled + n
+        if n and filled < len(buf) and buf.find(b"\r\n\r\n", 0, filled) < 0:
+            return
+
+        response = None
+        try:
+            if filled:
+                response = self._render(buf[:filled])
+        except Exception as e:
+            print(f"Client handling error: {e}")
+        finally:
+            _recv_pool.release(buf)
+            conn.buf = None
+
+        if response is None:
+            selector.unregister(client)
+            client.close()
+            return
+
+        # Send what the socket takes now; wait for writability for the rest
+        conn.out = memoryview(response)
+        selector.modify(client, event_write, conn)
+        self._write_client(selector, client, conn)
+
+    def _write_client(self, selector, client, conn: _Connection) -> None:
+        """Send as much of the pending response as the socket accepts."""
+        try:
+            conn.out = conn.out[client.send(conn.out):]
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            conn.out = conn.out[:0]
+        if not conn.out:
+            selector.unregister(client)
+            client.close()
+
+    def _serve_polling(self) -> None:
+        """Blocking server loop for ports without selectors."""
         try:
             try:
                 import usocket as socket_mod
@@ -320,46 +714,67 @@ class HTTPServer:
 
     def _handle_client(self, client) -> None:
         """Handle an incoming client connection."""
+        buf = _recv_pool.acquire()
         try:
-            request_data = client.recv(4096).decode("utf-8")
-            if not request_data:
-                return
-
-            lines = request_data.split("\r\n")
-            request_line = lines[0].split(" ")
-            method = request_line[0]
-            path = request_line[1].split("?")[0] if len(request_line) > 1 else "/"
-
-            key = f"{method}:{path}"
-            handler = self._routes.get(key)
-
-            if handler:
-                result = handler({"method": method, "path": path, "raw": request_data})
-                if isinstance(result, dict):
-                    body = json.dumps(result)
-                    content_type = "application/json"
-                elif isinstance(result, str):
-                    body = result
-                    content_type = "text/html"
-                else:
-                    body = str(result)
-                    content_type = "text/plain"
-
-                response = (
-                    f"HTTP/1.1 200 OK\r\n"
-                    f"Content-Type: {content_type}\r\n"
-                    f"Content-Length: {len(body)}\r\n"
-                    f"Connection: close\r\n\r\n{body}"
-                )
+            if hasattr(client, "recv_into"):
+                request_data = buf[:client.recv_into(buf)]
             else:
-                response = "HTTP/1.1 404 Not Found\r\nContent-Length: 9\r\nConnection: close\r\n\r\nNot Found"
-
-            client.send(response.encode("utf-8"))
+                request_data = client.recv(REQUEST_BUFFER_SIZE)
+            if request_data:
+                self._respond(client, request_data)
         except Exception as e:
             print(f"Client handling error: {e}")
         finally:
+            _recv_pool.release(buf)
             client.close()
 
+    def _respond(self, client, request_data) -> None:
+        """Route a request and send the response."""
+        client.sendall(self._render(request_data))
+
+    def _render(self, request_data) -> bytes:
+        """Route a request and build the full response."""
+        method, path = _parse_request_line(request_data)
+        by_method = self._routes.get(method)
+        handler = by_method.get(path) if by_method else None
+        params = None
+
+        if not handler:
+            patterns = self._patterns.get(method)
+            if patterns:
+                parts = path.strip("/").split("/")
+                for segments, func in patterns:
+                    params = _match_route(segments, parts)
+                    if params is not None:
+                        handler = func
+                        break
+            if not handler:
+                return _NOT_FOUND_RESPONSE
+
+        try:
+            request = _Request(method, path, request_data)
+            if params is not None:
+                request["params"] = params
+            result = handler(request)
+        except Exception as e:
+            print(f"Route handler error: {e}")
+            return _ERROR_RESPONSE
+
+        if result is None:
+            return _NO_CONTENT_RESPONSE
+        if isinstance(result, dict):
+            body = dumpb(result)
+            prefix = _JSON_PREFIX
+        elif isinstance(result, str):
+            body = result.encode("utf-8")
+            prefix = _HTML_PREFIX
+        else:
+            body = str(result).encode("utf-8")
+            prefix = _TEXT_PREFIX
+
+        # One allocation for the whole response; the body is never re-encoded
+        return b"".join((prefix, str(len(body)).encode(), b"\r\n\r\n", body))
+
     @property
     def is_running(self) -> bool:
         return self._running
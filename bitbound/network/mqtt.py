@@ -6,9 +6,128 @@ Provides a simple MQTT publish/subscribe interface for IoT communication.
 
 import time
 import threading
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from .._json import dumpb
+from ._callbacks import CallbackWorker
+
+try:
+    import re
+except ImportError:
+    re = None
+
+# Max topics kept in the str <-> bytes caches before they are reset
+TOPIC_CACHE_SIZE = 256
+
+# Max simulated messages kept for `messages`; the oldest are dropped
+MESSAGE_QUEUE_SIZE = 10000
+
+# (name, client factory) once probed; see _mqtt_backend
+_backend: Optional[Tuple[Optional[str], Any]] = None
+
+
+def _mqtt_backend() -> Tuple[Optional[str], Any]:
+    """
+    Find the MQTT library to use, probing imports once per process.
+
+    Returns ("umqtt", MQTTClient class), ("paho", paho.mqtt.client)
+    or (None, None) for simulation.
+    """
+    global _backend
+    if _backend is None:
+        try:
+            from umqtt.simple import MQTTClient as uMQTT
+            _backend = ("umqtt", uMQTT)
+        except ImportError:
+            try:
+                import paho.mqtt.client as paho
+                _backend = ("paho", paho)
+            except ImportError:
+                _backend = (None, None)
+    return _backend
+
+
+def _compile_topic(pattern: str) -> Optional[Callable[[str], Any]]:
+    """
+    Compile a wildcard subscription into a single regex match.
+
+    ``+`` matches one level (possibly empty) and ``#`` matches the
+    parent level and everything below it. Returns None if the regex
+    engine can't handle the translation (e.g. MicroPython's re).
+    """
+    if re is None or not hasattr(re, "escape"):
+        return None
+    parts = []
+    tail = ""
+    for i, level in enumerate(pattern.split("/")):
+        if level == "#":
+            tail = ".*" if i == 0 else "(?:/.*)?"
+            break
+        parts.append("[^/]*" if level == "+" else re.escape(level))
+    try:
+        return re.compile("/".join(parts) + tail + r"\Z", re.DOTALL).match
+    except Exception:
+        return None
+
+
+def _level_matcher(pattern: str) -> Callable[[str], bool]:
+    """
+    Match a wildcard subscription level by level.
+
+    Fallback for ports without a usable regex engine: the pattern is
+    split once, and topics are scanned in place with find/startswith
+    rather than split into a new list per message.
+    """
+    levels = tuple(pattern.split("/"))
+
+    def matches(topic: str) -> bool:
+        pos = 0
+        end = len(topic)
+        for level in levels:
+            if level == "#":
+                return True
+            if pos > end:
+                return False
+            stop = topic.find("/", pos)
+            if stop < 0:
+                stop = end
+            if level != "+" and (stop - pos != len(level) or not topic.startswith(level, pos)):
+                return False
+            pos = stop + 1
+        return pos == end + 1
+
+    return matches
+
+
+def _encode_payload(message: Any) -> Any:
+    """Turn a publish payload into bytes; bytes pass straight through."""
+    if message.__class__ is bytes:
+        return message
+    if isinstance(message, str):
+        return message.encode("utf-8")
+    if isinstance(message, (dict, list)):
+        # Compact JSON, encoded straight to bytes
+        return dumpb(message)
+    if isinstance(message, (int, float)):
+        return str(message).encode()
+    return message
+
+
+def _publish_packet(topic: bytes, payload: bytes, retain: bool) -> bytes:
+    """Encode a QoS 0 MQTT PUBLISH packet."""
+    remaining = 2 + len(topic) + len(payload)
+    header = bytearray((0x31 if retain else 0x30,))
+    while True:
+        digit = remaining & 0x7F
+        remaining >>= 7
+        header.append(digit | 0x80 if remaining else digit)
+        if not remaining:
+            break
+    header += len(topic).to_bytes(2, "big")
+    return bytes(header) + topic + payload
+
 
 @dataclass
 class MQTTConfig:
@@ -60,10 +179,23 @@ class MQTTClient:
         self._simulation = True
         self._connected = False
         self._subscriptions: Dict[str, List[Callable]] = {}
-        self._message_queue: List[Tuple[str, bytes]] = []
+        # Compiled matchers for wildcard subscriptions; exact topics are
+        # looked up in _subscriptions directly
+        self._matchers: Dict[str, Callable[[str], Any]] = {}
+        # Immutable (exact, wildcard) dispatch tables, replaced whole on
+        # (un)subscribe so delivery can read them without the lock
+        self._dispatch: Tuple[Dict[str, Tuple[Callable, ...]], Tuple[Any, ...]] = ({}, ())
+        # deque append/popleft are atomic, so the queue needs no lock
+        self._message_queue = deque((), MESSAGE_QUEUE_SIZE)
         self._lock = threading.Lock()
         self._poll_thread: Optional[threading.Thread] = None
         self._running = False
+        # umqtt takes bytes topics; paho and simulation take str
+        self._bytes_topics = False
+        self._topic_bytes: Dict[str, bytes] = {}
+        self._topic_strs: Dict[bytes, str] = {}
+        # paho's network thread hands deliveries off instead of running them
+        self._callbacks = CallbackWorker("mqtt-cb")
 
     def connect(self) -> bool:
         """
@@ -73,10 +205,11 @@ class MQTTClient:
             True if connected
         """
         try:
-            # Try MicroPython umqtt
-            try:
-                from umqtt.simple import MQTTClient as uMQTT
-                self._client = uMQTT(
+            backend, factory = _mqtt_backend()
+
+            # MicroPython umqtt
+            if backend == "umqtt":
+                self._client = factory(
                     self._config.client_id,
                     self._config.broker,
                     port=self._config.port,
@@ -99,19 +232,17 @@ class MQTTClient:
                 self._client.connect(clean_session=self._config.clean_session)
                 self._simulation = False
                 self._connected = True
+                self._bytes_topics = True
 
                 # Re-subscribe
                 for topic in self._subscriptions:
-                    self._client.subscribe(topic.encode(), self._config.qos)
+                    self._client.subscribe(self._encode_topic(topic), self._config.qos)
 
                 return True
-            except ImportError:
-                pass
 
-            # Try paho-mqtt (desktop)
-            try:
-                import paho.mqtt.client as paho
-                self._client = paho.Client(
+            # paho-mqtt (desktop)
+            if backend == "paho":
+                self._client = factory.Client(
                     client_id=self._config.client_id,
                     clean_session=self._config.clean_session,
                 )
@@ -133,8 +264,6 @@ class MQTTClient:
                 self._simulation = False
                 self._connected = True
                 return True
-            except ImportError:
-                pass
 
             # Simulation mode
             self._simulation = True
@@ -159,6 +288,7 @@ class MQTTClient:
             except Exception:
                 pass
         self._client = None
+        self._callbacks.shutdown()
 
     def publish(
         self,
@@ -172,7 +302,8 @@ class MQTTClient:
 
         Args:
             topic: MQTT topic
-            message: Message payload (str, bytes, int, float)
+            message: Message payload (str, bytes, int, float; dicts and
+                lists are sent as compact JSON)
             qos: Quality of Service (0, 1, 2)
             retain: Retain message on broker
 
@@ -182,20 +313,18 @@ class MQTTClient:
         qos = qos if qos is not None else self._config.qos
         retain = retain if retain is not None else self._config.retain
 
-        if isinstance(message, (int, float)):
-            message = str(message)
-        if isinstance(message, str):
-            message = message.encode("utf-8")
+        message = _encode_payload(message)
 
         if self._simulation:
-            with self._lock:
-                self._message_queue.append((topic, message))
+            self._message_queue.append((topic, message))
             # Deliver to local subscribers
             self._deliver_local(topic, message)
             return True
 
         try:
             if hasattr(self._client, "publish"):
+                if self._bytes_topics:
+                    topic = self._encode_topic(topic)
                 result = self._client.publish(topic, message, qos=qos, retain=retain)
                 if hasattr(result, "rc"):
                     return result.rc == 0
@@ -206,6 +335,55 @@ class MQTTClient:
 
         return False
 
+    def publish_many(
+        self,
+        topic_prefix: str,
+        fields: Dict[str, Any],
+        qos: Optional[int] = None,
+        retain: Optional[bool] = None
+    ) -> bool:
+        """
+        Publish each field as its own message under a common prefix.
+
+        With umqtt at QoS 0 the PUBLISH packets are encoded together and
+        sent in one socket write (umqtt's publish() writes each packet
+        in four pieces); otherwise this is one publish() per field.
+        The fast path writes to umqtt's internal ``sock`` attribute, so
+        it relies on umqtt.simple internals and falls back to publish()
+        when that attribute is missing.
+
+        Args:
+            topic_prefix: Prefix prepended to each key (e.g. "sensors/")
+            fields: Mapping of topic suffix to payload
+            qos: Quality of Service (0, 1, 2)
+            retain: Retain messages on broker
+
+        Returns:
+            True if every message was published
+        """
+        qos = qos if qos is not None else self._config.qos
+        retain = retain if retain is not None else self._config.retain
+
+        sock = getattr(self._client, "sock", None)
+        if self._simulation or not self._bytes_topics or qos or sock is None:
+            ok = True
+            for key, value in fields.items():
+                ok = self.publish(topic_prefix + key, value, qos=qos, retain=retain) and ok
+            return ok
+
+        try:
+            buf = bytearray()
+            for key, value in fields.items():
+                buf += _publish_packet(
+                    self._encode_topic(topic_prefix + key), _encode_payload(value), retain
+                )
+            write = getattr(sock, "write", None) or sock.sendall
+            write(buf)
+            return True
+        except Exception as e:
+            print(f"MQTT publish error: {e}")
+            return False
+
     def subscribe(
         self,
         topic: str,
@@ -225,12 +403,17 @@ class MQTTClient:
         with self._lock:
             if topic not in self._subscriptions:
                 self._subscriptions[topic] = []
+                if "+" in topic or "#" in topic:
+                    self._matchers[topic] = _compile_topic(topic) or _level_matcher(topic)
             self._subscriptions[topic].append(callback)
+            self._rebuild_dispatch()
 
         if not self._simulation and self._client and self._connected:
             try:
                 if hasattr(self._client, "subscribe"):
-                    self._client.subscribe(topic if isinstance(topic, str) else topic, qos)
+                    self._client.subscribe(
+                        self._encode_topic(topic) if self._bytes_topics else topic, qos
+                    )
             except Exception as e:
                 print(f"MQTT subscribe error: {e}")
 
@@ -238,50 +421,89 @@ class MQTTClient:
         """Unsubscribe from a topic."""
         with self._lock:
             self._subscriptions.pop(topic, None)
+            self._matchers.pop(topic, None)
+            self._rebuild_dispatch()
 
         if not self._simulation and self._client:
             try:
-                self._client.unsubscribe(topic)
+                self._client.unsubscribe(
+                    self._encode_topic(topic) if self._bytes_topics else topic
+                )
             except Exception:
                 pass
 
+    def _cache_topic(self, topic: str, raw: bytes) -> None:
+        if len(self._topic_bytes) >= TOPIC_CACHE_SIZE:
+            # Bounded: many unique topics just restart the cache
+            self._topic_bytes.clear()
+            self._topic_strs.clear()
+        self._topic_bytes[topic] = raw
+        self._topic_strs[raw] = topic
+
+    def _encode_topic(self, topic: str) -> bytes:
+        """Encode a topic, reusing the bytes from earlier calls."""
+        raw = self._topic_bytes.get(topic)
+        if raw is None:
+            raw = topic.encode("utf-8")
+            self._cache_topic(topic, raw)
+        return raw
+
+    def _decode_topic(self, raw: bytes) -> str:
+        """Decode a received topic, reusing the str from earlier calls."""
+        topic = self._topic_strs.get(raw)
+        if topic is None:
+            topic = raw.decode("utf-8")
+            self._cache_topic(topic, raw)
+        return topic
+
     def _topic_matches(self, pattern: str, topic: str) -> bool:
         """Check if a topic matches a subscription pattern."""
-        pattern_parts = pattern.split("/")
-        topic_parts = topic.split("/")
-
-        i = 0
-        for i, p in enumerate(pattern_parts):
-            if p == "#":
-                return True
-            if i >= len(topic_parts):
-                return False
-            if p != "+" and p != topic_parts[i]:
-                return False
-
-        return i + 1 == len(topic_parts)
+        if "+" not in pattern and "#" not in pattern:
+            return pattern == topic
+        # Reuse the matcher compiled at subscribe time when there is one
+        matches = self._matchers.get(pattern)
+        if matches is None:
+            matches = _compile_topic(pattern) or _level_matcher(pattern)
+        return bool(matches(topic))
+
+    def _rebuild_dispatch(self) -> None:
+        """Publish new dispatch tables (call with the lock held)."""
+        exact = {}
+        wildcard = []
+        for pattern, callbacks in self._subscriptions.items():
+            matches = self._matchers.get(pattern)
+            if matches is None:
+                exact[pattern] = tuple(callbacks)
+            else:
+                wildcard.append((matches, tuple(callbacks)))
+        self._dispatch = (exact, tuple(wildcard))
 
     def _deliver_local(self, topic: str, message: bytes) -> None:
         """Deliver message to matching local subscribers."""
-        with self._lock:
-            subs = dict(self._subscriptions)
+        exact, wildcard = self._dispatch
 
-        for pattern, callbacks in subs.items():
-            if self._topic_matches(pattern, topic):
+        for cb in exact.get(topic, ()):
+            self._invoke(cb, topic, message)
+        for matches, callbacks in wildcard:
+            if matches(topic):
                 for cb in callbacks:
-                    try:
-                        cb(topic, message)
-                    except Exception as e:
-                        print(f"MQTT callback error: {e}")
+                    self._invoke(cb, topic, message)
+
+    @staticmethod
+    def _invoke(cb: Callable, topic: str, message: bytes) -> None:
+        try:
+            cb(topic, message)
+        except Exception as e:
+            print(f"MQTT callback error: {e}")
 
     def _on_message(self, topic: bytes, message: bytes) -> None:
         """MicroPython umqtt callback."""
-        topic_str = topic.decode("utf-8") if isinstance(topic, bytes) else topic
+        topic_str = self._decode_topic(topic) if isinstance(topic, bytes) else topic
         self._deliver_local(topic_str, message)
 
     def _on_paho_message(self, client, userdata, msg) -> None:
         """Paho MQTT callback."""
-        self._deliver_local(msg.topic, msg.payload)
+        self._callbacks.submit(self._deliver_local, msg.topic, msg.payload)
 
     def _on_paho_connect(self, client, userdata, flags, rc) -> None:
         """Paho MQTT connect callback - resubscribe on reconnect."""
@@ -304,10 +526,14 @@ class MQTTClient:
     @property
     def messages(self) -> List[Tuple[str, bytes]]:
         """Get queued messages (simulation mode)."""
-        with self._lock:
-            msgs = list(self._message_queue)
-            self._message_queue.clear()
-            return msgs
+        queue = self._message_queue
+        msgs = []
+        try:
+            while True:
+                msgs.append(queue.popleft())
+        except IndexError:
+            pass
+        return msgs
 
     def __repr__(self) -> str:
         mode = "SIM" if self._simulation else "HW"
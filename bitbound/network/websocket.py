@@ -6,9 +6,46 @@ Provides WebSocket connectivity for real-time communication.
 
 import threading
 import time
-import json
 from typing import Any, Callable, Dict, List, Optional
 
+from .._json import dumps
+from ._callbacks import CallbackWorker
+
+try:
+    import select
+except ImportError:
+    try:
+        import uselect as select
+    except ImportError:
+        select = None
+
+# Upper bound on one readiness wait, so disconnect() is noticed promptly
+RECEIVE_POLL_MS = 1000
+
+# (name, module) once probed; see _ws_backend
+_backend = None
+
+
+def _ws_backend():
+    """
+    Find the WebSocket library to use, probing imports once per process.
+
+    Returns ("uwebsocket", module), ("websocket", module) or
+    (None, None) for simulation.
+    """
+    global _backend
+    if _backend is None:
+        try:
+            import uwebsocket
+            _backend = ("uwebsocket", uwebsocket)
+        except ImportError:
+            try:
+                import websocket
+                _backend = ("websocket", websocket)
+            except ImportError:
+                _backend = (None, None)
+    return _backend
+
 
 class WebSocketClient:
     """
@@ -36,6 +73,8 @@ class WebSocketClient:
         self._disconnect_callbacks: List[Callable] = []
         self._error_callbacks: List[Callable] = []
         self._sim_inbox: List[Any] = []
+        # Message callbacks from receive threads run here, not inline
+        self._callbacks = CallbackWorker("ws-cb")
         self._sim_outbox: List[Any] = []
 
     def connect(self) -> bool:
@@ -46,22 +85,20 @@ class WebSocketClient:
             True if connected
         """
         try:
-            # Try MicroPython
-            try:
-                import uwebsocket
-                self._ws = uwebsocket.connect(self._url)
+            backend, module = _ws_backend()
+
+            # MicroPython
+            if backend == "uwebsocket":
+                self._ws = module.connect(self._url)
                 self._simulation = False
                 self._connected = True
                 self._start_receiver()
                 self._fire_connect()
                 return True
-            except ImportError:
-                pass
 
-            # Try websocket-client (desktop)
-            try:
-                import websocket
-                self._ws = websocket.WebSocketApp(
+            # websocket-client (desktop)
+            if backend == "websocket":
+                self._ws = module.WebSocketApp(
                     self._url,
                     header=self._headers,
                     on_message=self._on_ws_message,
@@ -76,8 +113,6 @@ class WebSocketClient:
                 time.sleep(0.5)
                 self._connected = True
                 return True
-            except ImportError:
-                pass
 
             # Simulation mode
             self._simulation = True
@@ -101,6 +136,7 @@ class WebSocketClient:
             except Exception:
                 pass
         self._ws = None
+        self._callbacks.shutdown()
         self._fire_disconnect()
 
     def send(self, data: Any) -> bool:
@@ -117,7 +153,7 @@ class WebSocketClient:
             return False
 
         if isinstance(data, (dict, list)):
-            data = json.dumps(data)
+            data = dumps(data)
 
         if self._simulation:
             self._sim_outbox.append(data)
@@ -161,22 +197,61 @@ class WebSocketClient:
         self._thread = threading.Thread(target=self._receive_loop, daemon=True)
         self._thread.start()
 
+    def _receive_poller(self) -> Any:
+        """Return a poll object watching the socket, or None if unsupported."""
+        if select is None or not hasattr(select, "poll"):
+            return None
+        try:
+            poller = select.poll()
+            poller.register(self._ws, select.POLLIN)
+            return poller
+        except Exception:
+            return None
+
     def _receive_loop(self) -> None:
         """Receive loop for MicroPython WebSocket."""
+        ws = self._ws
+        if not hasattr(ws, "read"):
+            return
+        poller = self._receive_poller()
+        closed = getattr(select, "POLLHUP", 0) | getattr(select, "POLLERR", 0)
+
         while self._running:
             try:
-                if hasattr(self._ws, "read"):
-                    data = self._ws.read()
-                    if data:
-                        self._fire_message(data.decode("utf-8") if isinstance(data, bytes) else data)
+                if poller is not None:
+                    # Sleep in the kernel until a frame arrives
+                    events = poller.poll(RECEIVE_POLL_MS)
+                    if not events:
+                        continue
+                    if events[0][1] & closed:
+                        # Peer hung up
+                        self._running = False
+                        self._connected = False
+                        self._fire_disconnect()
+                        break
+                data = ws.read()
+                if data:
+                    self._callbacks.submit(
+                        self._fire_message,
+                        data.decode("utf-8") if isinstance(data, bytes) else data,
+                    )
+                elif poller is None:
+                    time.sleep(0.01)
+                elif data == b"":
+                    # Readable but empty: the peer closed (FIN without POLLHUP)
+                    self._running = False
+                    self._connected = False
+                    self._fire_disconnect()
+                    break
+                # None: only part of a frame has arrived; poll for the rest
             except Exception as e:
-                self._fire_error(e)
+                if self._running:
+                    self._fire_error(e)
                 break
-            time.sleep(0.01)
 
     def _on_ws_message(self, ws, message) -> None:
         """Websocket-client message callback."""
-        self._fire_message(message)
+        self._callbacks.submit(self._fire_message, message)
 
     def _on_ws_error(self, ws, error) -> None:
         """Websocket-client error callback."""
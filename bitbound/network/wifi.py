@@ -5,11 +5,48 @@ Provides a simple interface for WiFi connectivity on MicroPython
 and simulation on desktop.
 """
 
+import random
+import sys
+import threading
 import time
+from array import array
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
 
+try:
+    import ubinascii as binascii
+except ImportError:
+    import binascii
+
+# Scan cache clock; wall time is the fallback on ports without monotonic
+_monotonic = getattr(time, "monotonic", time.time)
+
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Seconds between radio scans in scan_if_due(); scanning while associated
+# adds latency to the link, so it's done rarely once connected
+SCAN_INTERVAL_CONNECTED = 60
+SCAN_INTERVAL_DISCONNECTED = 5
+
+# Upper bound in seconds on the jittered delay between reconnect attempts
+RECONNECT_BACKOFF_CAP = 60
+
+
+def _format_bssid(raw: bytes) -> str:
+    """Format raw BSSID bytes as "AA:BB:CC:DD:EE:FF" in one C call."""
+    try:
+        return binascii.hexlify(raw, ":").decode().upper()
+    except TypeError:
+        # Python 3.7's hexlify has no separator argument
+        return ":".join("%02X" % b for b in raw)
+
+
+def _bssid_bytes(bssid: str) -> bytes:
+    """Convert "AA:BB:CC:DD:EE:FF" to the 6 raw bytes WLAN.connect takes."""
+    return bytes(int(part, 16) for part in bssid.split(":"))
+
 
 class WiFiMode(Enum):
     """WiFi operating modes."""
@@ -29,7 +66,7 @@ class WiFiStatus(Enum):
     WRONG_PASSWORD = "wrong_password"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WiFiNetwork:
     """Represents a scanned WiFi network."""
     ssid: str
@@ -40,7 +77,7 @@ class WiFiNetwork:
     hidden: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WiFiConfig:
     """WiFi configuration."""
     ssid: str = ""
@@ -77,8 +114,21 @@ class WiFiManager:
         self._wlan = None
         self._ap = None
         self._simulation = True
-        self._callbacks: Dict[WiFiStatus, List[Callable]] = {}
+        # Tuples, rebuilt on registration, so dispatch just iterates
+        self._callbacks: Dict[WiFiStatus, Tuple[Callable, ...]] = {}
         self._retry_count = 0
+        # Earliest monotonic time ensure_connected() may try again
+        self._next_retry = 0.0
+
+        # Last scan results, served while fresh and refreshed in the
+        # background while merely stale
+        self._scan_cache: Optional[List[WiFiNetwork]] = None
+        self._scan_time = 0.0
+        self._scan_in_progress = False
+        self._scan_done = threading.Event()
+        self._scan_lock = threading.Lock()
+        # Access point of the last successful connect, for fast reconnects
+        self._last_ap: Optional[WiFiNetwork] = None
 
         # Simulation state
         self._sim_ip = "192.168.1.100"
@@ -100,7 +150,8 @@ class WiFiManager:
         self,
         ssid: Optional[str] = None,
         password: Optional[str] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        bssid: Optional[str] = None
     ) -> bool:
         """
         Connect to a WiFi network.
@@ -109,6 +160,8 @@ class WiFiManager:
             ssid: Network SSID (uses config if None)
             password: Network password (uses config if None)
             timeout: Connection timeout in seconds
+            bssid: Join this access point ("AA:BB:..."), skipping the
+                driver's search for the SSID
 
         Returns:
             True if connected successfully
@@ -124,6 +177,7 @@ class WiFiManager:
 
         if self._simulation:
             self._sim_connected = True
+            self._remember_ap(ssid)
             self._set_status(WiFiStatus.CONNECTED)
             return True
 
@@ -143,18 +197,45 @@ class WiFiManager:
                 self._config.dns or "8.8.8.8"
             ))
 
-        self._wlan.connect(ssid, password)
+        if bssid:
+            try:
+                self._wlan.connect(ssid, password, bssid=_bssid_bytes(bssid))
+            except TypeError:
+                # Port without the bssid keyword
+                self._wlan.connect(ssid, password)
+        else:
+            self._wlan.connect(ssid, password)
+
+        if not self._wait_connected(timeout):
+            self._set_status(WiFiStatus.FAILED)
+            return False
+
+        self._remember_ap(ssid)
+        self._set_status(WiFiStatus.CONNECTED)
+        return True
+
+    def _wait_connected(self, timeout: float) -> bool:
+        """
+        Wait for association, polling quickly at first.
 
-        start = time.time()
+        Starts at 50 ms and doubles up to 500 ms, so a fast connect is
+        noticed almost immediately without spinning on slow ones.
+        """
+        deadline = _monotonic() + timeout
+        delay = 0.05
         while not self._wlan.isconnected():
-            if time.time() - start > timeout:
-                self._set_status(WiFiStatus.FAILED)
+            remaining = deadline - _monotonic()
+            if remaining <= 0:
                 return False
-            time.sleep(0.5)
-
-        self._set_status(WiFiStatus.CONNECTED)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
         return True
 
+    def _remember_ap(self, ssid: str) -> None:
+        """Note the strongest cached access point for ssid, if scanned."""
+        matches = [n for n in self._scan_cache or () if n.ssid == ssid and n.bssid]
+        self._last_ap = max(matches, key=lambda n: n.rssi) if matches else None
+
     def disconnect(self) -> None:
         """Disconnect from WiFi."""
         if self._simulation:
@@ -165,13 +246,155 @@ class WiFiManager:
 
         self._set_status(WiFiStatus.DISCONNECTED)
 
-    def scan(self) -> List[WiFiNetwork]:
+    def scan(
+        self,
+        force: bool = False,
+        max_age: float = 30,
+        stale_age: float = 300,
+        ssid: Optional[str] = None,
+        bssid: Optional[str] = None,
+        channel: int = 0
+    ) -> List[WiFiNetwork]:
         """
         Scan for available WiFi networks.
 
+        A hardware scan blocks for seconds, so results are cached.
+        Results younger than ``max_age`` are returned directly; results
+        younger than ``stale_age`` are returned while a background scan
+        refreshes them.
+
+        Args:
+            force: Always run a new scan
+            max_age: Seconds cached results are served as-is
+            stale_age: Seconds cached results may be served while refreshing
+            ssid: Only return networks with this SSID
+            bssid: Only return the access point with this BSSID
+            channel: Only return networks on this channel (0 = any)
+
         Returns:
             List of WiFiNetwork objects
         """
+        networks = None
+        if not force:
+            with self._scan_lock:
+                cache = self._scan_cache
+                age = _monotonic() - self._scan_time
+                if cache is not None and age < stale_age:
+                    if age >= max_age and not self._scan_in_progress:
+                        self._start_background_scan()
+                    networks = list(cache)
+
+        if networks is None:
+            networks = self._store_scan(self._scan_networks())
+        if ssid is not None or bssid or channel:
+            networks = [
+                n for n in networks
+                if (ssid is None or n.ssid == ssid)
+                and (not bssid or n.bssid.upper() == bssid.upper())
+                and (not channel or n.channel == channel)
+            ]
+        return networks
+
+    def scan_arrays(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Scan results as parallel columns for numeric consumers.
+
+        Sorting by signal, filtering by channel or building histograms
+        then work on compact arrays instead of WiFiNetwork objects.
+
+        Args:
+            force: Always run a new scan
+
+        Returns:
+            Dict with "ssid" (list), "bssid" (bytearray, 6 bytes per
+            network), "channel" (array "B") and "rssi" (array "b")
+        """
+        networks = self.scan(force=force)
+        bssid = bytearray(6 * len(networks))
+        for i, n in enumerate(networks):
+            try:
+                raw = _bssid_bytes(n.bssid)
+            except ValueError:
+                continue
+            if len(raw) == 6:
+                bssid[6 * i:6 * i + 6] = raw
+        return {
+            "ssid": [n.ssid for n in networks],
+            "bssid": bssid,
+            "channel": array("B", [n.channel for n in networks]),
+            "rssi": array("b", [n.rssi for n in networks]),
+        }
+
+    def scan_if_due(self) -> List[WiFiNetwork]:
+        """
+        Scan only if the last scan is older than the current cadence.
+
+        The cadence is SCAN_INTERVAL_CONNECTED while connected and
+        SCAN_INTERVAL_DISCONNECTED otherwise; in between, the cached
+        results are returned. Use this from polling loops and UIs.
+
+        Returns:
+            List of WiFiNetwork objects
+        """
+        interval = SCAN_INTERVAL_CONNECTED if self.is_connected else SCAN_INTERVAL_DISCONNECTED
+        return self.scan(max_age=interval, stale_age=interval)
+
+    def scan_async(self) -> None:
+        """
+        Start a scan without blocking the caller.
+
+        The radio scan runs on a worker thread; poll get_scan_results()
+        for the networks found.
+
+        Raises:
+            RuntimeError: If a scan is already running
+        """
+        with self._scan_lock:
+            if self._scan_in_progress:
+                raise RuntimeError("WiFi scan already in progress")
+            self._start_background_scan()
+
+    def get_scan_results(self, timeout: float = 0) -> Optional[List[WiFiNetwork]]:
+        """
+        Get the results of the last scan.
+
+        Args:
+            timeout: Seconds to wait for a running scan to finish
+
+        Returns:
+            List of WiFiNetwork objects, or None while a scan is still
+            running (or if none has completed yet)
+        """
+        if self._scan_in_progress and not self._scan_done.wait(timeout):
+            return None
+        cache = self._scan_cache
+        return list(cache) if cache is not None else None
+
+    def _start_background_scan(self) -> None:
+        """Start a worker scan (call with the scan lock held)."""
+        self._scan_done.clear()
+        self._scan_in_progress = True
+        threading.Thread(target=self._background_scan, daemon=True).start()
+
+    def _background_scan(self) -> None:
+        """Worker for scan_async and stale-while-revalidate refreshes."""
+        try:
+            self._store_scan(self._scan_networks())
+        except Exception as e:
+            print(f"WiFi scan error: {e}")
+        finally:
+            self._scan_in_progress = False
+            self._scan_done.set()
+
+    def _store_scan(self, results: List[WiFiNetwork]) -> List[WiFiNetwork]:
+        """Cache scan results and return a copy for the caller."""
+        with self._scan_lock:
+            self._scan_cache = results
+            self._scan_time = _monotonic()
+        return list(results)
+
+    def _scan_networks(self) -> List[WiFiNetwork]:
+        """Run a scan on the radio (or return simulated networks)."""
         if self._simulation:
             return [
                 WiFiNetwork("SimNetwork_1", "AA:BB:CC:DD:EE:01", 1, -45, "WPA2"),
@@ -183,7 +406,7 @@ class WiFiManager:
         results = []
         for net in self._wlan.scan():
             ssid = net[0].decode("utf-8") if isinstance(net[0], bytes) else net[0]
-            bssid = ":".join(f"{b:02X}" for b in net[1]) if isinstance(net[1], bytes) else str(net[1])
+            bssid = _format_bssid(net[1]) if isinstance(net[1], (bytes, bytearray)) else str(net[1])
             results.append(WiFiNetwork(
                 ssid=ssid,
                 bssid=bssid,
@@ -254,8 +477,7 @@ class WiFiManager:
         if self._simulation:
             return self._sim_mac
         if self._wlan:
-            import ubinascii
-            return ubinascii.hexlify(self._wlan.config("mac"), ":").decode()
+            return binascii.hexlify(self._wlan.config("mac"), ":").decode()
         return ""
 
     @property
@@ -294,31 +516,51 @@ class WiFiManager:
 
     def on_status_change(self, status: WiFiStatus, callback: Callable) -> None:
         """Register a callback for a specific status change."""
-        if status not in self._callbacks:
-            self._callbacks[status] = []
-        self._callbacks[status].append(callback)
+        self._callbacks[status] = self._callbacks.get(status, ()) + (callback,)
 
     def _set_status(self, status: WiFiStatus) -> None:
         """Update status and trigger callbacks."""
         old_status = self._status
         self._status = status
-        if status in self._callbacks:
-            for cb in self._callbacks[status]:
+        callbacks = self._callbacks.get(status)
+        if callbacks:
+            for cb in callbacks:
                 try:
                     cb(old_status, status)
                 except Exception as e:
                     print(f"WiFi callback error: {e}")
 
     def ensure_connected(self) -> bool:
-        """Reconnect if disconnected (with retry logic)."""
+        """
+        Reconnect if disconnected (with retry logic).
+
+        Retries are spaced with full-jitter exponential backoff: after
+        attempt n the next one waits a random delay of up to
+        reconnect_interval * 2**n seconds (capped at
+        RECONNECT_BACKOFF_CAP), so devices that lost the same AP don't
+        retry in lockstep. The first retry is immediate, and calls made
+        before the next retry is due return False without blocking.
+        """
         if self.is_connected:
             self._retry_count = 0
+            self._next_retry = 0.0
             return True
 
         if self._retry_count >= self._config.max_retries:
             return False
 
+        now = _monotonic()
+        if now < self._next_retry:
+            return False
+
+        window = min(RECONNECT_BACKOFF_CAP, self._config.reconnect_interval * (2 ** self._retry_count))
+        self._next_retry = now + random.uniform(0, window)
         self._retry_count += 1
+        # Go straight back to the last access point instead of searching
+        last = self._last_ap
+        ssid = self._config.ssid
+        if last is not None and (not ssid or last.ssid == ssid):
+            return self.connect(last.ssid, bssid=last.bssid)
         return self.connect()
 
     def __repr__(self) -> str:
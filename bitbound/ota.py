@@ -5,13 +5,52 @@ Provides firmware and application update capabilities
 for MicroPython devices.
 """
 
-import json
+import binascii
 import os
 import time
 import hashlib
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 from enum import Enum
 
+from ._json import dumpb, loads
+
+
+# Bytes read per step while streaming a download to flash
+DOWNLOAD_CHUNK_SIZE = 4096
+
+# Downloaded update payload, kept under the backup path
+DOWNLOAD_FILE = "update.bin"
+
+# Version backed up before an update: one length byte, then UTF-8
+VERSION_FILE = "version.bin"
+
+# Wall-clock time (seconds) of the last auto_update check; the RTC
+# keeps running through deep sleep, unlike ticks_ms
+LAST_CHECK_FILE = "ota_ts"
+
+# Last update check response and its ETag, kept under the backup path
+CHECK_CACHE_FILE = "check.json"
+
+try:
+    from urllib.parse import urlencode as _urlencode
+except ImportError:
+    # MicroPython: version strings and numbers need no escaping
+    def _urlencode(params: Dict) -> str:
+        return "&".join(f"{k}={v}" for k, v in params.items())
+
+try:
+    from functools import lru_cache
+except ImportError:
+    # MicroPython has no functools.lru_cache; parse on every call
+    def lru_cache(maxsize=128):
+        return lambda func: func
+
+
+@lru_cache(maxsize=256)
+def _version_key(version: str) -> tuple:
+    """Parse "1.2.3" into (1, 2, 3) (cached; versions repeat)."""
+    return tuple(int(x) for x in version.split("."))
+
 
 class OTAStatus(Enum):
     """OTA update status."""
@@ -73,17 +112,31 @@ class OTAManager:
         self._progress = 0.0
         self._callbacks: Dict[OTAStatus, list] = {}
         self._error_message = ""
+        # SHA-256 (hex) of the last download, computed while streaming
+        self._download_digest: Optional[str] = None
+        # {"version", "etag", "response"} of the last check, for
+        # conditional GETs; loaded from the backup path on first use
+        self._check_cache: Optional[Dict[str, Any]] = None
+        # Seconds timestamp of the last auto_update check, or None
+        # until loaded from the backup path
+        self._last_check_ts: Optional[int] = None
 
         self._detect_platform()
 
     def _detect_platform(self) -> None:
-        """Detect if HTTP requests are available."""
+        """Detect if HTTP requests are available (resolved once, here)."""
+        # HTTP module and whether it's urequests, which takes no params
+        self._http: Any = None
+        self._http_micro = False
         try:
             import urequests
+            self._http = urequests
+            self._http_micro = True
             self._simulation = False
         except ImportError:
             try:
                 import requests
+                self._http = requests
                 self._simulation = False
             except ImportError:
                 self._simulation = True
@@ -111,10 +164,7 @@ class OTAManager:
             return True
 
         try:
-            response = self._http_get(
-                f"{self._update_url}/check",
-                params={"current_version": self._current_version}
-            )
+            response = self._check_conditional()
 
             if response and response.get("update_available"):
                 self._available_version = response.get("version")
@@ -130,6 +180,60 @@ class OTAManager:
             self._set_status(OTAStatus.FAILED)
             return False
 
+    def _check_conditional(self) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the check response, revalidating the cached one by ETag.
+
+        A 304 Not Modified answer reuses the cached response without
+        transferring or parsing the JSON again.
+        """
+        if self._check_cache is None:
+            self._check_cache = self._load_check_cache()
+        cache = self._check_cache
+        if cache.get("version") != self._current_version:
+            # The check query depends on the running version
+            cache = {}
+
+        headers = {}
+        if cache.get("etag") and cache.get("response") is not None:
+            headers["If-None-Match"] = cache["etag"]
+        meta: Dict[str, Any] = {}
+        response = self._http_get(
+            f"{self._update_url}/check",
+            params={"current_version": self._current_version},
+            headers=headers,
+            meta=meta,
+        )
+        if meta.get("status") == 304 and headers:
+            return cache["response"]
+
+        etag = meta.get("etag")
+        if response is not None and etag and etag != cache.get("etag"):
+            self._check_cache = {
+                "version": self._current_version,
+                "etag": etag,
+                "response": response,
+            }
+            self._save_check_cache()
+        return response
+
+    def _load_check_cache(self) -> Dict[str, Any]:
+        """Load the persisted check ETag and response, if any."""
+        try:
+            with open(f"{self._backup_path}/{CHECK_CACHE_FILE}", "rb") as f:
+                return loads(f.read())
+        except Exception:
+            return {}
+
+    def _save_check_cache(self) -> None:
+        """Persist the check ETag and response across reboots."""
+        self._ensure_backup_dir()
+        try:
+            with open(f"{self._backup_path}/{CHECK_CACHE_FILE}", "wb") as f:
+                f.write(dumpb(self._check_cache))
+        except Exception:
+            pass
+
     def update(self) -> bool:
         """
         Download and install the available update.
@@ -190,6 +294,61 @@ class OTAManager:
             self.rollback()
             return False
 
+    def auto_update(self, check_interval_hours: float = 24, power_manager: Any = None) -> bool:
+        """
+        Check for and install an update when one is due, without waiting.
+
+        The time of the last check is kept under the backup path, so
+        the schedule carries on across deep sleep and reboots: call this
+        on every boot and it only checks once the interval has passed.
+        With a power_manager, the device then deep-sleeps until the
+        next check is due, instead of staying awake in a timer.
+
+        Args:
+            check_interval_hours: Hours between update checks
+            power_manager: Optional PowerManager used to sleep until due
+
+        Returns:
+            True if an update was installed
+        """
+        interval_ms = int(check_interval_hours * 3600 * 1000)
+        now = int(time.time())
+        last = self._load_last_check()
+        due_in_ms = 0 if last is None else max(0, interval_ms - (now - last) * 1000)
+
+        updated = False
+        if due_in_ms == 0:
+            self._save_last_check(now)
+            if self.check_update():
+                updated = self.update()
+            due_in_ms = interval_ms
+
+        if power_manager is not None:
+            power_manager.deep_sleep(duration_ms=due_in_ms)
+        return updated
+
+    def _load_last_check(self) -> Optional[int]:
+        """Seconds timestamp of the last auto_update check, if any."""
+        if self._last_check_ts is None and not self._simulation:
+            try:
+                with open(f"{self._backup_path}/{LAST_CHECK_FILE}", "r") as f:
+                    self._last_check_ts = int(f.read())
+            except Exception:
+                pass
+        return self._last_check_ts
+
+    def _save_last_check(self, ts: int) -> None:
+        """Persist the auto_update check time across deep sleep."""
+        self._last_check_ts = ts
+        if self._simulation:
+            return
+        self._ensure_backup_dir()
+        try:
+            with open(f"{self._backup_path}/{LAST_CHECK_FILE}", "w") as f:
+                f.write(str(ts))
+        except Exception:
+            pass
+
     def rollback(self) -> bool:
         """
         Rollback to the previous version.
@@ -219,6 +378,18 @@ class OTAManager:
         if self._simulation:
             return
 
+        self._ensure_backup_dir()
+
+        # Save version info
+        try:
+            version = self._current_version.encode("utf-8")[:255]
+            with open(f"{self._backup_path}/{VERSION_FILE}", "wb") as f:
+                f.write(bytes((len(version),)) + version)
+        except Exception:
+            pass
+
+    def _ensure_backup_dir(self) -> None:
+        """Create the backup directory if it doesn't exist."""
         try:
             os.makedirs(self._backup_path, exist_ok=True)
         except (OSError, AttributeError):
@@ -227,29 +398,49 @@ class OTAManager:
             except OSError:
                 pass
 
-        # Save version info
-        try:
-            with open(f"{self._backup_path}/version.json", "w") as f:
-                json.dump({"version": self._current_version}, f)
-        except Exception:
-            pass
-
     def _restore_backup(self) -> None:
         """Restore backed up files."""
         try:
-            with open(f"{self._backup_path}/version.json", "r") as f:
-                info = json.load(f)
-                self._current_version = info.get("version", self._current_version)
+            with open(f"{self._backup_path}/{VERSION_FILE}", "rb") as f:
+                data = f.read()
+            if data:
+                self._current_version = data[1:1 + data[0]].decode("utf-8")
         except Exception:
             pass
 
     def _download_update(self) -> None:
-        """Download update files from server."""
+        """
+        Stream the update to flash.
+
+        The payload is written in DOWNLOAD_CHUNK_SIZE pieces and hashed
+        as it arrives, so memory use doesn't grow with the firmware size
+        and verification doesn't re-read the file.
+        """
         url = f"{self._update_url}/download"
-        response = self._http_get(url, params={"version": self._available_version})
-        if not response:
+        resp = self._http_open(url, params={"version": self._available_version})
+        if resp is None:
             raise RuntimeError("Download failed")
 
+        total = self._update_info.get("size") or 0
+        hasher = hashlib.sha256()
+        received = 0
+        self._download_digest = None
+        try:
+            with open(f"{self._backup_path}/{DOWNLOAD_FILE}", "wb") as f:
+                for chunk in self._iter_chunks(resp):
+                    f.write(chunk)
+                    hasher.update(chunk)
+                    received += len(chunk)
+                    if total:
+                        self._progress = min(received / total, 1.0)
+        finally:
+            resp.close()
+
+        if not received:
+            raise RuntimeError("Download failed: empty response")
+        self._progress = 1.0
+        self._download_digest = binascii.hexlify(hasher.digest()).decode()
+
     def _verify_update(self) -> bool:
         """Verify downloaded update integrity."""
         if self._simulation:
@@ -259,33 +450,90 @@ class OTAManager:
         if not checksum:
             return True  # No checksum to verify
 
-        # Verify file checksums
-        return True
+        # The digest was computed while downloading; the file isn't re-read
+        if self._download_digest == checksum.lower():
+            return True
+        self._error_message = "Checksum mismatch"
+        try:
+            os.remove(f"{self._backup_path}/{DOWNLOAD_FILE}")
+        except OSError:
+            pass
+        return False
 
     def _install_update(self) -> None:
         """Install downloaded update files."""
         pass
 
-    def _http_get(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
-        """Make an HTTP GET request."""
+    def _request(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        stream: bool = False,
+    ) -> Any:
+        """Send a GET through the backend chosen in _detect_platform."""
+        if self._http_micro:
+            # urequests has no params argument and always streams
+            if params:
+                url = f"{url}?{_urlencode(params)}"
+            return self._http.get(url, headers=headers or {})
+        return self._http.get(url, params=params, headers=headers, stream=stream)
+
+    def _http_get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        meta: Optional[Dict] = None,
+    ) -> Optional[Dict]:
+        """
+        Make an HTTP GET request and parse the JSON body.
+
+        If ``meta`` is given it receives the response "status" and
+        "etag"; a 304 response returns None without parsing a body.
+        """
         try:
+            resp = self._request(url, params, headers)
             try:
-                import urequests
-                if params:
-                    query = "&".join(f"{k}={v}" for k, v in params.items())
-                    url = f"{url}?{query}"
-                resp = urequests.get(url)
-                data = resp.json()
-                resp.close()
-                return data
-            except ImportError:
-                import requests
-                resp = requests.get(url, params=params)
+                if meta is not None:
+                    resp_headers = getattr(resp, "headers", None) or {}
+                    meta["status"] = resp.status_code
+                    meta["etag"] = resp_headers.get("ETag") or resp_headers.get("etag")
+                if resp.status_code == 304:
+                    return None
                 return resp.json()
+            finally:
+                resp.close()
         except Exception as e:
             print(f"HTTP error: {e}")
             return None
 
+    def _http_open(self, url: str, params: Optional[Dict] = None) -> Any:
+        """Start a streaming HTTP GET; returns the open response or None."""
+        try:
+            resp = self._request(url, params, stream=True)
+            if resp.status_code != 200:
+                resp.close()
+                return None
+            return resp
+        except Exception as e:
+            print(f"HTTP error: {e}")
+            return None
+
+    @staticmethod
+    def _iter_chunks(resp: Any) -> Iterator[bytes]:
+        """Yield the response body in DOWNLOAD_CHUNK_SIZE pieces."""
+        if hasattr(resp, "iter_content"):
+            # requests: also undoes any transfer encoding
+            yield from resp.iter_content(DOWNLOAD_CHUNK_SIZE)
+            return
+        read = resp.raw.read
+        while True:
+            chunk = read(DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
     @staticmethod
     def _bump_version(version: str) -> str:
         """Bump patch version for simulation."""
@@ -302,20 +550,11 @@ class OTAManager:
         Returns:
             -1 if v1 < v2, 0 if equal, 1 if v1 > v2
         """
-        parts1 = [int(x) for x in v1.split(".")]
-        parts2 = [int(x) for x in v2.split(".")]
-
-        for a, b in zip(parts1, parts2):
-            if a < b:
-                return -1
-            if a > b:
-                return 1
-
-        if len(parts1) < len(parts2):
-            return -1
-        if len(parts1) > len(parts2):
-            return 1
-        return 0
+        # Tuple ordering matches the old rules, including a shorter
+        # version sorting first when it is a prefix of the longer one
+        a = _version_key(v1)
+        b = _version_key(v2)
+        return (a > b) - (a < b)
 
     def on_status(self, status: OTAStatus, callback: Callable) -> None:
         """Register a callback for status changes."""
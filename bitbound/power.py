@@ -6,9 +6,30 @@ for MicroPython-based microcontrollers.
 """
 
 import time
-from typing import Any, Callable, Dict, Optional
+from array import array
+from typing import Any, Callable, Dict, Optional, Tuple
 from enum import Enum
 
+try:
+    _ticks_ms = time.ticks_ms
+    _ticks_diff = time.ticks_diff
+except AttributeError:
+    # CPython: millisecond monotonic clock
+    def _ticks_ms() -> int:
+        return int(time.monotonic() * 1000)
+
+    def _ticks_diff(a: int, b: int) -> int:
+        return a - b
+
+
+# How long a battery reading is reused before the ADC is sampled again
+BATTERY_CACHE_MS = 200
+
+# ADC samples averaged per battery reading (a power of two, so the
+# mean is a shift); 16 samples cut the noise about 4x
+BATTERY_SAMPLES = 16
+_SAMPLE_SHIFT = BATTERY_SAMPLES.bit_length() - 1
+
 
 class SleepMode(Enum):
     """Sleep mode types."""
@@ -26,6 +47,19 @@ class WakeReason(Enum):
     UNKNOWN = "unknown"
 
 
+# machine.wake_reason() / machine.reset_cause() codes, indexed directly
+_WAKE_REASONS = (
+    WakeReason.POWER_ON,
+    WakeReason.UNKNOWN,
+    WakeReason.GPIO,
+    WakeReason.UNKNOWN,
+    WakeReason.TIMER,
+    WakeReason.TOUCHPAD,
+    WakeReason.ULP,
+)
+_RESET_CAUSES = ("power_on", "hard_reset", "wdt_reset", "deepsleep_reset", "soft_reset")
+
+
 class PowerManager:
     """
     Power management for embedded devices.
@@ -62,11 +96,25 @@ class PowerManager:
         self._battery_pin = battery_pin
         self._battery_max_v = battery_max_v
         self._battery_min_v = 3.0
+        # Integer millivolt thresholds for battery_percent
+        self._battery_max_mv = int(battery_max_v * 1000)
+        self._battery_min_mv = int(self._battery_min_v * 1000)
+        self._battery_span_mv = max(1, self._battery_max_mv - self._battery_min_mv)
+        # (mV, percent) of the last conversion; readings repeat while cached
+        self._battery_pct = (-1, 0)
         self._adc = None
+        # Last battery reading in mV and when it was taken
+        self._battery_mv_cache = 0
+        self._battery_mv_ts: Optional[int] = None
+        self._adc_samples = array("H", [0] * BATTERY_SAMPLES)
         self._watchdog = None
         self._wake_pins: list = []
-        self._before_sleep_callbacks: list = []
-        self._after_wake_callbacks: list = []
+        # Port modules, imported once in _detect_platform
+        self._machine: Any = None
+        self._esp32: Any = None
+        # Tuples, rebuilt on registration, so firing just iterates
+        self._before_sleep_callbacks: Tuple[Callable, ...] = ()
+        self._after_wake_callbacks: Tuple[Callable, ...] = ()
 
         self._detect_platform()
 
@@ -74,9 +122,17 @@ class PowerManager:
         """Detect if running on real hardware."""
         try:
             import machine
+            self._machine = machine
             self._simulation = False
         except ImportError:
             self._simulation = True
+            return
+
+        try:
+            import esp32
+            self._esp32 = esp32
+        except ImportError:
+            pass
 
     def deep_sleep(self, duration_ms: int = 0) -> None:
         """
@@ -93,25 +149,47 @@ class PowerManager:
                 time.sleep(duration_ms / 1000.0)
             return
 
-        import machine
+        machine = self._machine
+        esp = self._esp32
 
-        if self._wake_pins:
-            for pin_num, level in self._wake_pins:
-                try:
-                    pin = machine.Pin(pin_num)
-                    esp = __import__("esp32")
-                    if level:
-                        esp.wake_on_ext0(pin, esp.WAKEUP_ANY_HIGH)
-                    else:
-                        esp.wake_on_ext0(pin, esp.WAKEUP_ALL_LOW)
-                except Exception:
-                    pass
+        if self._wake_pins and esp is not None:
+            try:
+                self._configure_wake_pins(machine.Pin, esp)
+            except Exception as e:
+                print(f"Wake pin error: {e}")
 
         if duration_ms > 0:
             machine.deepsleep(duration_ms)
         else:
             machine.deepsleep()
 
+    def _configure_wake_pins(self, Pin: Any, esp: Any) -> None:
+        """
+        Arm the wake pins with as few calls as the hardware allows.
+
+        ext0 wakes on one pin only, so a single pin uses ext0 and
+        several pins are grouped into one ext1 call per level. The
+        ESP32 has one ext1 unit: high-level pins take it (any high
+        wakes), leaving ext0 for a single low-level pin. Several
+        low-level pins on their own share ext1, which wakes only once
+        all of them are low.
+        """
+        high = tuple(Pin(pin) for pin, level in self._wake_pins if level)
+        low = tuple(Pin(pin) for pin, level in self._wake_pins if not level)
+
+        if len(high) + len(low) == 1:
+            esp.wake_on_ext0((high or low)[0], esp.WAKEUP_ANY_HIGH if high else esp.WAKEUP_ALL_LOW)
+            return
+
+        if high:
+            esp.wake_on_ext1(high, esp.WAKEUP_ANY_HIGH)
+            if low:
+                if len(low) > 1:
+                    print("Wake pin warning: only one low-level pin can wake alongside high-level pins")
+                esp.wake_on_ext0(low[0], esp.WAKEUP_ALL_LOW)
+        else:
+            esp.wake_on_ext1(low, esp.WAKEUP_ALL_LOW)
+
     def light_sleep(self, duration_ms: int = 0) -> None:
         """
         Enter light sleep mode.
@@ -128,7 +206,7 @@ class PowerManager:
             self._fire_after_wake()
             return
 
-        import machine
+        machine = self._machine
         if duration_ms > 0:
             machine.lightsleep(duration_ms)
         else:
@@ -161,16 +239,10 @@ class PowerManager:
             return WakeReason.POWER_ON
 
         try:
-            import machine
-            reason = machine.wake_reason()
-            reason_map = {
-                0: WakeReason.POWER_ON,
-                2: WakeReason.GPIO,
-                4: WakeReason.TIMER,
-                5: WakeReason.TOUCHPAD,
-                6: WakeReason.ULP,
-            }
-            return reason_map.get(reason, WakeReason.UNKNOWN)
+            reason = self._machine.wake_reason()
+            if 0 <= reason < len(_WAKE_REASONS):
+                return _WAKE_REASONS[reason]
+            return WakeReason.UNKNOWN
         except Exception:
             return WakeReason.UNKNOWN
 
@@ -186,9 +258,8 @@ class PowerManager:
             return
 
         try:
-            from machine import WDT
-            self._watchdog = WDT(timeout=timeout_ms)
-        except (ImportError, Exception) as e:
+            self._watchdog = self._machine.WDT(timeout=timeout_ms)
+        except Exception as e:
             print(f"Watchdog error: {e}")
 
     def feed_watchdog(self) -> None:
@@ -211,8 +282,7 @@ class PowerManager:
             return
 
         try:
-            import machine
-            machine.freq(freq_mhz * 1_000_000)
+            self._machine.freq(freq_mhz * 1_000_000)
         except Exception as e:
             print(f"CPU freq error: {e}")
 
@@ -222,38 +292,64 @@ class PowerManager:
             return 240
 
         try:
-            import machine
-            return machine.freq() // 1_000_000
+            return self._machine.freq() // 1_000_000
         except Exception:
             return 0
 
-    @property
-    def battery_voltage(self) -> float:
+    def _battery_mv(self) -> int:
         """
-        Read battery voltage.
+        Battery voltage in millivolts.
 
-        Returns:
-            Battery voltage in volts
+        Readings are reused for BATTERY_CACHE_MS so voltage and percent
+        queried together share one ADC read; each read averages
+        BATTERY_SAMPLES 16-bit samples using integer math only.
         """
         if self._simulation:
-            return 3.8
+            return 3800
 
         if self._battery_pin is None:
-            return 0.0
+            return 0
+
+        now = _ticks_ms()
+        if self._battery_mv_ts is not None and _ticks_diff(now, self._battery_mv_ts) < BATTERY_CACHE_MS:
+            return self._battery_mv_cache
 
         try:
-            from machine import ADC, Pin
             if self._adc is None:
-                self._adc = ADC(Pin(self._battery_pin))
+                ADC = self._machine.ADC
+                self._adc = ADC(self._machine.Pin(self._battery_pin))
                 self._adc.atten(ADC.ATTN_11DB)
                 self._adc.width(ADC.WIDTH_12BIT)
 
-            raw = self._adc.read()
-            # Assume voltage divider (2:1 ratio typical)
-            voltage = (raw / 4095.0) * 3.3 * 2
-            return round(voltage, 2)
+            samples = self._adc_samples
+            read_u16 = getattr(self._adc, "read_u16", None)
+            if read_u16 is not None:
+                for i in range(BATTERY_SAMPLES):
+                    samples[i] = read_u16()
+            else:
+                # Older ports: scale 12-bit reads to 16 bits
+                read = self._adc.read
+                for i in range(BATTERY_SAMPLES):
+                    samples[i] = read() << 4
+            raw = sum(samples) >> _SAMPLE_SHIFT
+            # 16-bit reading of 3.3 V behind a 2:1 divider (typical)
+            mv = raw * 6600 // 65535
         except Exception:
-            return 0.0
+            return 0
+
+        self._battery_mv_cache = mv
+        self._battery_mv_ts = now
+        return mv
+
+    @property
+    def battery_voltage(self) -> float:
+        """
+        Read battery voltage.
+
+        Returns:
+            Battery voltage in volts
+        """
+        return self._battery_mv() / 1000
 
     @property
     def battery_percent(self) -> int:
@@ -263,15 +359,20 @@ class PowerManager:
         Returns:
             Battery level (0-100)
         """
-        voltage = self.battery_voltage
-        if voltage <= self._battery_min_v:
-            return 0
-        if voltage >= self._battery_max_v:
-            return 100
-
-        percent = ((voltage - self._battery_min_v) /
-                   (self._battery_max_v - self._battery_min_v)) * 100
-        return max(0, min(100, int(percent)))
+        mv = self._battery_mv()
+        last_mv, percent = self._battery_pct
+        if mv == last_mv:
+            return percent
+
+        offset = mv - self._battery_min_mv
+        if offset <= 0:
+            percent = 0
+        elif offset >= self._battery_span_mv:
+            percent = 100
+        else:
+            percent = offset * 100 // self._battery_span_mv
+        self._battery_pct = (mv, percent)
+        return percent
 
     @property
     def is_charging(self) -> bool:
@@ -282,11 +383,11 @@ class PowerManager:
 
     def before_sleep(self, callback: Callable) -> None:
         """Register a callback to run before entering sleep."""
-        self._before_sleep_callbacks.append(callback)
+        self._before_sleep_callbacks += (callback,)
 
     def after_wake(self, callback: Callable) -> None:
         """Register a callback to run after waking up."""
-        self._after_wake_callbacks.append(callback)
+        self._after_wake_callbacks += (callback,)
 
     def _fire_before_sleep(self) -> None:
         for cb in self._before_sleep_callbacks:
@@ -309,16 +410,10 @@ class PowerManager:
             return "power_on"
 
         try:
-            import machine
-            cause = machine.reset_cause()
-            causes = {
-                0: "power_on",
-                1: "hard_reset",
-                2: "wdt_reset",
-                3: "deepsleep_reset",
-                4: "soft_reset",
-            }
-            return causes.get(cause, "unknown")
+            cause = self._machine.reset_cause()
+            if 0 <= cause < len(_RESET_CAUSES):
+                return _RESET_CAUSES[cause]
+            return "unknown"
         except Exception:
             return "unknown"
 
@@ -328,9 +423,11 @@ class PowerManager:
             print("[SIM] Soft reset")
             return
 
-        import machine
-        machine.reset()
+        self._machine.reset()
 
     def __repr__(self) -> str:
         mode = "SIM" if self._simulation else "HW"
-        return f"<PowerManager [{mode}] battery={self.battery_percent}%>"
+        # Last reading only: repr must not sample the ADC
+        mv, percent = self._battery_pct
+        battery = f"{percent}%" if mv >= 0 else "?"
+        return f"<PowerManager [{mode}] battery={battery}>"
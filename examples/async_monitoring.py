@@ -6,6 +6,7 @@ and log data with the DataLogger.
 """
 
 import asyncio
+import sys
 from bitbound import Hardware
 from bitbound.async_support import AsyncDevice, gather_readings
 from bitbound.logging import DataLogger, RingBuffer
@@ -19,25 +20,26 @@ light_sensor = hw.attach("I2C", type="BH1750")
 logger = DataLogger("environment", format="csv", max_entries=10000)
 temp_buffer = RingBuffer(60)  # Last 60 readings
 
+# Devices and the property read from each, built once
+SENSORS = [temp_sensor, light_sensor]
+PROPERTIES = ["temperature", "lux"]
+
+# Status line, formatted once per tick with %
+STATUS_FORMAT = "Temp: %s°C (avg: %.1f°C) | Light: %s lux\n"
+
 
 async def monitor():
     """Main monitoring loop."""
     while True:
         # Read sensors concurrently
-        results = await gather_readings(
-            [temp_sensor, light_sensor],
-            ["temperature", "lux"]
-        )
-
-        temp = results[0]
-        lux = results[1]
+        temp, lux = await gather_readings(SENSORS, PROPERTIES)
 
         # Log data
         logger.log({"temperature": temp, "lux": lux})
-        temp_buffer.append(temp)
+        temp_buffer.append({"temperature": temp})
 
         # Print stats
-        print(f"Temp: {temp}°C (avg: {temp_buffer.average():.1f}°C) | Light: {lux} lux")
+        sys.stdout.write(STATUS_FORMAT % (temp, temp_buffer.average("temperature"), lux))
 
         await asyncio.sleep(1)
 
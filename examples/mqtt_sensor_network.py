@@ -32,11 +32,11 @@ def on_command(topic, message):
 mqtt.subscribe("commands/#", callback=on_command)
 
 # Publish sensor data periodically
+READINGS = ("temperature", "humidity", "pressure")
+
 def publish_readings(event):
     data = sensor.read_all()
-    mqtt.publish("sensors/temperature", str(data["temperature"]))
-    mqtt.publish("sensors/humidity", str(data["humidity"]))
-    mqtt.publish("sensors/pressure", str(data["pressure"]))
+    mqtt.publish_many("sensors/", {key: data[key] for key in READINGS})
 
 sensor.on_interval(10000, publish_readings)  # Every 10 seconds
 
@@ -13,10 +13,10 @@ hw = Hardware()
 sensor = hw.attach("I2C", type="BME280")
 
 # Enable watchdog (reset if hung for >30s)
-pm.watchdog_enable(timeout_ms=30000)
+pm.start_watchdog(timeout_ms=30000)
 
 # Check battery
-level = pm.battery_level()
+level = pm.battery_percent
 print(f"Battery: {level}%")
 
 if level < 10:
@@ -24,18 +24,19 @@ if level < 10:
     pm.deep_sleep(duration_ms=3600000)  # Sleep 1 hour
 
 # Quick wake-up: read sensor, send data, go back to sleep
-pm.watchdog_feed()
+pm.feed_watchdog()
 
 wifi = WiFiManager()
 wifi.connect("MyNetwork", "password123")
 
-mqtt = MQTTClient("sensor", broker="mqtt.example.com")
+mqtt = MQTTClient(broker="mqtt.example.com", client_id="sensor")
 mqtt.connect()
 
+# Sent as compact JSON: fewer bytes on air than str(data), and parseable
 data = sensor.read_all()
-mqtt.publish("sensors/data", str(data))
+mqtt.publish("sensors/data", data)
 
-pm.watchdog_feed()
+pm.feed_watchdog()
 
 mqtt.disconnect()
 wifi.disconnect()
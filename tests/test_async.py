@@ -2,7 +2,9 @@
 
 import pytest
 import asyncio
-from bitbound.async_support import AsyncEventLoop, AsyncDevice, gather_readings, HAS_ASYNCIO
+from bitbound.async_support import (
+    AsyncEventLoop, AsyncDevice, gather_readings, gather_readings_soa, HAS_ASYNCIO
+)
 
 
 # Skip all tests if asyncio not available
@@ -32,6 +34,27 @@ class MockDevice:
         return {"temperature": self._temperature, "humidity": self._humidity}
 
 
+class NotifyingDevice(MockDevice):
+    """Mock device with Device-style on_change hooks."""
+    def __init__(self):
+        super().__init__()
+        self.handlers = []
+
+    def on_change(self, property_name, callback, debounce_ms=0):
+        handler = (property_name, callback)
+        self.handlers.append(handler)
+        return handler
+
+    def remove_handler(self, handler):
+        self.handlers.remove(handler)
+
+    def set_temperature(self, value):
+        self._temperature = value
+        for name, callback in list(self.handlers):
+            if name == "temperature":
+                callback(None)
+
+
 class TestAsyncEventLoop:
     def test_create_loop(self):
         loop = AsyncEventLoop()
@@ -44,6 +67,14 @@ class TestAsyncEventLoop:
         value = await loop.read_async(device, "temperature")
         assert value == 23.5
 
+    @pytest.mark.asyncio
+    async def test_read_async_yields_periodically(self):
+        loop = AsyncEventLoop(yield_every=4)
+        device = MockDevice()
+        for _ in range(5):
+            await loop.read_async(device, "temperature")
+        assert loop._sync_reads == 1
+
     @pytest.mark.asyncio
     async def test_read_all_async(self):
         loop = AsyncEventLoop()
@@ -60,6 +91,15 @@ class TestAsyncEventLoop:
         values = await loop.wait_for_threshold(device, "temperature > 25°C")
         assert values["temperature"] == 30.0
 
+    @pytest.mark.asyncio
+    async def test_wait_for_threshold_reads_only_needed(self):
+        loop = AsyncEventLoop()
+        device = MockDevice()
+        device._temperature = 30.0
+        device.read_all = None  # would fail if called
+        values = await loop.wait_for_threshold(device, "temperature > 25°C")
+        assert values == {"temperature": 30.0}
+
     @pytest.mark.asyncio
     async def test_wait_for_change(self):
         loop = AsyncEventLoop()
@@ -80,6 +120,62 @@ class TestAsyncEventLoop:
         with pytest.raises(TimeoutError):
             await loop.wait_for_change(device, "temperature", poll_interval=0.01, timeout=0.05)
 
+    @pytest.mark.asyncio
+    async def test_wait_for_change_update_event(self):
+        loop = AsyncEventLoop()
+        device = MockDevice()
+        device._update_event = asyncio.Event()
+
+        async def change_value():
+            await asyncio.sleep(0.01)
+            device._temperature = 25.0
+            device._update_event.set()
+
+        asyncio.ensure_future(change_value())
+        result = await loop.wait_for_change(device, "temperature", poll_interval=5.0, timeout=1.0)
+        assert result == 25.0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change_on_change_hook(self):
+        import threading
+        import time
+        loop = AsyncEventLoop()
+        device = NotifyingDevice()
+
+        # Notify from another thread, as the polling EventLoop would
+        threading.Timer(0.01, device.set_temperature, (25.0,)).start()
+        start = time.monotonic()
+        result = await loop.wait_for_change(device, "temperature", poll_interval=5.0, timeout=2.0)
+        assert result == 25.0
+        assert time.monotonic() - start < 1.0
+        assert device.handlers == []
+
+    @pytest.mark.asyncio
+    async def test_wait_for_threshold_on_change_hook(self):
+        loop = AsyncEventLoop()
+        device = NotifyingDevice()
+
+        async def change_value():
+            await asyncio.sleep(0.01)
+            device.set_temperature(30.0)
+
+        asyncio.ensure_future(change_value())
+        values = await asyncio.wait_for(
+            loop.wait_for_threshold(device, "temperature > 25°C", poll_interval=5.0), 1.0
+        )
+        assert values == {"temperature": 30.0}
+        assert device.handlers == []
+
+    @pytest.mark.asyncio
+    async def test_wait_adaptive_next_sample_time(self):
+        import time
+        loop = AsyncEventLoop()
+        device = MockDevice()
+        device._next_sample_time = time.time() + 0.01
+        start = time.time()
+        await loop._wait_adaptive(device, poll_interval=5.0)
+        assert time.time() - start < 1.0
+
     @pytest.mark.asyncio
     async def test_periodic(self):
         loop = AsyncEventLoop()
@@ -87,6 +183,44 @@ class TestAsyncEventLoop:
         await loop.periodic(lambda: values.append(1), interval=0.01, count=3)
         assert len(values) == 3
 
+    @pytest.mark.asyncio
+    async def test_periodic_does_not_drift(self):
+        import time
+        loop = AsyncEventLoop()
+        stamps = []
+
+        def slow():
+            stamps.append(time.monotonic())
+            time.sleep(0.005)
+
+        await loop.periodic(slow, interval=0.02, count=5)
+        # Callback runtime is absorbed into each slot instead of accumulating
+        assert stamps[-1] - stamps[0] < 4 * 0.02 + 0.015
+
+    def test_run_wait_first(self):
+        loop = AsyncEventLoop()
+        finished = []
+
+        async def fast():
+            await asyncio.sleep(0.01)
+            finished.append("fast")
+
+        async def slow():
+            await asyncio.sleep(10)
+            finished.append("slow")
+
+        loop.run(fast(), slow(), wait_first=True)
+        assert finished == ["fast"]
+
+    def test_run_propagates_errors(self):
+        loop = AsyncEventLoop()
+
+        async def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            loop.run(boom())
+
 
 class TestAsyncDevice:
     @pytest.mark.asyncio
@@ -96,6 +230,18 @@ class TestAsyncDevice:
         values = await async_dev.read_all()
         assert values["temperature"] == 23.5
 
+    @pytest.mark.asyncio
+    async def test_read_all_reuse(self):
+        device = MockDevice()
+        async_dev = AsyncDevice(device)
+        first = await async_dev.read_all(reuse=True)
+        assert first == {"temperature": 23.5, "humidity": 65.0}
+        device._temperature = 30.0
+        second = await async_dev.read_all(reuse=True)
+        assert second is first
+        assert second["temperature"] == 30.0
+        assert await async_dev.read_all() is not first
+
     @pytest.mark.asyncio
     async def test_property_access(self):
         device = MockDevice()
@@ -103,6 +249,22 @@ class TestAsyncDevice:
         temp = await async_dev.temperature
         assert temp == 23.5
 
+    @pytest.mark.asyncio
+    async def test_read_all_with_yield_every(self):
+        device = MockDevice()
+        async_dev = AsyncDevice(device, yield_every=1)
+        values = await async_dev.read_all()
+        assert values["humidity"] == 65.0
+
+    @pytest.mark.asyncio
+    async def test_method_wrapper_cached(self):
+        device = MockDevice()
+        async_dev = AsyncDevice(device)
+        wrapper = async_dev.__getattr__("read_all")
+        assert async_dev.__getattr__("read_all") is wrapper
+        values = await wrapper()
+        assert values["temperature"] == 23.5
+
     def test_repr(self):
         device = MockDevice()
         async_dev = AsyncDevice(device)
@@ -128,3 +290,61 @@ class TestGatherReadings:
         results = await gather_readings(d, properties=["temperature"])
         assert "temperature" in results[0]
         assert "humidity" not in results[0]
+
+    @pytest.mark.asyncio
+    async def test_gather_list_forms(self):
+        d1 = MockDevice()
+        d1._temperature = 20.0
+        d2 = MockDevice()
+        d2._humidity = 40.0
+
+        assert await gather_readings([d1, d2], "temperature") == [20.0, 23.5]
+        assert await gather_readings([d1, d2], ["temperature", "humidity"]) == [20.0, 40.0]
+        results = await gather_readings([d1, d2])
+        assert results[1]["humidity"] == 40.0
+        with pytest.raises(ValueError):
+            await gather_readings([d1, d2], ["temperature"])
+
+    @pytest.mark.asyncio
+    async def test_gather_overlaps_separate_buses(self):
+        import threading
+        import time
+
+        class SlowDevice(MockDevice):
+            def __init__(self, bus):
+                super().__init__()
+                self._bus = bus
+                self.thread = None
+
+            @property
+            def temperature(self):
+                self.thread = threading.get_ident()
+                time.sleep(0.05)
+                return self._temperature
+
+        shared = object()
+        devices = [SlowDevice(object()), SlowDevice(object()), SlowDevice(shared), SlowDevice(shared)]
+        start = time.monotonic()
+        values = await gather_readings(devices, "temperature")
+        assert values == [23.5] * 4
+        # Three bus groups overlap; the shared bus is read sequentially
+        assert time.monotonic() - start < 0.19
+        assert devices[2].thread == devices[3].thread
+
+    @pytest.mark.asyncio
+    async def test_gather_soa(self):
+        d1 = MockDevice()
+        d1._temperature = 20.0
+        d2 = MockDevice()
+        d2._temperature = 25.0
+
+        columns = await gather_readings_soa(d1, d2, properties=["temperature", "humidity"])
+        assert columns["temperature"] == [20.0, 25.0]
+        assert columns["humidity"] == [65.0, 65.0]
+
+
+class TestExpressionCache:
+    def test_parse_cached_reuses_expression(self):
+        from bitbound.async_support import _parse_cached
+        first = _parse_cached("temperature > 25°C")
+        assert _parse_cached("temperature > 25°C") is first
@@ -44,6 +44,27 @@ class TestI2CBus:
         val = bus.read_byte(0x76, 0xD0)
         assert val == 0x60
 
+    def test_read_byte_matches_read_register(self):
+        bus = I2CBus()
+        bus.init()
+        bus.add_simulated_device(0x48, "ADS1115", {0x00: [0x01, 0x02]})
+        for address, register in ((0x76, 0xD0), (0x76, 0xF7), (0x48, 0x00), (0x48, 0x05)):
+            assert bus.read_byte(address, register) == bus.read_register(address, register)[0]
+        with pytest.raises(OSError):
+            bus.read_byte(0x99, 0x00)
+
+    def test_read_byte_hardware_reuses_buffer(self):
+        class FakeI2C:
+            def readfrom_mem_into(self, address, register, buf):
+                buf[0] = register + 1
+
+        bus = I2CBus()
+        bus._i2c = FakeI2C()
+        bus._initialized = True
+        bus._simulation_mode = False
+        assert bus.read_byte(0x76, 0x10) == 0x11
+        assert bus.read_byte(0x76, 0x20) == 0x21
+
     def test_read_nonexistent(self):
         bus = I2CBus()
         bus.init()
@@ -55,6 +76,16 @@ class TestI2CBus:
         bus.init()
         bus.add_simulated_device(0x48, "ADS1115", {0x00: [0x01, 0x02]})
         assert 0x48 in bus.scan()
+        assert bus.read_register(0x48, 0x00, 2) == b"\x01\x02"
+        assert bus.read_register(0x48, 0x00, 5) == b"\x01\x02"
+        assert bus.read_register(0x48, 0x01, 2) == b"\x00\x00"
+
+    def test_sim_register_write_read(self):
+        bus = I2CBus()
+        bus.init()
+        bus.write_register(0x76, 0xF4, bytearray(b"\x27\x01"))
+        assert bus.read_register(0x76, 0xF4, 2) == b"\x27\x01"
+        assert bus.read_register(0x76, 0xD0, 3) == b"\x60\x60\x60"
 
     def test_repr(self):
         bus = I2CBus()
@@ -157,6 +188,46 @@ class TestGPIOBus:
         assert 1 in pins
         assert 2 in pins
 
+    def test_pin_reused(self):
+        bus = GPIOBus()
+        bus.init()
+        led = bus.output(13)
+        assert bus.pin(13) is led
+        assert bus.pin("LED") is bus.pin("LED")
+
+    def test_poll_pins_without_irq(self):
+        class FakePin:
+            def __init__(self):
+                self.level = 0
+
+            def value(self):
+                return self.level
+
+        bus = GPIOBus()
+        bus.init()
+        fakes = {}
+        events = []
+        for number in (4, 12, 13):
+            pin = bus.input(number)
+            pin._simulation_mode = False
+            pin._pin = fakes[number] = FakePin()
+            pin.on_change(lambda n=number: events.append(n))
+        fakes[13].level = 1
+        assert bus.poll() == []  # first sample is the baseline
+
+        fakes[4].level = 1
+        fakes[13].level = 0
+        assert bus.poll() == [4, 13]
+        assert events == [4, 13]
+        assert bus.poll() == []
+
+        # Simulated pins already fire as they're written
+        sim = bus.output(2)
+        sim.on_change(lambda: events.append(2))
+        sim.on()
+        assert bus.poll() == []
+        assert events == [4, 13, 2]
+
     def test_deinit(self):
         bus = GPIOBus()
         bus.init()
@@ -194,6 +265,17 @@ class TestUARTBus:
         remaining = bus.read()
         assert remaining == b" data"
 
+    def test_read_in_chunks(self):
+        bus = UARTBus()
+        bus.init()
+        bus.sim_receive(b"abcdef")
+        buffer = bus._sim_rx_buffer
+        assert [bus.read(2) for _ in range(4)] == [b"ab", b"cd", b"ef", b""]
+        # Consumed in place rather than replaced by a copy
+        assert bus._sim_rx_buffer is buffer
+        bus.sim_receive(b"gh")
+        assert bus.read() == b"gh"
+
     def test_any(self):
         bus = UARTBus()
         bus.init()
@@ -255,6 +337,34 @@ class TestOneWireBus:
         temps = bus.read_all_ds18b20()
         assert len(temps) > 0
 
+    def test_read_all_converts_once(self, monkeypatch):
+        from bitbound.buses import onewire
+
+        class FakeOW:
+            def scan(self):
+                return [b"\x28" + bytes(7), b"\x28" + bytes([1] * 7)]
+
+        class FakeDS:
+            conversions = 0
+
+            def convert_temp(self):
+                FakeDS.conversions += 1
+
+            def read_temp(self, rom):
+                return 20.0 + rom[1]
+
+        sleeps = []
+        monkeypatch.setattr(onewire, "_sleep_ms", sleeps.append)
+        bus = OneWireBus()
+        bus._initialized = True
+        bus._simulation_mode = False
+        bus._ow = FakeOW()
+        bus._ds = FakeDS()
+        temps = bus.read_all_ds18b20()
+        assert temps == {b"\x28" + bytes(7): 20.0, b"\x28" + bytes([1] * 7): 21.0}
+        assert FakeDS.conversions == 1
+        assert sleeps == [onewire.DS18B20_CONVERSION_MS]
+
     def test_reset(self):
         bus = OneWireBus()
         bus.init()
@@ -286,6 +396,10 @@ class TestBusFactory:
         bus = BusFactory.create("ONEWIRE")
         assert isinstance(bus, OneWireBus)
 
+    def test_create_case_insensitive(self):
+        assert isinstance(BusFactory.create("i2c"), I2CBus)
+        assert isinstance(BusFactory.create("OneWire"), OneWireBus)
+
     def test_create_unknown(self):
         with pytest.raises(ValueError):
             BusFactory.create("UNKNOWN_BUS")
@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import patch
-from bitbound.cli import create_parser, cmd_boards, cmd_info, cmd_scan
+from bitbound.cli import create_parser, cmd_boards, cmd_info, cmd_scan, cmd_monitor
 
 
 class TestCLIParser:
@@ -10,6 +10,15 @@ class TestCLIParser:
         parser = create_parser()
         assert parser is not None
 
+    def test_parser_is_reused(self):
+        parser = create_parser()
+        assert create_parser() is parser
+        first = parser.parse_args(["scan", "--bus", "i2c"])
+        second = parser.parse_args(["boards"])
+        assert first.command == "scan"
+        assert second.command == "boards"
+        assert not hasattr(second, "bus")
+
     def test_version_flag(self):
         parser = create_parser()
         with pytest.raises(SystemExit) as exc:
@@ -64,6 +73,7 @@ class TestCLIParser:
         parser = create_parser()
         args = parser.parse_args(["boards"])
         assert args.command == "boards"
+        assert args.func is cmd_boards
 
 
 class TestCLICommands:
@@ -89,3 +99,53 @@ class TestCLICommands:
         cmd_scan(args)
         output = capsys.readouterr().out
         assert "I2C" in output
+
+    def test_cmd_scan_all_json(self, capsys):
+        import json
+        parser = create_parser()
+        args = parser.parse_args(["scan", "--json"])
+        cmd_scan(args)
+        output = capsys.readouterr().out
+        payload = json.loads(output[output.index("{"):])
+        assert "i2c" in payload
+        assert "discovered" in payload
+
+    def test_cmd_monitor_json(self, capsys):
+        import json
+        parser = create_parser()
+        args = parser.parse_args(["monitor", "--interval", "0.01", "--count", "3", "--json"])
+        cmd_monitor(args)
+        lines = [l for l in capsys.readouterr().out.splitlines() if l.startswith("{")]
+        assert len(lines) == 3
+        assert "temperature" in json.loads(lines[0])
+
+    def test_cmd_init_template(self, tmp_path, monkeypatch):
+        from bitbound.cli import cmd_init
+        monkeypatch.chdir(tmp_path)
+        parser = create_parser()
+        args = parser.parse_args(["init", "proj", "--template", "alarm"])
+        cmd_init(args)
+        main_code = (tmp_path / "proj" / "main.py").read_text(encoding="utf-8")
+        assert "Motion Alarm Template" in main_code
+        assert (tmp_path / "proj" / "config.json").exists()
+
+    def test_config_show_compact_when_piped(self, capsys, tmp_path):
+        from bitbound.cli import cmd_config
+        path = tmp_path / "config.json"
+        path.write_text('{"wifi": {"ssid": "Net"}}')
+        parser = create_parser()
+        args = parser.parse_args(["config", "show", "--file", str(path)])
+        cmd_config(args)
+        assert capsys.readouterr().out.strip() == '{"wifi":{"ssid":"Net"}}'
+
+
+class TestCLIStartup:
+    def test_parser_does_not_load_hardware(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys; from bitbound.cli import create_parser; create_parser(); "
+            "sys.exit('bitbound.hardware' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code])
+        assert result.returncode == 0
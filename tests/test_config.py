@@ -83,6 +83,14 @@ class TestConfig:
         assert loaded.get("test") == "data"
         os.unlink(path)
 
+    def test_from_file_non_ascii_and_invalid(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_bytes('{"wifi": {"ssid": "Café"}}'.encode("utf-8"))
+        assert Config.from_file(str(path)).get("wifi.ssid") == "Café"
+
+        path.write_bytes(b'{"wifi": ')
+        assert Config.from_file(str(path)).to_dict() == {}
+
     def test_from_file_missing(self):
         config = Config.from_file("nonexistent_file.json")
         assert config.to_dict() == {}
@@ -126,3 +134,32 @@ class TestConfig:
         for name, profile in DEVICE_PROFILES.items():
             for key in required_keys:
                 assert key in profile, f"{name} missing {key}"
+
+    def test_merge_nested_deep(self):
+        config = Config(data={"a": {"b": {"c": 1, "d": 2}}})
+        config.merge({"a": {"b": {"d": 3, "e": 4}, "f": 5}})
+        assert config.get("a.b.c") == 1
+        assert config.get("a.b.d") == 3
+        assert config.get("a.b.e") == 4
+        assert config.get("a.f") == 5
+
+    def test_board_profile_not_shared(self):
+        config = Config(board="esp32")
+        config.set("i2c.scl", 5)
+        assert Config.get_board_profile("esp32")["i2c"]["scl"] == 22
+        assert Config(board="ESP32").get("i2c.scl") == 22
+
+    def test_board_profile_is_a_copy(self):
+        import json
+        profile = Config.get_board_profile("esp32")
+        assert json.loads(json.dumps(profile))["i2c"] == {"scl": 22, "sda": 21}
+        profile["board"] = "other"
+        profile["i2c"]["scl"] = 5
+        assert DEVICE_PROFILES["esp32"]["board"] == "ESP32"
+        assert DEVICE_PROFILES["esp32"]["i2c"]["scl"] == 22
+
+    def test_get_through_non_dict(self):
+        config = Config(data={"board": "esp32", "pins": [1, 2]})
+        assert config.get("board.name", "x") == "x"
+        assert config.get("pins.0") is None
+        assert config.get("missing.key", 7) == 7
@@ -4,41 +4,36 @@ import pytest
 from bitbound import Hardware
 
 
+@pytest.fixture(scope="module")
+def bme280():
+    """One simulated BME280 shared by the read-only sensor tests."""
+    with Hardware() as hw:
+        yield hw.attach("I2C", type="BME280")
+
+
 class TestBME280:
-    def test_attach(self):
-        hw = Hardware()
-        sensor = hw.attach("I2C", type="BME280")
-        assert sensor is not None
-        assert sensor.connected
+    def test_attach(self, bme280):
+        assert bme280 is not None
+        assert bme280.connected
 
-    def test_read_temperature(self):
-        hw = Hardware()
-        sensor = hw.attach("I2C", type="BME280")
-        temp = sensor.temperature
+    def test_read_temperature(self, bme280):
+        temp = bme280.temperature
         assert isinstance(temp, (int, float))
 
-    def test_read_humidity(self):
-        hw = Hardware()
-        sensor = hw.attach("I2C", type="BME280")
-        hum = sensor.humidity
+    def test_read_humidity(self, bme280):
+        hum = bme280.humidity
         assert isinstance(hum, (int, float))
 
-    def test_read_pressure(self):
-        hw = Hardware()
-        sensor = hw.attach("I2C", type="BME280")
-        pressure = sensor.pressure
+    def test_read_pressure(self, bme280):
+        pressure = bme280.pressure
         assert isinstance(pressure, (int, float))
 
-    def test_read_altitude(self):
-        hw = Hardware()
-        sensor = hw.attach("I2C", type="BME280")
-        alt = sensor.altitude
+    def test_read_altitude(self, bme280):
+        alt = bme280.altitude
         assert isinstance(alt, (int, float))
 
-    def test_read_all(self):
-        hw = Hardware()
-        sensor = hw.attach("I2C", type="BME280")
-        data = sensor.read_all()
+    def test_read_all(self, bme280):
+        data = bme280.read_all()
         assert "temperature" in data
         assert "humidity" in data
         assert "pressure" in data
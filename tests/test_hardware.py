@@ -132,6 +132,61 @@ class TestSensorEvents:
         sensor.remove_handler(handler)
         # Should not raise
 
+    def test_interval_handlers_fire_on_schedule(self, monkeypatch):
+        import time
+        from bitbound.event import EventLoop, EventType
+        
+        clock = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        hw = Hardware()
+        sensor = hw.attach("I2C", type="BME280")
+        loop = EventLoop(poll_interval_ms=1000)
+        fast, slow = [], []
+        loop.on_interval(125, sensor, fast.append)
+        slow_handler = loop.on_interval(250, sensor, slow.append)
+        
+        assert loop._run_intervals() == 100.125
+        for _ in range(8):
+            clock[0] += 0.125
+            loop._run_intervals()
+        assert (len(fast), len(slow)) == (8, 4)
+        assert fast[0].event_type == EventType.INTERVAL
+        assert fast[0].source is sensor
+        
+        loop.remove_handler(slow_handler)
+        clock[0] += 0.5
+        loop._run_intervals()
+        assert (len(fast), len(slow)) == (9, 4)
+        
+        # After an overrun the missed slots are skipped, not replayed
+        clock[0] += 10.0
+        assert loop._run_intervals() == clock[0] + 0.125
+        assert len(fast) == 10
+    
+    def test_interval_handler_removed_mid_tick(self, monkeypatch):
+        import time
+        from bitbound.event import EventLoop
+        
+        clock = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        loop = EventLoop(poll_interval_ms=1000)
+        fired = []
+        handlers = []
+        loop.on_interval(100, None, lambda e: (fired.append("a"), loop.remove_handler(handlers[0])))
+        handlers.append(loop.on_interval(100, None, lambda e: fired.append("b")))
+        
+        clock[0] += 0.1
+        loop._run_intervals()
+        assert fired == ["a"]
+    
+    def test_interval_must_be_positive(self):
+        from bitbound.event import EventLoop
+        
+        loop = EventLoop()
+        with pytest.raises(ValueError):
+            loop.on_interval(0, object(), lambda e: None)
+        assert not loop._schedule
+
 
 class TestBME280:
     """Tests specifically for BME280 sensor."""
@@ -1,5 +1,8 @@
 """Tests for HTTP Client and Server."""
 
+import socket
+import time
+
 import pytest
 from bitbound.network.http import HTTPClient, HTTPServer, HTTPResponse
 
@@ -44,6 +47,13 @@ class TestHTTPClient:
         assert resp.text == '{"test": true}'
         assert resp.json()["test"] is True
 
+    def test_response_decodes_lazily(self):
+        resp = HTTPResponse(status_code=200, body=b"plain text")
+        assert resp._text is None
+        assert resp.json_data is None
+        assert resp.text == "plain text"
+        assert HTTPResponse(body=b"\xff\xfe").text == ""
+
     def test_default_headers(self):
         http = HTTPClient(headers={"Authorization": "Bearer token"})
         assert http._default_headers["Authorization"] == "Bearer token"
@@ -53,6 +63,79 @@ class TestHTTPClient:
         assert http.put("http://example.com/api").status_code == 200
         assert http.delete("http://example.com/api").status_code == 200
 
+    def test_urllib_opener_reused(self, monkeypatch):
+        http = HTTPClient()
+        http._simulation = False
+        http._backend = "urllib"
+        opened = []
+
+        class FakeResponse:
+            status = 200
+            headers = {"Content-Type": "text/plain"}
+
+            def read(self):
+                return b"ok"
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        class FakeOpener:
+            def open(self, req, timeout=None):
+                opened.append(req.full_url)
+                return FakeResponse()
+
+        import urllib.request
+        monkeypatch.setattr(urllib.request, "build_opener", lambda: FakeOpener())
+        assert http.get("http://example.com/a").text == "ok"
+        opener = http._opener
+        assert http.get("http://example.com/b").status_code == 200
+        assert http._opener is opener
+        assert opened == ["http://example.com/a", "http://example.com/b"]
+        http.close()
+        assert http._opener is None
+
+    async def test_get_many_overlaps_requests(self):
+        import threading
+        http = HTTPClient()
+        http._simulation = False
+        http._backend = "urllib"
+        barrier = threading.Barrier(3, timeout=5)
+
+        class FakeResponse:
+            status = 200
+            headers = {}
+
+            def __init__(self, url):
+                self.url = url
+
+            def read(self):
+                return self.url.encode()
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        class FakeOpener:
+            def open(self, req, timeout=None):
+                # Only returns once all three requests are in flight
+                barrier.wait()
+                return FakeResponse(req.full_url)
+
+        http._opener = FakeOpener()
+        urls = ["http://example.com/%d" % i for i in range(3)]
+        responses = await http.get_many(urls)
+        assert [r.text for r in responses] == urls
+
+    async def test_get_many_simulation(self):
+        http = self._sim_client()
+        responses = await http.get_many(["http://a", "http://b"])
+        assert [r.status_code for r in responses] == [200, 200]
+
     def test_repr(self):
         http = HTTPClient()
         assert "HTTPClient" in repr(http)
@@ -70,13 +153,13 @@ class TestHTTPServer:
         def handler(request):
             return {"status": "ok"}
 
-        assert "GET:/test" in server._routes
+        assert "/test" in server._routes["GET"]
 
     def test_add_route(self):
         server = HTTPServer()
         server.add_route("/api/data", lambda r: {"data": 42}, methods=["GET", "POST"])
-        assert "GET:/api/data" in server._routes
-        assert "POST:/api/data" in server._routes
+        assert "/api/data" in server._routes["GET"]
+        assert "/api/data" in server._routes["POST"]
 
     def test_start_stop_simulation(self):
         server = HTTPServer()
@@ -85,6 +168,152 @@ class TestHTTPServer:
         server.stop()
         assert not server.is_running
 
+    def test_response_length_counts_bytes(self):
+        class FakeClient:
+            sent = b""
+
+            def sendall(self, data):
+                self.sent += data
+
+        server = HTTPServer()
+        server.add_route("/temp", lambda r: "23.5 °C")
+        client = FakeClient()
+        server._respond(client, b"GET /temp?unit=c HTTP/1.1\r\n\r\n")
+        assert client.sent.startswith(b"HTTP/1.1 200 OK\r\nContent-Type: text/html")
+        assert b"Content-Length: 8\r\n\r\n" in client.sent
+
+        client = FakeClient()
+        server._respond(client, b"GET /missing HTTP/1.1\r\n\r\n")
+        assert client.sent.startswith(b"HTTP/1.1 404 Not Found")
+
+    def test_empty_and_failing_handlers(self):
+        def broken(request):
+            raise ValueError("boom")
+
+        server = HTTPServer()
+        server.add_route("/empty", lambda r: None)
+        server.add_route("/broken", broken)
+        assert server._render(b"GET /empty HTTP/1.1\r\n\r\n").startswith(
+            b"HTTP/1.1 204 No Content\r\n")
+        assert server._render(b"GET /broken HTTP/1.1\r\n\r\n").startswith(
+            b"HTTP/1.1 500 Internal Server Error\r\n")
+
+    def test_handler_request_fields(self):
+        seen = {}
+
+        def handler(request):
+            seen.update(method=request["method"], path=request["path"],
+                        raw=request.get("raw"))
+            return "ok"
+
+        class FakeClient:
+            def sendall(self, data):
+                pass
+
+        server = HTTPServer()
+        server.add_route("/data", handler, methods=["POST"])
+        server._respond(FakeClient(), bytearray(b"POST /data?q=1 HTTP/1.1\r\nA: b\r\n\r\n"))
+        assert seen["method"] == "POST"
+        assert seen["path"] == "/data"
+        assert seen["raw"].startswith("POST /data?q=1 HTTP/1.1\r\nA: b")
+
+    def test_parameterized_routes(self):
+        server = HTTPServer()
+        server.add_route("/api/sensors", lambda r: {"all": True})
+        server.add_route("/api/sensors/{id}", lambda r: {"id": r["params"]["id"]})
+        server.add_route("/api/{kind}/{id}/raw", lambda r: r["params"], methods=["POST"])
+
+        assert server._render(b"GET /api/sensors HTTP/1.1\r\n\r\n").endswith(b'{"all":true}')
+        assert server._render(b"GET /api/sensors/t1?x=1 HTTP/1.1\r\n\r\n").endswith(b'{"id":"t1"}')
+        assert server._render(b"POST /api/led/2/raw HTTP/1.1\r\n\r\n").endswith(
+            b'{"kind":"led","id":"2"}')
+        assert server._render(b"GET /api/sensors/t1/x HTTP/1.1\r\n\r\n").startswith(
+            b"HTTP/1.1 404")
+        assert server._render(b"GET /api/led/2/raw HTTP/1.1\r\n\r\n").startswith(
+            b"HTTP/1.1 404")
+
+    def test_serves_clients_concurrently(self):
+        probe = socket.socket()
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+        probe.close()
+
+        server = HTTPServer(host="127.0.0.1", port=port)
+        server.add_route("/api/data", lambda r: {"data": 42})
+        server.start()
+        try:
+            deadline = time.time() + 2
+            while True:
+                try:
+                    idle = socket.create_connection(("127.0.0.1", port))
+                    break
+                except OSError:
+                    if time.time() > deadline:
+                        raise
+                    time.sleep(0.01)
+
+            # A client that never sends must not block the next one
+            client = socket.create_connection(("127.0.0.1", port), timeout=2)
+            # Headers split across two segments are reassembled
+            client.sendall(b"GET /api/data HTTP/1.1\r\nHo")
+            time.sleep(0.05)
+            client.sendall(b"st: x\r\n\r\n")
+            response = b""
+            while True:
+                chunk = client.recv(4096)
+                if not chunk:
+                    break
+                response += chunk
+            client.close()
+            idle.close()
+            assert response.startswith(b"HTTP/1.1 200 OK")
+            assert b"Content-Length: 11\r\n" in response
+            assert response.endswith(b'{"data":42}')
+        finally:
+            started = time.time()
+            server.stop()
+            assert time.time() - started < 1
+
+    def test_slow_reader_does_not_block(self):
+        probe = socket.socket()
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+        probe.close()
+
+        server = HTTPServer(host="127.0.0.1", port=port)
+        server.add_route("/big", lambda r: "x" * (8 * 1024 * 1024))
+        server.add_route("/small", lambda r: "ok")
+        server.start()
+        try:
+            deadline = time.time() + 2
+            while True:
+                try:
+                    slow = socket.create_connection(("127.0.0.1", port))
+                    break
+                except OSError:
+                    if time.time() > deadline:
+                        raise
+                    time.sleep(0.01)
+
+            # This response can't fit in the socket buffers and is never read
+            slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            slow.sendall(b"GET /big HTTP/1.1\r\n\r\n")
+            time.sleep(0.05)
+
+            client = socket.create_connection(("127.0.0.1", port), timeout=2)
+            client.sendall(b"GET /small HTTP/1.1\r\n\r\n")
+            response = b""
+            while True:
+                chunk = client.recv(4096)
+                if not chunk:
+                    break
+                response += chunk
+            client.close()
+            slow.close()
+            assert response.endswith(b"\r\n\r\nok")
+        finally:
+            server.stop()
+
     def test_repr(self):
         server = HTTPServer(host="0.0.0.0", port=80)
         assert "HTTPServer" in repr(server)
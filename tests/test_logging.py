@@ -1,12 +1,17 @@
 """Tests for Data Logger."""
 
 import os
+import threading
 import time
 import tempfile
 import pytest
 from bitbound.logging.datalogger import DataLogger, LogFormat, LogEntry
 from bitbound.logging.ringbuffer import RingBuffer
-from bitbound.logging.storage import Storage, FileStorage
+from bitbound.logging.storage import Storage, FileStorage, SQLiteStorage
+
+
+def _size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
 
 
 class TestLogEntry:
@@ -15,6 +20,26 @@ class TestLogEntry:
         assert entry.values["temperature"] == 23.5
         assert entry.timestamp > 0
 
+    def test_timestamps_never_decrease(self):
+        stamps = [LogEntry().timestamp for _ in range(100)]
+        assert stamps == sorted(stamps)
+        assert abs(stamps[-1] - time.time()) < 5
+
+    def test_empty_defaults_shared_and_serializable(self):
+        import json
+        a, b = LogEntry(), LogEntry()
+        assert a.tags is b.tags
+        with pytest.raises(TypeError):
+            a.tags["x"] = "y"
+        assert json.loads(a.to_json())["tags"] == {}
+
+    def test_slotted_and_comparable(self):
+        entry = LogEntry(timestamp=1.0, device_name="s", values={"v": 1})
+        assert not hasattr(entry, "__dict__")
+        assert entry == LogEntry(1.0, "s", {"v": 1})
+        assert entry != LogEntry(1.0, "s", {"v": 2})
+        assert repr(entry).startswith("LogEntry(timestamp=1.0, device_name='s'")
+
     def test_to_csv(self):
         entry = LogEntry(
             timestamp=1000.0,
@@ -31,6 +56,13 @@ class TestLogEntry:
         assert "temp" in json_str
         assert "23.5" in json_str
 
+    def test_to_json_bytes(self):
+        import json
+        entry = LogEntry(timestamp=1.0, device_name="s", values={"temp": 23.5})
+        data = entry.to_json_bytes()
+        assert isinstance(data, bytes)
+        assert json.loads(data) == entry.to_dict()
+
     def test_to_dict(self):
         entry = LogEntry(device_name="test", values={"v": 1})
         d = entry.to_dict()
@@ -60,6 +92,218 @@ class TestDataLogger:
             assert logger.entry_count == 2
             logger.close()
 
+    def test_flush_writes_queued_entries(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger("test", path=tmpdir, format=LogFormat.JSONL)
+            for i in range(5):
+                logger.log({"v": i})
+            logger.flush()
+            with open(os.path.join(tmpdir, "test.jsonl")) as f:
+                assert len(f.read().splitlines()) == 5
+            logger.close()
+
+    def test_flush_times_out_on_stuck_writer(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger("test", path=tmpdir, format=LogFormat.JSONL)
+            logger.log({"v": 1})
+            release = threading.Event()
+            monkeypatch.setattr(logger, "_flush_file", lambda: release.wait())
+            assert logger.flush(timeout=0.05) is False
+            release.set()
+            assert logger.flush() is True
+            logger.close()
+
+    def test_memory_only_logger_has_no_writer(self):
+        logger = DataLogger("test", path=None)
+        logger.log({"v": 1})
+        assert logger._writer is None
+        assert logger.flush() is True
+        assert logger.get_entries()[0].values == {"v": 1}
+        logger.close()
+
+    def test_unclosed_logger_is_collected(self):
+        import gc
+        import weakref
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger("test", path=tmpdir, format=LogFormat.JSONL)
+            logger.log({"v": 1})
+            writer = logger._writer
+            ref = weakref.ref(logger)
+            del logger
+            gc.collect()
+            assert ref() is None
+            writer.join(2)
+            assert not writer.is_alive()
+
+    def test_sync_seconds_groups_fsyncs(self, monkeypatch):
+        from bitbound.logging import datalogger
+
+        synced = []
+        monkeypatch.setattr(datalogger, "_sync_handle", synced.append)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Every entry is written out, but only the first write is synced
+            logger = DataLogger("test", path=tmpdir, format=LogFormat.JSONL,
+                                flush_interval=1, sync_seconds=60)
+            for i in range(10):
+                logger.log({"v": i})
+            logger.flush()
+            # ...and flush() syncs whatever followed it
+            assert len(synced) == 2
+            logger.close()
+            assert len(synced) == 2
+
+    def test_buffered_data_flushed_by_age(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger(
+                "test", path=tmpdir, format=LogFormat.JSONL, flush_seconds=0.05
+            )
+            logger.log({"v": 1})
+            path = os.path.join(tmpdir, "test.jsonl")
+            deadline = time.time() + 2
+            while time.time() < deadline and not _size(path):
+                time.sleep(0.01)
+            assert _size(path) > 0
+            logger.close()
+
+    def test_buffered_data_flushed_by_size(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger(
+                "test", path=tmpdir, format=LogFormat.JSONL,
+                flush_bytes=100, flush_seconds=0,
+            )
+            for i in range(10):
+                logger.log({"v": i})
+            deadline = time.time() + 2
+            path = os.path.join(tmpdir, "test.jsonl")
+            while time.time() < deadline and _size(path) < 100:
+                time.sleep(0.01)
+            assert _size(path) >= 100
+            logger.close()
+
+    def test_buffered_writes_span_buffers(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger(
+                "test", path=tmpdir, format=LogFormat.CSV,
+                flush_interval=0, buffer_size=64, buffer_count=2,
+            )
+            for i in range(20):
+                logger.log({"value": i})
+            logger.log({"value": "x" * 200})  # larger than one buffer
+            logger.close()
+            with open(os.path.join(tmpdir, "test.csv")) as f:
+                lines = f.read().splitlines()
+            assert lines[0] == "timestamp,device,value"
+            assert len(lines) == 22
+            assert lines[-1].endswith("x" * 200)
+
+    def test_flush_json_array(self):
+        import json
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger(
+                "test", path=tmpdir, format=LogFormat.JSON, buffer_size=64
+            )
+            for i in range(20):
+                logger.log({"v": i}, device_name="s")
+            logger.flush()
+            with open(os.path.join(tmpdir, "test.json")) as f:
+                data = json.load(f)
+            assert [d["values"]["v"] for d in data] == list(range(20))
+            assert data[0]["device"] == "s"
+            logger.close()
+
+    def test_log_binary(self):
+        import math
+        import struct
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger(
+                "test", path=tmpdir, format=LogFormat.BINARY, buffer_size=64
+            )
+            for i in range(10):
+                logger.log({"temp": 20.0 + i, "hum": i})
+            logger.log({"temp": None})
+            logger.close()
+            with open(os.path.join(tmpdir, "test.bin"), "rb") as f:
+                data = f.read()
+
+        assert data[:4] == b"BBLG"
+        version, count = struct.unpack_from("<BH", data, 4)
+        assert (version, count) == (1, 2)
+        offset = 7
+        keys = []
+        for _ in range(count):
+            (n,) = struct.unpack_from("<H", data, offset)
+            keys.append(data[offset + 2:offset + 2 + n].decode())
+            offset += 2 + n
+        assert keys == ["temp", "hum"]
+
+        rows = list(struct.iter_unpack("<ddd", data[offset:]))
+        assert len(rows) == 11
+        assert rows[3][1:] == (23.0, 3.0)
+        assert math.isnan(rows[-1][1]) and math.isnan(rows[-1][2])
+
+    def test_rotation_switches_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger(
+                "test", path=tmpdir, format=LogFormat.JSONL,
+                rotate=True, max_entries=3, max_files=3,
+            )
+            for i in range(7):
+                logger.log({"v": i})
+            logger.close()
+            assert sorted(os.listdir(tmpdir)) == ["test.jsonl", "test_1.jsonl", "test_2.jsonl"]
+            with open(os.path.join(tmpdir, "test_2.jsonl")) as f:
+                assert len(f.read().splitlines()) == 1
+
+    def test_csv_rows_follow_header(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger("test", path=tmpdir, format=LogFormat.CSV)
+            logger.log({"a": 1, "b": 2}, device_name="d")
+            logger.log({"b": 4, "a": 3}, device_name="d")
+            logger.log({"c": 5}, device_name="d")
+            logger.close()
+            with open(os.path.join(tmpdir, "test.csv")) as f:
+                lines = [line.split(",", 1)[1] for line in f.read().splitlines()[1:]]
+            assert lines == ["d,1,2", "d,3,4", "d,5"]
+
+    def test_csv_values_kept_after_empty_first_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger("test", path=tmpdir, format=LogFormat.CSV)
+            logger.log({}, device_name="d")
+            logger.log({"a": 1}, device_name="d")
+            logger.close()
+            with open(os.path.join(tmpdir, "test.csv")) as f:
+                lines = [line.split(",", 1)[1] for line in f.read().splitlines()[1:]]
+            assert lines == ["d", "d,1"]
+
+    def test_format_given_as_string(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger("test", path=tmpdir, format="csv")
+            logger.log({"a": 1}, device_name="d")
+            logger.close()
+            assert "format=csv" in repr(logger)
+            with open(os.path.join(tmpdir, "test.csv")) as f:
+                assert f.read().splitlines()[0] == "timestamp,device,a"
+
+    def test_log_from_many_threads(self):
+        import threading
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger("test", path=tmpdir, format=LogFormat.JSONL)
+
+            def produce():
+                for i in range(50):
+                    logger.log({"v": i})
+
+            threads = [threading.Thread(target=produce) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            logger.close()
+            assert logger.entry_count == 200
+            with open(os.path.join(tmpdir, "test.jsonl")) as f:
+                assert len(f.read().splitlines()) == 200
+
     def test_get_entries(self):
         logger = DataLogger("test")
         logger.log({"a": 1})
@@ -78,6 +322,35 @@ class TestDataLogger:
         assert len(entries) == 2
         logger.close()
 
+    def test_get_entries_since(self):
+        logger = DataLogger("test")
+        first = logger.log({"v": 1})
+        time.sleep(0.01)
+        second = logger.log({"v": 2})
+        logger.log({"v": 3})
+        entries = logger.get_entries(since=second.timestamp)
+        assert [e.values["v"] for e in entries] == [2, 3]
+        assert len(logger.get_entries(since=first.timestamp)) == 3
+        logger.close()
+
+    def test_log_devices_properties(self):
+        class Sensor:
+            name = "s1"
+            temperature = 21.5
+            humidity = 40
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = DataLogger("test", path=tmpdir)
+            logger.add_device(Sensor(), properties=["temperature", "humidity"])
+            logger.add_device(Sensor(), properties=["temperature"], name="s2")
+            logger.add_device(Sensor(), properties=["temperature", "missing"], name="s3")
+            logger._log_devices()
+            entries = logger.get_entries()
+            assert entries[0].values == {"temperature": 21.5, "humidity": 40}
+            assert entries[1].values == {"temperature": 21.5}
+            assert entries[2].values == {"temperature": 21.5, "missing": None}
+            logger.close()
+
     def test_clear_entries(self):
         logger = DataLogger("test")
         logger.log({"v": 1})
@@ -191,6 +464,77 @@ class TestRingBuffer:
         buf.append({"v": 2})
         assert len(buf) == 2
 
+    def test_stats_after_overwrite(self):
+        buf = RingBuffer(capacity=3)
+        buf.append({"v": 100, "label": "a"})
+        buf.append({"v": 2})
+        buf.append({"v": 4})
+        buf.append({"other": 1})  # evicts v=100 and leaves this slot without v
+        assert buf.average("v") == 3.0
+        assert buf.max_value("v") == 4
+        assert buf.min_value("label") is None
+
+    def test_stats(self):
+        buf = RingBuffer(capacity=3)
+        for t, h in ((20.0, 40), (22.0, 50), (24.0, 60), (26.0, 70)):
+            buf.append({"temp": t, "hum": h})
+        assert buf.stats(["temp", "hum", "missing"]) == {
+            "temp": (24.0, 22.0, 26.0),
+            "hum": (60.0, 50, 70),
+            "missing": (None, None, None),
+        }
+        assert buf.min_value("temp") == 22.0
+
+    def test_min_max_follow_appends(self):
+        buf = RingBuffer(capacity=2)
+        buf.append({"v": 5})
+        assert (buf.min_value("v"), buf.max_value("v")) == (5, 5)
+        buf.append({"v": 1})
+        assert (buf.min_value("v"), buf.max_value("v")) == (1, 5)
+        buf.append({"v": 3})  # evicts 5
+        assert (buf.min_value("v"), buf.max_value("v")) == (1, 3)
+        buf.clear()
+        assert buf.min_value("v") is None
+
+    def test_window_with_non_power_of_two_capacity(self):
+        buf = RingBuffer(capacity=5)
+        for i in range(12):
+            buf.append({"v": i}, timestamp=float(i + 1))
+        assert buf.capacity == 5
+        assert [e.values["v"] for e in buf.all()] == [7, 8, 9, 10, 11]
+        assert buf.latest(2)[1].values["v"] == 10
+        assert buf.average("v") == 9.0
+        assert buf.min_value("v") == 7
+        assert len(buf.since(0)) == 5
+
+    def test_since_after_wrap(self):
+        buf = RingBuffer(capacity=6)
+        for i in range(15):
+            buf.append({"v": i}, timestamp=100.0 + i)
+        assert [e.values["v"] for e in buf.since(111.5)] == [12, 13, 14]
+        assert len(buf.since(0)) == 6
+        buf.append({"v": 99}, timestamp=50.0)  # out of order
+        assert [e.values["v"] for e in buf.since(113)] == [13, 14]
+        # Once the step back has left the window, since() bisects again
+        for i in range(6):
+            buf.append({"v": i}, timestamp=60.0 + i)
+        assert buf._seq - buf.count >= buf._descent
+        assert [e.values["v"] for e in buf.since(63.5)] == [4, 5]
+
+    def test_running_average_tracks_window(self):
+        import random
+        rng = random.Random(1)
+        buf = RingBuffer(capacity=60)
+        window = []
+        for i in range(1000):
+            v = rng.uniform(-40.0, 85.0)
+            buf.append({"t": v} if i % 7 else {"other": v})
+            window = (window + [v if i % 7 else None])[-60:]
+        expected = [v for v in window if v is not None]
+        assert buf.average("t") == pytest.approx(sum(expected) / len(expected), rel=1e-12)
+        buf.clear()
+        assert buf.average("t") is None
+
     def test_average_missing_key(self):
         buf = RingBuffer(capacity=5)
         buf.append({"v": 1})
@@ -251,7 +595,51 @@ class TestStorage:
             assert len(storage.list_keys()) == 0
 
 
+class TestSQLiteStorage:
+    def test_round_trip_and_batch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SQLiteStorage(tmpdir)
+            assert storage.save("config", {"ssid": "MyNetwork"})
+            assert storage.batch_save({"a": 1, "b": [1, 2], "config": {"ssid": "Other"}})
+            assert storage.load("config") == {"ssid": "Other"}
+            assert storage.load("missing", 5) == 5
+            assert storage.exists("a") and not storage.exists("missing")
+            assert sorted(storage.list_keys()) == ["a", "b", "config"]
+            assert storage.delete("a") and not storage.delete("a")
+            storage.clear()
+            assert storage.list_keys() == []
+            storage.close()
+
+    def test_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = SQLiteStorage(tmpdir)
+            first.save("count", 3)
+            first.close()
+            second = SQLiteStorage(tmpdir)
+            assert second.load("count") == 3
+            second.close()
+
+
 class TestFileStorage:
+    def test_errors_are_rate_limited(self, caplog):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fs = FileStorage(tmpdir)
+            with caplog.at_level("ERROR", logger="bitbound.logging"):
+                for _ in range(50):
+                    assert not fs.copy("missing.bin", "out.bin")
+            records = [r for r in caplog.records if "copy error" in r.getMessage()]
+            assert 1 <= len(records) <= 10
+
+    def test_copy_and_move(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fs = FileStorage(tmpdir)
+            data = os.urandom(200 * 1024)
+            fs.write_bytes("a.bin", data)
+            assert fs.copy("a.bin", "b.bin")
+            assert fs.read_bytes("b.bin") == data
+            assert fs.move("b.bin", "c.bin")
+            assert not fs.exists("b.bin") and fs.read_bytes("c.bin") == data
+
     def test_write_and_read_text(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             fs = FileStorage(tmpdir)
@@ -266,6 +654,13 @@ class TestFileStorage:
             data = fs.read_bytes("data.bin")
             assert data == b"\x00\x01\x02"
 
+    def test_write_bytes_overwrites_and_syncs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fs = FileStorage(tmpdir)
+            fs.write_bytes("data.bin", b"long original content")
+            assert fs.write_bytes("data.bin", b"short", sync=True) is True
+            assert fs.read_bytes("data.bin") == b"short"
+
     def test_append_text(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             fs = FileStorage(tmpdir)
@@ -275,6 +670,53 @@ class TestFileStorage:
             assert "line1" in content
             assert "line2" in content
 
+    def test_append_text_reuses_handle(self):
+        from bitbound.logging import storage
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fs = FileStorage(tmpdir)
+            fs.append_text("log.txt", "a\n")
+            handle = fs._appenders[fs._full_path("log.txt")]
+            fs.append_text("log.txt", "b\n")
+            assert fs._appenders[fs._full_path("log.txt")] == handle
+            assert fs.read_text("log.txt") == "a\nb\n"
+
+            # Deleting or moving a file drops its handle, so later appends
+            # land in the new file rather than the unlinked one
+            assert fs.move("log.txt", "old.txt")
+            fs.append_text("log.txt", "c\n")
+            assert fs.read_text("log.txt") == "c\n"
+            assert fs.delete("log.txt")
+            fs.append_text("log.txt", "d\n")
+            assert fs.read_text("log.txt") == "d\n"
+
+            for i in range(storage.APPEND_HANDLES + 2):
+                fs.append_text(f"f{i}.txt", "x")
+            assert len(fs._appenders) == storage.APPEND_HANDLES
+            fs.close()
+            assert not fs._appenders
+
+    def test_append_handles_closed_on_exit_and_collection(self, monkeypatch):
+        import gc
+        from bitbound.logging import storage
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with FileStorage(tmpdir) as fs:
+                fs.append_text("log.txt", "a")
+                handles = fs._appenders
+            assert not handles
+
+            closed = []
+            real_close = storage._close_handle
+            monkeypatch.setattr(storage, "_close_handle",
+                                lambda h: closed.append(h) or real_close(h))
+            fs = FileStorage(tmpdir)
+            fs.append_text("log.txt", "b")
+            handle = fs._appenders[fs._full_path("log.txt")]
+            del fs
+            gc.collect()
+            assert closed == [handle]
+
     def test_file_size(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             fs = FileStorage(tmpdir)
@@ -1,7 +1,9 @@
 """Tests for MQTT Client."""
 
 import pytest
-from bitbound.network.mqtt import MQTTClient, MQTTConfig
+from bitbound.network.mqtt import (
+    MQTTClient, MQTTConfig, _compile_topic, _level_matcher, _mqtt_backend,
+)
 
 
 class TestMQTTClient:
@@ -32,12 +34,70 @@ class TestMQTTClient:
         mqtt.connect()
         result = mqtt.publish("test/topic", {"temp": 23.5})
         assert result is True
+        assert mqtt.messages == [("test/topic", b'{"temp":23.5}')]
 
     def test_publish_number(self):
         mqtt = MQTTClient()
         mqtt.connect()
         assert mqtt.publish("test/temp", 23.5) is True
         assert mqtt.publish("test/count", 42) is True
+        raw = b"\x00\x01"
+        assert mqtt.publish("test/raw", raw) is True
+        messages = mqtt.messages
+        assert messages == [("test/temp", b"23.5"), ("test/count", b"42"), ("test/raw", raw)]
+        assert messages[2][1] is raw
+
+    def test_publish_many_simulation(self):
+        mqtt = MQTTClient()
+        mqtt.connect()
+        assert mqtt.publish_many("sensors/", {"temperature": 23.5, "humidity": 45}) is True
+        assert mqtt.messages == [
+            ("sensors/temperature", b"23.5"),
+            ("sensors/humidity", b"45"),
+        ]
+
+    def test_publish_many_umqtt_single_write(self):
+        class FakeSock:
+            def __init__(self):
+                self.writes = []
+
+            def write(self, data):
+                self.writes.append(bytes(data))
+
+        class FakeUMQTT:
+            def __init__(self):
+                self.sock = FakeSock()
+
+        mqtt = MQTTClient()
+        mqtt._client = FakeUMQTT()
+        mqtt._simulation = False
+        mqtt._connected = True
+        mqtt._bytes_topics = True
+        assert mqtt.publish_many("s/", {"t": 23.5, "h": "x" * 200}) is True
+        assert mqtt._client.sock.writes == [
+            b"\x30\x09\x00\x03s/t23.5"
+            + b"\x30\xcd\x01\x00\x03s/h" + b"x" * 200
+        ]
+
+    def test_publish_many_umqtt_bad_payload(self):
+        class FakeSock:
+            def __init__(self):
+                self.writes = []
+
+            def write(self, data):
+                self.writes.append(bytes(data))
+
+        class FakeUMQTT:
+            def __init__(self):
+                self.sock = FakeSock()
+
+        mqtt = MQTTClient()
+        mqtt._client = FakeUMQTT()
+        mqtt._simulation = False
+        mqtt._connected = True
+        mqtt._bytes_topics = True
+        assert mqtt.publish_many("s/", {"t": 23.5, "h": None}) is False
+        assert mqtt._client.sock.writes == []
 
     def test_subscribe_and_receive(self):
         received = []
@@ -60,6 +120,71 @@ class TestMQTTClient:
         assert mqtt._topic_matches("sensors/#", "sensors/temp") is True
         assert mqtt._topic_matches("sensors/+", "sensors/temp") is True
         assert mqtt._topic_matches("sensors/temp", "sensors/humidity") is False
+        assert mqtt._topic_matches("sensors/+/temp", "sensors/a/b") is False
+        mqtt.subscribe("sensors/+/temp", lambda t, m: None)
+        assert mqtt._topic_matches("sensors/+/temp", "sensors/kitchen/temp") is True
+
+    def test_level_matcher_agrees_with_regex(self):
+        patterns = ["#", "+", "a/#", "a/+", "a/+/c", "+/b", "a/b/#", "+/+"]
+        topics = ["", "a", "a/", "a/b", "a/b/c", "a/bc/c", "ab/b", "a/b/c/d", "/b"]
+        for pattern in patterns:
+            regex = _compile_topic(pattern)
+            matches = _level_matcher(pattern)
+            for topic in topics:
+                assert matches(topic) == bool(regex(topic)), (pattern, topic)
+
+    def test_deliver_exact_and_wildcard(self):
+        received = []
+        mqtt = MQTTClient()
+        mqtt.connect()
+        mqtt.subscribe("home/+/temp", lambda t, m: received.append("plus"))
+        mqtt.subscribe("home/#", lambda t, m: received.append("hash"))
+        mqtt.subscribe("home/kitchen/temp", lambda t, m: received.append("exact"))
+        mqtt.subscribe("office/temp", lambda t, m: received.append("other"))
+        mqtt.publish("home/kitchen/temp", "21")
+        assert sorted(received) == ["exact", "hash", "plus"]
+
+        received.clear()
+        mqtt.unsubscribe("home/#")
+        mqtt.publish("home/kitchen/humidity", "40")
+        assert received == []
+
+    def test_subscribe_from_callback(self):
+        received = []
+        mqtt = MQTTClient()
+        mqtt.connect()
+
+        def first(topic, msg):
+            received.append("first")
+            mqtt.subscribe("a/b", lambda t, m: received.append("late"))
+
+        mqtt.subscribe("a/b", first)
+        mqtt.publish("a/b", "1")
+        assert received == ["first"]
+        mqtt.publish("a/b", "2")
+        assert received == ["first", "first", "late"]
+
+    def test_topic_cache_round_trip(self):
+        mqtt = MQTTClient()
+        raw = mqtt._encode_topic("sensors/temp")
+        assert raw == b"sensors/temp"
+        assert mqtt._encode_topic("sensors/temp") is raw
+        topic = mqtt._decode_topic(raw)
+        assert topic == "sensors/temp"
+        assert mqtt._decode_topic(b"sensors/temp") is topic
+
+    def test_messages_drain_bounded_queue(self, monkeypatch):
+        from bitbound.network import mqtt as mqtt_module
+        monkeypatch.setattr(mqtt_module, "MESSAGE_QUEUE_SIZE", 3)
+        mqtt = MQTTClient()
+        mqtt.connect()
+        for i in range(5):
+            mqtt.publish("a", str(i))
+        assert [m for _, m in mqtt.messages] == [b"2", b"3", b"4"]
+        assert mqtt.messages == []
+
+    def test_backend_probed_once(self):
+        assert _mqtt_backend() is _mqtt_backend()
 
     def test_context_manager(self):
         with MQTTClient() as mqtt:
@@ -38,6 +38,8 @@ class TestOTAManager:
         assert OTAManager.version_compare("1.0.1", "1.0.0") == 1
         assert OTAManager.version_compare("1.0.0", "1.0.0") == 0
         assert OTAManager.version_compare("2.0.0", "1.9.9") == 1
+        assert OTAManager.version_compare("1.0", "1.0.0") == -1
+        assert OTAManager.version_compare("1.10.0", "1.9.0") == 1
 
     def test_progress(self):
         ota = self._sim_ota()
@@ -52,6 +54,135 @@ class TestOTAManager:
         ota.update()
         assert OTAStatus.COMPLETED in statuses
 
+    def test_download_streams_and_verifies(self, tmp_path):
+        import hashlib
+        import io
+
+        payload = bytes(range(256)) * 40  # several chunks
+
+        class FakeResponse:
+            status_code = 200
+            closed = False
+
+            def __init__(self):
+                self.raw = io.BytesIO(payload)
+
+            def close(self):
+                self.closed = True
+
+        resp = FakeResponse()
+        ota = OTAManager(current_version="1.0.0", backup_path=str(tmp_path))
+        ota._simulation = False
+        ota._available_version = "1.0.1"
+        ota._update_info = {"size": len(payload),
+                            "checksum": hashlib.sha256(payload).hexdigest()}
+        ota._http_open = lambda url, params=None: resp
+
+        ota._download_update()
+        assert resp.closed
+        assert ota.progress == 1.0
+        assert (tmp_path / "update.bin").read_bytes() == payload
+        assert ota._verify_update() is True
+
+        ota._update_info["checksum"] = "0" * 64
+        assert ota._verify_update() is False
+        assert ota.error == "Checksum mismatch"
+        assert not (tmp_path / "update.bin").exists()
+
+    def test_check_update_revalidates_with_etag(self, tmp_path):
+        ota = OTAManager(current_version="1.0.0", backup_path=str(tmp_path))
+        ota._simulation = False
+        sent = []
+        body = {"update_available": True, "version": "1.1.0"}
+
+        def fake_get(url, params=None, headers=None, meta=None):
+            sent.append(dict(headers or {}))
+            if headers and headers.get("If-None-Match") == '"v1"':
+                meta.update(status=304, etag='"v1"')
+                return None
+            meta.update(status=200, etag='"v1"')
+            return dict(body)
+
+        ota._http_get = fake_get
+        assert ota.check_update() is True
+        assert sent[0] == {}
+
+        # A fresh manager picks the ETag up from disk and gets a 304
+        ota2 = OTAManager(current_version="1.0.0", backup_path=str(tmp_path))
+        ota2._simulation = False
+        ota2._http_get = fake_get
+        assert ota2.check_update() is True
+        assert ota2.available_version == "1.1.0"
+        assert sent[1] == {"If-None-Match": '"v1"'}
+
+    def test_backup_round_trip(self, tmp_path):
+        ota = OTAManager(current_version="1.2.3", backup_path=str(tmp_path))
+        ota._simulation = False
+        ota._backup()
+        assert (tmp_path / "version.bin").read_bytes() == b"\x051.2.3"
+
+        ota._current_version = "2.0.0"
+        ota._restore_backup()
+        assert ota.current_version == "1.2.3"
+
+    def test_auto_update_sleeps_until_due(self, tmp_path):
+        class FakePower:
+            def __init__(self):
+                self.sleeps = []
+
+            def deep_sleep(self, duration_ms=0):
+                self.sleeps.append(duration_ms)
+
+        ota = OTAManager(current_version="1.0.0", backup_path=str(tmp_path))
+        ota._simulation = False
+        checks = []
+        ota.check_update = lambda: checks.append(1) or False
+        pm = FakePower()
+
+        assert ota.auto_update(check_interval_hours=1, power_manager=pm) is False
+        assert checks == [1]
+        assert pm.sleeps == [3_600_000]
+
+        # After "waking", a fresh manager resumes the persisted schedule
+        ota2 = OTAManager(current_version="1.0.0", backup_path=str(tmp_path))
+        ota2._simulation = False
+        ota2.check_update = lambda: checks.append(2) or False
+        ota2.auto_update(check_interval_hours=1, power_manager=pm)
+        assert checks == [1]
+        assert 0 < pm.sleeps[1] <= 3_600_000
+
+    def test_auto_update_simulation(self):
+        ota = self._sim_ota()
+        assert ota.auto_update(check_interval_hours=24) is True
+        assert ota.current_version == "1.0.1"
+        # Not due again yet
+        assert ota.auto_update(check_interval_hours=24) is False
+
+    def test_request_uses_detected_backend(self):
+        seen = []
+
+        class FakeResponse:
+            status_code = 200
+            headers = {}
+
+            def json(self):
+                return {"ok": True}
+
+            def close(self):
+                pass
+
+        class FakeURequests:
+            @staticmethod
+            def get(url, headers=None):
+                seen.append(url)
+                return FakeResponse()
+
+        ota = OTAManager(current_version="1.0.0")
+        ota._http = FakeURequests
+        ota._http_micro = True
+        assert ota._http_get("http://u/check", params={"v": "1.0 rc"}) == {"ok": True}
+        assert seen == ["http://u/check?v=1.0+rc"]
+
     def test_bump_version(self):
         assert OTAManager._bump_version("1.0.0") == "1.0.1"
         assert OTAManager._bump_version("0.9.9") == "0.9.10"
@@ -24,6 +24,94 @@ class TestPowerManager:
         percent = pm.battery_percent
         assert 0 <= percent <= 100
 
+    def test_battery_reading_cached_integer_math(self, monkeypatch):
+        import sys
+        import types
+
+        reads = []
+
+        class FakeADC:
+            ATTN_11DB = 3
+            WIDTH_12BIT = 3
+
+            def __init__(self, pin):
+                pass
+
+            def atten(self, value):
+                pass
+
+            def width(self, value):
+                pass
+
+            def read_u16(self):
+                reads.append(1)
+                return 39721  # ~4.0 V through the 2:1 divider
+
+        machine = types.ModuleType("machine")
+        machine.ADC = FakeADC
+        machine.Pin = lambda n: n
+        monkeypatch.setitem(sys.modules, "machine", machine)
+
+        pm = PowerManager(battery_pin=34)
+        pm._simulation = False
+        assert pm.battery_voltage == 4.0
+        assert pm.battery_percent == 83
+        # Percent reused the cached reading instead of sampling again
+        assert len(reads) == 16
+
+        pm._battery_mv_ts -= 1000
+        pm.battery_voltage
+        assert len(reads) == 32
+
+    def test_deep_sleep_uses_cached_port_modules(self, monkeypatch):
+        import sys
+        import types
+
+        calls = []
+        machine = types.ModuleType("machine")
+        machine.Pin = lambda n: ("pin", n)
+        machine.deepsleep = lambda *args: calls.append(("sleep",) + args)
+        esp32 = types.ModuleType("esp32")
+        esp32.WAKEUP_ANY_HIGH, esp32.WAKEUP_ALL_LOW = "high", "low"
+        esp32.wake_on_ext0 = lambda pin, level: calls.append(("ext0", pin, level))
+        esp32.wake_on_ext1 = lambda pins, level: calls.append(("ext1", pins, level))
+        monkeypatch.setitem(sys.modules, "machine", machine)
+        monkeypatch.setitem(sys.modules, "esp32", esp32)
+
+        pm = PowerManager()
+        monkeypatch.delitem(sys.modules, "esp32")
+        pm.set_wake_pin(4, level=0)
+        pm.deep_sleep(1000)
+        assert calls == [("ext0", ("pin", 4), "low"), ("sleep", 1000)]
+
+        # Several pins share one ext1 call instead of overwriting ext0
+        calls.clear()
+        pm.set_wake_pin(5, level=1)
+        pm.set_wake_pin(6, level=1)
+        pm.deep_sleep(1000)
+        assert calls == [
+            ("ext1", (("pin", 5), ("pin", 6)), "high"),
+            ("ext0", ("pin", 4), "low"),
+            ("sleep", 1000),
+        ]
+
+    def test_wake_reason_and_reset_cause_codes(self, monkeypatch):
+        import sys
+        import types
+
+        machine = types.ModuleType("machine")
+        monkeypatch.setitem(sys.modules, "machine", machine)
+        pm = PowerManager()
+        expected = {0: WakeReason.POWER_ON, 1: WakeReason.UNKNOWN, 2: WakeReason.GPIO,
+                    4: WakeReason.TIMER, 6: WakeReason.ULP, 9: WakeReason.UNKNOWN}
+        for code, reason in expected.items():
+            machine.wake_reason = lambda code=code: code
+            assert pm.get_wake_reason() is reason
+        machine.reset_cause = lambda: 2
+        assert pm.reset_cause == "wdt_reset"
+        machine.reset_cause = lambda: 7
+        assert pm.reset_cause == "unknown"
+
     def test_cpu_frequency(self):
         pm = PowerManager()
         freq = pm.get_cpu_frequency()
@@ -84,3 +172,12 @@ class TestPowerManager:
     def test_repr(self):
         pm = PowerManager()
         assert "PowerManager" in repr(pm)
+
+    def test_repr_does_not_read_battery(self):
+        pm = PowerManager()
+        reads = []
+        pm._battery_mv = lambda: reads.append(1) or 3800
+        assert repr(pm) == "<PowerManager [SIM] battery=?>"
+        percent = pm.battery_percent
+        assert repr(pm) == f"<PowerManager [SIM] battery={percent}%>"
+        assert len(reads) == 1
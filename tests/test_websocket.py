@@ -1,6 +1,11 @@
 """Tests for WebSocket Client."""
 
+import socket
+import threading
+import time
+
 import pytest
+from bitbound.network._callbacks import CallbackWorker
 from bitbound.network.websocket import WebSocketClient
 
 
@@ -83,3 +88,132 @@ class TestWebSocketClient:
         ws = WebSocketClient("ws://test.local/ws")
         assert "WebSocketClient" in repr(ws)
         assert "test.local" in repr(ws)
+
+    def test_receive_loop_wakes_on_data(self):
+        class FakeWS:
+            def __init__(self, sock):
+                self._sock = sock
+
+            def fileno(self):
+                return self._sock.fileno()
+
+            def read(self):
+                return self._sock.recv(1024)
+
+            def close(self):
+                self._sock.close()
+
+        ours, theirs = socket.socketpair()
+        got = threading.Event()
+        received = []
+
+        ws = WebSocketClient("ws://localhost/ws")
+        ws._ws = FakeWS(ours)
+        ws._connected = True
+        ws._simulation = False
+        ws.on_message(lambda msg: (received.append(msg), got.set()))
+        ws._start_receiver()
+
+        theirs.sendall(b"hello")
+        assert got.wait(1)
+        assert received == ["hello"]
+
+        theirs.close()  # peer hangs up; the loop should exit on its own
+        ws._thread.join(2)
+        assert not ws._thread.is_alive()
+        assert not ws.is_connected
+        ours.close()
+
+    def test_receive_loop_stops_on_peer_fin(self):
+        class FakeWS:
+            def __init__(self, sock):
+                self._sock = sock
+
+            def fileno(self):
+                return self._sock.fileno()
+
+            def read(self):
+                return self._sock.recv(1024)
+
+        ours, theirs = socket.socketpair()
+        disconnected = threading.Event()
+
+        ws = WebSocketClient("ws://localhost/ws")
+        ws._ws = FakeWS(ours)
+        ws._connected = True
+        ws._simulation = False
+        ws.on_disconnect(disconnected.set)
+        ws._start_receiver()
+
+        # Half-close: the socket polls readable (no POLLHUP) and reads b""
+        theirs.shutdown(socket.SHUT_WR)
+        assert disconnected.wait(1)
+        ws._thread.join(2)
+        assert not ws._thread.is_alive()
+        assert not ws.is_connected
+        ours.close()
+        theirs.close()
+
+    def test_receive_loop_waits_out_partial_frames(self):
+        class FakeWS:
+            def __init__(self, sock):
+                self._sock = sock
+                self._frame = b""
+
+            def fileno(self):
+                return self._sock.fileno()
+
+            def read(self):
+                # Like MicroPython's non-blocking read: None until the
+                # whole frame is in
+                self._frame += self._sock.recv(1024)
+                if len(self._frame) < 5:
+                    return None
+                frame, self._frame = self._frame, b""
+                return frame
+
+        ours, theirs = socket.socketpair()
+        got = threading.Event()
+        received = []
+
+        ws = WebSocketClient("ws://localhost/ws")
+        ws._ws = FakeWS(ours)
+        ws._connected = True
+        ws._simulation = False
+        ws.on_message(lambda msg: (received.append(msg), got.set()))
+        ws._start_receiver()
+
+        theirs.sendall(b"he")
+        time.sleep(0.05)
+        assert ws.is_connected
+        theirs.sendall(b"llo")
+        assert got.wait(1)
+        assert received == ["hello"]
+        assert ws.is_connected
+
+        ws._running = False
+        ws._thread.join(2)
+        ours.close()
+        theirs.close()
+
+    def test_callbacks_run_off_receive_thread_in_order(self):
+        worker = CallbackWorker("test-cb")
+        release = threading.Event()
+        done = threading.Event()
+        seen = []
+
+        def slow(value):
+            release.wait(1)
+            seen.append((value, threading.current_thread().name))
+            if value == 2:
+                done.set()
+
+        worker.submit(slow, 1)
+        worker.submit(slow, 2)
+        # submit() returned without waiting on the blocked callback
+        assert seen == []
+        release.set()
+        assert done.wait(2)
+        assert [v for v, _ in seen] == [1, 2]
+        assert seen[0][1].startswith("test-cb")
+        worker.shutdown()
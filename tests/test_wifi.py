@@ -1,5 +1,9 @@
 """Tests for WiFi Manager."""
 
+import sys
+import threading
+import time
+
 import pytest
 from bitbound.network.wifi import WiFiManager, WiFiConfig, WiFiStatus, WiFiMode, WiFiNetwork
 
@@ -46,6 +50,132 @@ class TestWiFiManager:
         assert isinstance(networks[0], WiFiNetwork)
         assert networks[0].ssid != ""
 
+    def test_scan_cache_stale_while_revalidate(self):
+        wifi = WiFiManager()
+        calls = []
+        real_scan = wifi._scan_networks
+
+        def counting_scan():
+            calls.append(1)
+            return real_scan()
+
+        wifi._scan_networks = counting_scan
+        first = wifi.scan()
+        assert wifi.scan() == first
+        assert len(calls) == 1
+
+        # Stale: cached copy returned, refresh runs in the background
+        wifi._scan_time -= 60
+        assert wifi.scan() == first
+        deadline = time.time() + 2
+        while wifi._scan_in_progress and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(calls) == 2
+
+        wifi.scan(force=True)
+        assert len(calls) == 3
+
+        # Expired: scanned synchronously
+        wifi._scan_time -= 600
+        wifi.scan()
+        assert len(calls) == 4
+
+    def test_scan_async(self):
+        wifi = WiFiManager()
+        started = threading.Event()
+        release = threading.Event()
+        real_scan = wifi._scan_networks
+
+        def slow_scan():
+            started.set()
+            release.wait(2)
+            return real_scan()
+
+        wifi._scan_networks = slow_scan
+        assert wifi.get_scan_results() is None
+        wifi.scan_async()
+        assert started.wait(1)
+        assert wifi.get_scan_results() is None
+        with pytest.raises(RuntimeError):
+            wifi.scan_async()
+        release.set()
+        networks = wifi.get_scan_results(timeout=2)
+        assert networks and networks[0].ssid == "SimNetwork_1"
+
+    def test_scan_filters(self):
+        wifi = WiFiManager()
+        assert [n.ssid for n in wifi.scan(ssid="OpenNetwork")] == ["OpenNetwork"]
+        assert [n.ssid for n in wifi.scan(channel=6)] == ["SimNetwork_2"]
+        assert [n.ssid for n in wifi.scan(bssid="aa:bb:cc:dd:ee:01")] == ["SimNetwork_1"]
+
+    def test_reconnect_targets_last_access_point(self):
+        wifi = WiFiManager(WiFiConfig(ssid="SimNetwork_2"))
+        wifi.scan()
+        wifi.connect()
+        assert wifi._last_ap.bssid == "AA:BB:CC:DD:EE:02"
+
+        seen = {}
+        wifi.disconnect()
+        wifi.connect = lambda *a, **kw: seen.update(args=a, kwargs=kw) or True
+        assert wifi.ensure_connected()
+        assert seen["args"] == ("SimNetwork_2",)
+        assert seen["kwargs"] == {"bssid": "AA:BB:CC:DD:EE:02"}
+
+    def test_scan_if_due_cadence(self):
+        wifi = WiFiManager()
+        calls = []
+        real_scan = wifi._scan_networks
+        wifi._scan_networks = lambda: calls.append(1) or real_scan()
+
+        wifi.scan_if_due()
+        wifi._scan_time -= 10
+        wifi.scan_if_due()  # disconnected: 5 s cadence
+        assert len(calls) == 2
+
+        wifi.connect("SimNetwork_1")
+        wifi._scan_time -= 10
+        wifi.scan_if_due()  # connected: 60 s cadence
+        assert len(calls) == 2
+
+    def test_wait_connected_polls_with_backoff(self, monkeypatch):
+        class FakeWLAN:
+            polls = 0
+
+            def isconnected(self):
+                self.polls += 1
+                return self.polls > 3
+
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        wifi = WiFiManager()
+        wifi._wlan = FakeWLAN()
+        assert wifi._wait_connected(5)
+        assert sleeps == [0.05, 0.1, 0.2]
+
+    def test_scan_arrays(self):
+        wifi = WiFiManager()
+        cols = wifi.scan_arrays()
+        assert cols["ssid"] == ["SimNetwork_1", "SimNetwork_2", "OpenNetwork"]
+        assert list(cols["channel"]) == [1, 6, 11]
+        best = max(range(len(cols["rssi"])), key=cols["rssi"].__getitem__)
+        assert cols["ssid"][best] == "SimNetwork_1"
+        assert cols["bssid"][6:12] == bytes.fromhex("AABBCCDDEE02")
+
+    def test_hardware_scan_formats_bssid(self):
+        class FakeWLAN:
+            def active(self, on):
+                pass
+
+            def scan(self):
+                return [(b"Lab", b"\x0a\xbb\xcc\xdd\xee\x01", 3, -50, 3, False)]
+
+        wifi = WiFiManager()
+        wifi._simulation = False
+        wifi._wlan = FakeWLAN()
+        net = wifi.scan(force=True)[0]
+        assert net.ssid == "Lab"
+        assert net.bssid == "0A:BB:CC:DD:EE:01"
+
     def test_ifconfig(self):
         wifi = WiFiManager()
         wifi.connect("TestNetwork", "password")
@@ -78,6 +208,23 @@ class TestWiFiManager:
         wifi.connect("TestNetwork", "password")
         assert wifi.ensure_connected() is True
 
+    def test_ensure_connected_backs_off(self, monkeypatch):
+        import bitbound.network.wifi as wifi_module
+        monkeypatch.setattr(wifi_module.random, "uniform", lambda a, b: b)
+        wifi = WiFiManager(WiFiConfig(ssid="Net", reconnect_interval=5))
+        attempts = []
+        wifi.connect = lambda *a, **kw: attempts.append(wifi._next_retry) or False
+
+        assert wifi.ensure_connected() is False
+        assert len(attempts) == 1
+        # The next retry waits out the jittered window instead of blocking
+        assert wifi.ensure_connected() is False
+        assert len(attempts) == 1
+
+        wifi._next_retry = 0.0
+        wifi.ensure_connected()
+        assert attempts[1] - attempts[0] >= 5
+
 
 class TestWiFiConfig:
     def test_default_config(self):
@@ -90,3 +237,25 @@ class TestWiFiConfig:
         config = WiFiConfig(ssid="MyNet", password="pass", timeout=30)
         wifi = WiFiManager(config=config)
         assert wifi.connect() is True
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+")
+    def test_slotted(self):
+        assert not hasattr(WiFiConfig(), "__dict__")
+        assert not hasattr(WiFiNetwork(ssid="Net"), "__dict__")
+
+
+class TestNetworkPackage:
+    def test_clients_imported_on_demand(self):
+        import subprocess
+        code = (
+            "import sys; from bitbound.network import WiFiManager; "
+            "sys.exit('bitbound.network.mqtt' in sys.modules "
+            "or 'bitbound.network.http' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code])
+        assert result.returncode == 0
+
+    def test_unknown_name(self):
+        import bitbound.network
+        with pytest.raises(AttributeError):
+            bitbound.network.NoSuchClient